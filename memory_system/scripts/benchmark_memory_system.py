@@ -0,0 +1,374 @@
+"""Benchmark suite for the Memory & Learning system.
+
+Generates synthetic analysis histories (10k, 100k and 1M memories by
+default) and measures, for each registered MemoryStore backend:
+1. record_analysis
+2. get_similar_analyses (per retrieval strategy)
+3. suggest_score_adjustment
+4. recognize_patterns
+5. cleanup_expired_memories
+
+Each operation reports throughput and p50/p95/p99 latency. Results are
+written as JSON; pass --baseline to compare against an earlier run.
+
+Embeddings are synthetic (deterministic random unit vectors per text) so
+vector search is exercised without downloading a model; use
+--real-embeddings to benchmark with the sentence transformer.
+
+Usage:
+    python memory_system/scripts/benchmark_memory_system.py --sizes 10000
+    python memory_system/scripts/benchmark_memory_system.py --baseline previous.json
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import argparse
+import hashlib
+import json
+import platform
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Callable, Iterator
+
+import numpy as np
+
+import src  # noqa: F401  (registers memory stores)
+from memory_system.src.memory.base.memory_entry import (
+    EpisodicMemoryEntry, FeedbackMemoryEntry, MemoryMetadata
+)
+from memory_system.src.memory.base.memory_store import MemoryStoreRegistry
+from memory_system.src.memory.base.memory_types import (
+    FeedbackType, MemoryCategory, RetrievalStrategy
+)
+from memory_system.src.memory.integration.memory_manager import MemoryManager
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_ITERATIONS = 200
+EMBEDDING_DIMENSION = 384  # Matches all-MiniLM-L6-v2
+
+# Shape of the synthetic history
+AGENTS = [
+    'ambition', 'country_stability', 'power_market_size', 'resource_availability',
+    'energy_dependence', 'renewables_penetration', 'expected_return',
+    'revenue_stream_stability', 'offtaker_status', 'long_term_interest_rates',
+    'status_of_grid', 'ownership_hurdles', 'ownership_consolidation',
+    'competitive_landscape', 'system_modifiers', 'track_record',
+    'support_scheme', 'contract_terms'
+]
+COUNTRIES = [
+    'Germany', 'United States', 'China', 'India', 'Brazil', 'Spain', 'France',
+    'United Kingdom', 'Japan', 'Australia', 'Mexico', 'Chile', 'South Africa',
+    'Vietnam', 'Turkey', 'Italy', 'Netherlands', 'Poland', 'Canada', 'Egypt'
+]
+HISTORY_DAYS = 3 * 365
+EXPIRED_FRACTION = 0.05
+FEEDBACK_FRACTION = 0.01
+SEED_CHUNK_SIZE = 5000
+
+
+class SyntheticEncoder:
+    """Deterministic stand-in for a sentence transformer."""
+
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION):
+        self.dimension = dimension
+
+    def encode(self, text: str) -> np.ndarray:
+        seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little')
+        vector = np.random.default_rng(seed).standard_normal(self.dimension).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+
+def percentile_summary(samples_ms: List[float], total_s: float, operations: int) -> Dict[str, Any]:
+    """Summarize latency samples."""
+    samples = np.asarray(samples_ms, dtype=float)
+    return {
+        'count': int(len(samples)),
+        'operations': operations,
+        'total_s': total_s,
+        'throughput_ops_s': operations / total_s if total_s > 0 else None,
+        'first_ms': float(samples[0]) if len(samples) else None,
+        'mean_ms': float(samples.mean()) if len(samples) else None,
+        'p50_ms': float(np.percentile(samples, 50)) if len(samples) else None,
+        'p95_ms': float(np.percentile(samples, 95)) if len(samples) else None,
+        'p99_ms': float(np.percentile(samples, 99)) if len(samples) else None,
+        'max_ms': float(samples.max()) if len(samples) else None
+    }
+
+
+def measure(operation: Callable[[int], Any], iterations: int) -> Dict[str, Any]:
+    """Time an operation repeatedly."""
+    samples = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        operation(i)
+        samples.append((time.perf_counter() - t0) * 1000)
+    total = time.perf_counter() - start
+    return percentile_summary(samples, total, iterations)
+
+
+def synthetic_analysis(rng: random.Random) -> Dict[str, Any]:
+    """Generate arguments for one synthetic record_analysis call."""
+    agent = rng.choice(AGENTS)
+    country = rng.choice(COUNTRIES)
+    capacity = rng.uniform(0, 200)
+    score = round(min(10.0, max(1.0, capacity / 20 + rng.gauss(0, 1))), 1)
+    justification = (
+        f"{country} {agent.replace('_', ' ')} scored {score} based on "
+        f"{capacity:.0f} GW installed capacity and {rng.choice(['strong', 'moderate', 'weak'])} policy support."
+    )
+    return {
+        'agent_name': agent,
+        'country': country,
+        'period': f"Q{rng.randint(1, 4)} {rng.randint(2022, 2025)}",
+        'input_data': {
+            'installed_capacity_gw': capacity,
+            'policy_regime': rng.choice(['auction', 'feed_in', 'merchant']),
+            'data_year': rng.randint(2020, 2025)
+        },
+        'output_data': {
+            'score': score,
+            'justification': justification,
+            'confidence': rng.choice(['high', 'medium', 'low'])
+        },
+        'execution_time_ms': rng.uniform(5, 500)
+    }
+
+
+def generate_history(size: int, seed: int, encoder: Optional[SyntheticEncoder]) -> Iterator[Any]:
+    """Yield synthetic episodic memories plus a small share of feedback."""
+    rng = random.Random(seed)
+    now = datetime.now()
+
+    for _ in range(size):
+        analysis = synthetic_analysis(rng)
+        memory = EpisodicMemoryEntry(
+            **analysis,
+            category=MemoryCategory.PARAMETER_ANALYSIS,
+            metadata=MemoryMetadata(source=f"agent:{analysis['agent_name']}")
+        )
+        memory.timestamp = now - timedelta(days=rng.uniform(0, HISTORY_DAYS))
+        memory.metadata.access_count = int(rng.expovariate(0.5))
+        if rng.random() < EXPIRED_FRACTION:
+            memory.expires_at = now - timedelta(days=1)
+        if encoder:
+            memory.embedding = encoder.encode(
+                f"Agent: {analysis['agent_name']} | Country: {analysis['country']} | "
+                f"Reasoning: {analysis['output_data']['justification']}"
+            ).tolist()
+        yield memory
+
+        if rng.random() < FEEDBACK_FRACTION:
+            original = analysis['output_data']['score']
+            expert_id = f"expert_{rng.randint(1, 5)}"
+            feedback = FeedbackMemoryEntry(
+                feedback_type=FeedbackType.SCORE_ADJUSTMENT,
+                original_analysis_id=memory.id,
+                expert_id=expert_id,
+                original_value=original,
+                corrected_value=round(min(10.0, max(1.0, original + rng.gauss(0.5, 0.5))), 1),
+                reasoning="Synthetic expert adjustment",
+                metadata=MemoryMetadata(source=f"expert:{expert_id}")
+            )
+            feedback.content.update({
+                'country': analysis['country'],
+                'agent_name': analysis['agent_name'],
+                'parameter': analysis['agent_name']
+            })
+            if encoder:
+                feedback.embedding = encoder.encode(feedback.content['reasoning']).tolist()
+            yield feedback
+
+
+def seed_store(manager: MemoryManager, size: int, seed: int, encoder: Optional[SyntheticEncoder]) -> float:
+    """Bulk-load a synthetic history. Returns seconds taken."""
+    start = time.perf_counter()
+    chunk = []
+    for memory in generate_history(size, seed, encoder):
+        chunk.append(memory)
+        if len(chunk) >= SEED_CHUNK_SIZE:
+            manager.memory_store.store_batch(chunk)
+            chunk = []
+    if chunk:
+        manager.memory_store.store_batch(chunk)
+    return time.perf_counter() - start
+
+
+def benchmark_backend(
+    backend: str,
+    size: int,
+    iterations: int,
+    seed: int,
+    real_embeddings: bool
+) -> Dict[str, Any]:
+    """Run all measurements for one backend and history size."""
+    work_dir = tempfile.mkdtemp(prefix=f"memory_bench_{backend}_")
+    encoder = None if real_embeddings else SyntheticEncoder()
+
+    try:
+        manager = MemoryManager({
+            'enabled': True,
+            'store_type': backend,
+            'store_config': {
+                'persist_directory': work_dir,
+                'collection_name': f"bench_{size}"
+            },
+            'learning_config': {}
+        })
+        if not manager.is_enabled():
+            return {'error': f"Backend '{backend}' failed to initialize"}
+
+        if encoder:
+            # Bypass model loading; the engine only calls encode()
+            manager.similarity_engine._embedding_model = encoder
+            manager.similarity_engine._embedding_model_loaded = True
+
+        print(f"  Seeding {size:,} memories...")
+        seed_seconds = seed_store(manager, size, seed, encoder)
+        print(f"  Seeded in {seed_seconds:.1f}s")
+
+        rng = random.Random(seed + 1)
+        results: Dict[str, Any] = {'seed_s': seed_seconds}
+
+        def record(i):
+            analysis = synthetic_analysis(rng)
+            manager.record_analysis(
+                **analysis,
+                embedding_text=f"Agent: {analysis['agent_name']} | Country: {analysis['country']}"
+            )
+
+        print("  record_analysis")
+        results['record_analysis'] = measure(record, iterations)
+
+        for strategy in RetrievalStrategy:
+            print(f"  get_similar_analyses[{strategy.value}]")
+            results[f"get_similar_analyses.{strategy.value}"] = measure(
+                lambda i, strategy=strategy: manager.get_similar_analyses(
+                    country=rng.choice(COUNTRIES),
+                    agent=rng.choice(AGENTS),
+                    context={'policy_regime': 'auction'},
+                    strategy=strategy
+                ),
+                iterations
+            )
+
+        print("  suggest_score_adjustment")
+        results['suggest_score_adjustment'] = measure(
+            lambda i: manager.suggest_score_adjustment(
+                country=rng.choice(COUNTRIES),
+                parameter=rng.choice(AGENTS),
+                current_score=round(rng.uniform(1, 10), 1)
+            ),
+            iterations
+        )
+
+        print("  recognize_patterns")
+        results['recognize_patterns'] = measure(
+            lambda i: manager.recognize_patterns(
+                pattern_type='scoring',
+                country=rng.choice(COUNTRIES),
+                agent=rng.choice(AGENTS)
+            ),
+            iterations
+        )
+
+        print("  cleanup_expired_memories")
+        total = manager.memory_store.count()
+        start = time.perf_counter()
+        deleted = manager.cleanup_expired_memories()
+        elapsed = time.perf_counter() - start
+        cleanup = percentile_summary([elapsed * 1000], elapsed, total)
+        cleanup['deleted'] = deleted
+        cleanup['scanned'] = total
+        results['cleanup_expired_memories'] = cleanup
+
+        manager.stop_background_cleanup()
+        return results
+
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline_path: str) -> None:
+    """Print p50/p95 changes relative to a previous run."""
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)['results']
+
+    print(f"\n{'=' * 70}")
+    print(f"  Comparison with {baseline_path}")
+    print(f"{'=' * 70}")
+
+    for backend, sizes in results.items():
+        for size, operations in sizes.items():
+            base_ops = baseline.get(backend, {}).get(size, {})
+            for name, current in operations.items():
+                previous = base_ops.get(name)
+                if not isinstance(current, dict) or not isinstance(previous, dict):
+                    continue
+                changes = []
+                for metric in ('p50_ms', 'p95_ms'):
+                    if current.get(metric) and previous.get(metric):
+                        change = (current[metric] - previous[metric]) / previous[metric] * 100
+                        changes.append(f"{metric} {change:+.1f}%")
+                if changes:
+                    print(f"  {backend:10} {size:>9} {name:45} {', '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the memory system')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='History sizes to generate')
+    parser.add_argument('--backends', nargs='+', default=None,
+                        help='MemoryStore backends (default: all registered)')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help='Calls per measured operation')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    parser.add_argument('--real-embeddings', action='store_true',
+                        help='Use the sentence transformer instead of synthetic embeddings')
+    parser.add_argument('--output', type=str, default='memory_benchmark_results.json',
+                        help='Path for JSON results')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Previous results JSON to compare against')
+    args = parser.parse_args()
+
+    backends = args.backends or MemoryStoreRegistry.list_stores()
+
+    results: Dict[str, Any] = {}
+    for backend in backends:
+        results[backend] = {}
+        for size in args.sizes:
+            print(f"\n[{backend}] {size:,} memories")
+            results[backend][str(size)] = benchmark_backend(
+                backend, size, args.iterations, args.seed, args.real_embeddings
+            )
+
+    report = {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': args.sizes,
+            'iterations': args.iterations,
+            'seed': args.seed,
+            'embeddings': 'real' if args.real_embeddings else 'synthetic'
+        },
+        'results': results
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+
+    if args.baseline:
+        compare_to_baseline(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -234,6 +234,7 @@ class MemoryQuery:
     categories: Optional[List[MemoryCategory]] = None
     countries: Optional[List[str]] = None
     agents: Optional[List[str]] = None
+    sources: Optional[List[str]] = None  # metadata.source of the entry
     time_range: Optional[tuple[datetime, datetime]] = None
     
     # Retrieval settings
@@ -263,6 +264,9 @@ class MemoryQuery:
         if self.agents:
             filters['content.agent_name'] = {'$in': self.agents}
         
+        if self.sources:
+            filters['source'] = {'$in': self.sources}
+        
         if self.time_range:
             start, end = self.time_range
             filters['timestamp'] = {
@@ -1,6 +1,6 @@
 """Abstract base class for memory storage backends."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime
 
 from .memory_entry import (
@@ -156,6 +156,17 @@ class MemoryStore(ABC):
         """
         pass
     
+    def vacuum(self) -> int:
+        """Reclaim space left behind by deleted memories.
+        
+        Called after expiry and compaction. Stores that free space on
+        delete need not override this.
+        
+        Returns:
+            Number of dead records reclaimed
+        """
+        return 0
+    
     def ensure_initialized(self):
         """Ensure store is initialized before use."""
         if not self._initialized:
@@ -192,6 +203,27 @@ class MemoryStore(ABC):
         self.ensure_initialized()
         return [self.retrieve(mid) for mid in memory_ids]
     
+    def scan(self, query: MemoryQuery) -> Iterator[List[BaseMemoryEntry]]:
+        """Iterate over every memory matching a query's filters, page by page.
+        
+        Unlike search(), results are not ranked or capped at top_k, and
+        query_text / query_embedding are ignored. Pages are in no particular
+        order; deleting memories from a page already yielded is safe.
+        
+        Default implementation yields the search() results as one page.
+        Subclasses whose search() caps results should override it.
+        
+        Args:
+            query: Query whose filters select the memories
+            
+        Yields:
+            Lists of matching memory entries
+        """
+        self.ensure_initialized()
+        entries = self.search(query)
+        if entries:
+            yield entries
+    
     def get_memory_by_type(self, memory_type: MemoryType) -> List[BaseMemoryEntry]:
         """Get all memories of a specific type.
         
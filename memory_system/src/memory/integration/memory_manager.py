@@ -1,4 +1,5 @@
 """Memory manager for high-level memory orchestration."""
+import threading
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
@@ -18,6 +19,7 @@ from ..base.memory_types import (
 from ..learning.similarity_engine import SimilarityEngine
 from ..learning.feedback_processor import FeedbackProcessor
 from ..learning.pattern_recognizer import PatternRecognizer
+from ..learning.memory_compactor import MemoryCompactor
 
 logger = get_logger(__name__)
 
@@ -42,16 +44,22 @@ class MemoryManager:
                 - store_config: Configuration for the store
                 - learning_config: Configuration for learning
                 - enabled: Whether memory is enabled (default: True)
+                - cleanup_interval_seconds: Run expired-memory cleanup on a
+                  background thread at this interval (default: None, off)
         """
         self.config = config or {}
         self.enabled = self.config.get('enabled', True)
         
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._cleanup_stop = threading.Event()
+        
         if not self.enabled:
             logger.info("Memory system disabled by configuration")
             self.memory_store = None
             self.similarity_engine = None
             self.feedback_processor = None
             self.pattern_recognizer = None
+            self.memory_compactor = None
             return
         
         # Initialize memory store
@@ -84,6 +92,16 @@ class MemoryManager:
             memory_store=self.memory_store,
             config=learning_config
         )
+        
+        self.memory_compactor = MemoryCompactor(
+            memory_store=self.memory_store,
+            config=learning_config,
+            embed_text=self.similarity_engine.embed_text
+        )
+        
+        cleanup_interval = self.config.get('cleanup_interval_seconds')
+        if cleanup_interval:
+            self.start_background_cleanup(cleanup_interval)
     
     def is_enabled(self) -> bool:
         """Check if memory system is enabled."""
@@ -145,6 +163,9 @@ class MemoryManager:
             memory_id = self.memory_store.store(memory)
             logger.debug(f"Recorded analysis memory for {country} by {agent_name}")
             
+            if self.pattern_recognizer:
+                self.pattern_recognizer.add_memory(memory)
+            
             return memory_id
             
         except Exception as e:
@@ -476,11 +497,94 @@ class MemoryManager:
             return 0
         
         try:
-            return self.memory_store.delete_expired()
+            deleted = self.memory_store.delete_expired()
+            if deleted:
+                self.memory_store.vacuum()
+            if deleted and self.feedback_processor:
+                # Expired feedback must drop out of the incremental aggregates
+                self.feedback_processor.rebuild_index()
+            if deleted and self.pattern_recognizer:
+                self.pattern_recognizer.invalidate_snapshot()
+            return deleted
         except Exception as e:
             logger.error(f"Failed to cleanup memories: {e}")
             return 0
     
+    def compact_memories(self, horizon_days: Optional[int] = None) -> Dict[str, int]:
+        """Roll up old episodic memories into per-period summaries.
+        
+        Analyses that expert feedback refers to are kept as they are.
+        
+        Args:
+            horizon_days: Optional override for the compaction horizon
+            
+        Returns:
+            Dictionary with counts of compacted, kept and summary memories
+        """
+        if not self.enabled or not self.memory_compactor:
+            return {'compacted': 0, 'kept': 0, 'summaries': 0}
+        
+        def has_feedback(memory: EpisodicMemoryEntry) -> bool:
+            return bool(
+                self.feedback_processor
+                and self.feedback_processor.get_feedback_for_analysis(memory.id)
+            )
+        
+        try:
+            result = self.memory_compactor.compact(
+                horizon_days=horizon_days,
+                keep=has_feedback
+            )
+            if result['compacted']:
+                self.memory_store.vacuum()
+            if result['compacted'] and self.pattern_recognizer:
+                self.pattern_recognizer.invalidate_snapshot()
+            return result
+        except Exception as e:
+            logger.error(f"Failed to compact memories: {e}")
+            return {'compacted': 0, 'kept': 0, 'summaries': 0}
+    
+    def start_background_cleanup(self, interval_seconds: float) -> bool:
+        """Run cleanup_expired_memories periodically on a daemon thread.
+        
+        Args:
+            interval_seconds: Seconds between cleanup runs
+            
+        Returns:
+            True if the thread was started, False if disabled or already running
+        """
+        if not self.enabled or not self.memory_store:
+            return False
+        
+        if self._cleanup_thread and self._cleanup_thread.is_alive():
+            return False
+        
+        self._cleanup_stop.clear()
+        
+        def run():
+            while not self._cleanup_stop.wait(interval_seconds):
+                self.cleanup_expired_memories()
+        
+        self._cleanup_thread = threading.Thread(
+            target=run,
+            name="memory-cleanup",
+            daemon=True
+        )
+        self._cleanup_thread.start()
+        logger.info(f"Background memory cleanup every {interval_seconds}s")
+        return True
+    
+    def stop_background_cleanup(self, timeout: Optional[float] = None) -> None:
+        """Stop the background cleanup thread if running.
+        
+        Args:
+            timeout: Optional seconds to wait for the thread to finish
+        """
+        self._cleanup_stop.set()
+        if self._cleanup_thread:
+            self._cleanup_thread.join(timeout)
+            self._cleanup_thread = None
+    
     def clear_all_memories(self) -> bool:
         """Clear all memories (WARNING: destructive!).
         
@@ -493,7 +597,12 @@ class MemoryManager:
         logger.warning("Clearing all memories - this is destructive!")
         
         try:
-            return self.memory_store.clear_all()
+            cleared = self.memory_store.clear_all()
+            if cleared and self.feedback_processor:
+                self.feedback_processor.rebuild_index()
+            if cleared and self.pattern_recognizer:
+                self.pattern_recognizer.invalidate_snapshot()
+            return cleared
         except Exception as e:
             logger.error(f"Failed to clear memories: {e}")
             return False
@@ -2,9 +2,11 @@
 from .similarity_engine import SimilarityEngine
 from .feedback_processor import FeedbackProcessor
 from .pattern_recognizer import PatternRecognizer
+from .memory_compactor import MemoryCompactor
 
 __all__ = [
     'SimilarityEngine',
     'FeedbackProcessor',
-    'PatternRecognizer'
+    'PatternRecognizer',
+    'MemoryCompactor'
 ]
@@ -1,6 +1,9 @@
 """Feedback processor for learning from expert corrections."""
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+import math
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict, Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from src.core.logger import get_logger
@@ -16,6 +19,105 @@ from ..base.memory_types import (
 logger = get_logger(__name__)
 
 
+@dataclass
+class FeedbackAggregate:
+    """Running statistics over a stream of numeric feedback values.
+    
+    Uses Welford's algorithm so mean and standard deviation can be updated
+    one value at a time without keeping the values around.
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    
+    def add(self, value: float) -> None:
+        """Add a value to the aggregate."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+    
+    @property
+    def std_deviation(self) -> float:
+        """Population standard deviation (0.0 for fewer than two values)."""
+        if self.count < 2:
+            return 0.0
+        return (self.m2 / self.count) ** 0.5
+
+
+@dataclass
+class FeedbackCounts:
+    """Feedback counters for one (country, agent, feedback type) bucket."""
+    total: int = 0
+    by_expert: Counter = field(default_factory=Counter)
+    by_impact_scope: Counter = field(default_factory=Counter)
+    magnitude_sum: float = 0.0
+    magnitude_count: int = 0
+
+
+@dataclass
+class FeedbackIndex:
+    """Feedback entries and aggregates, built from the store and kept current."""
+    by_analysis: Dict[str, List[FeedbackMemoryEntry]] = field(default_factory=lambda: defaultdict(list))
+    by_type: Dict[FeedbackType, List[FeedbackMemoryEntry]] = field(default_factory=lambda: defaultdict(list))
+    # (country, agent_name, feedback_type) -> counters
+    counts: Dict[Tuple[Optional[str], Optional[str], FeedbackType], FeedbackCounts] = field(default_factory=dict)
+    # (country, parameter) -> score adjustment statistics
+    score_adjustments: Dict[Tuple[Optional[str], Optional[str]], FeedbackAggregate] = field(default_factory=dict)
+    # parameter -> weight change statistics
+    weight_changes: Dict[str, FeedbackAggregate] = field(default_factory=dict)
+    
+    def add(self, fb: FeedbackMemoryEntry) -> None:
+        """Fold a single feedback entry into the aggregates."""
+        content = fb.content
+        
+        try:
+            fb_type = FeedbackType(content.get('feedback_type'))
+        except ValueError:
+            return
+        
+        self.by_analysis[content.get('original_analysis_id')].append(fb)
+        self.by_type[fb_type].append(fb)
+        
+        # Per (country, agent, type) counters
+        key = (content.get('country'), content.get('agent_name'), fb_type)
+        counts = self.counts.get(key)
+        if counts is None:
+            counts = self.counts[key] = FeedbackCounts()
+        counts.total += 1
+        counts.by_expert[content.get('expert_id')] += 1
+        counts.by_impact_scope[content.get('impact_scope', 'specific')] += 1
+        
+        if fb_type not in (FeedbackType.SCORE_ADJUSTMENT, FeedbackType.WEIGHT_MODIFICATION):
+            return
+        
+        try:
+            change = float(content.get('corrected_value', 0)) - float(content.get('original_value', 0))
+        except (TypeError, ValueError):
+            return
+        
+        if fb_type == FeedbackType.SCORE_ADJUSTMENT:
+            counts.magnitude_sum += abs(change)
+            counts.magnitude_count += 1
+            
+            adj_key = (content.get('country') or None, content.get('parameter') or None)
+            aggregate = self.score_adjustments.get(adj_key)
+            if aggregate is None:
+                aggregate = self.score_adjustments[adj_key] = FeedbackAggregate()
+            aggregate.add(change)
+        
+        elif content.get('parameter'):
+            aggregate = self.weight_changes.get(content['parameter'])
+            if aggregate is None:
+                aggregate = self.weight_changes[content['parameter']] = FeedbackAggregate()
+            aggregate.add(change)
+
+
+
 class FeedbackProcessor:
     """Process expert feedback to improve future analyses.
     
@@ -46,6 +148,19 @@ class FeedbackProcessor:
         self.min_feedback_count = config.get('min_feedback_count', 3)
         self.decay_factor = config.get('decay_factor', 0.95)  # For weighting recent feedback
         
+        # Incrementally maintained feedback index (built lazily from the store,
+        # then updated on every record_feedback call). Readers, record_feedback
+        # and the swap in rebuild_index hold _index_lock.
+        self._index: Optional[FeedbackIndex] = None
+        self._index_lock = threading.RLock()
+        # Feedback recorded while a rebuild scans the store, folded in at the swap
+        self._rebuilds_running = 0
+        self._recorded_during_rebuild: List[FeedbackMemoryEntry] = []
+        # Rebuilds are numbered when they start; a rebuild only swaps in if no
+        # later-started one already has, so an older scan never wins
+        self._rebuild_ticket = 0
+        self._index_ticket = 0
+        
     def record_feedback(
         self,
         feedback_type: FeedbackType,
@@ -87,7 +202,17 @@ class FeedbackProcessor:
         if metadata:
             feedback.content.update(metadata)
         
-        feedback_id = self.memory_store.store(feedback)
+        # Store and index under the lock, so a rebuild swapping in between
+        # cannot count this entry twice
+        with self._index_lock:
+            feedback_id = self.memory_store.store(feedback)
+            
+            # Keep aggregates current (if not built yet, the warm-up will pick this up)
+            if self._index is not None:
+                self._index.add(feedback)
+            if self._rebuilds_running:
+                self._recorded_during_rebuild.append(feedback)
+        
         logger.info(
             f"Recorded {feedback_type.value} feedback from {expert_id} "
             f"for analysis {original_analysis_id}"
@@ -95,6 +220,60 @@ class FeedbackProcessor:
         
         return feedback_id
     
+    def rebuild_index(self) -> int:
+        """Rebuild feedback aggregates from the memory store.
+        
+        Called lazily on first use; call again after feedback was deleted
+        or written by another process. The new index is built off to the
+        side and swapped in whole, so readers never see partial aggregates.
+        
+        Returns:
+            Number of feedback entries indexed
+        """
+        with self._index_lock:
+            self._rebuilds_running += 1
+            self._rebuild_ticket += 1
+            ticket = self._rebuild_ticket
+        
+        try:
+            query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
+            all_feedback = [
+                fb
+                for page in self.memory_store.scan(query)
+                for fb in page
+                if isinstance(fb, FeedbackMemoryEntry)
+            ]
+            
+            with self._index_lock:
+                # Feedback recorded during the scan that the scan missed
+                scanned = {fb.id for fb in all_feedback}
+                all_feedback.extend(
+                    fb for fb in self._recorded_during_rebuild if fb.id not in scanned
+                )
+                
+                # Scan order is arbitrary; index oldest first so lists stay chronological
+                all_feedback.sort(key=lambda fb: fb.timestamp)
+                if ticket > self._index_ticket:
+                    index = FeedbackIndex()
+                    for fb in all_feedback:
+                        index.add(fb)
+                    self._index = index
+                    self._index_ticket = ticket
+        finally:
+            with self._index_lock:
+                self._rebuilds_running -= 1
+                if not self._rebuilds_running:
+                    self._recorded_during_rebuild = []
+        
+        logger.debug(f"Indexed {len(all_feedback)} feedback entries")
+        return len(all_feedback)
+    
+    def _ensure_index(self) -> FeedbackIndex:
+        """Build the feedback index on first use and return it."""
+        if self._index is None:
+            self.rebuild_index()
+        return self._index
+    
     def get_feedback_for_analysis(
         self,
         analysis_id: str
@@ -107,17 +286,9 @@ class FeedbackProcessor:
         Returns:
             List of feedback entries
         """
-        # Search for feedback targeting this analysis
-        query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
-        all_feedback = self.memory_store.search(query)
-        
-        relevant_feedback = [
-            fb for fb in all_feedback
-            if isinstance(fb, FeedbackMemoryEntry) and
-            fb.content.get('original_analysis_id') == analysis_id
-        ]
-        
-        return relevant_feedback
+        index = self._ensure_index()
+        with self._index_lock:
+            return list(index.by_analysis.get(analysis_id, []))
     
     def get_feedback_statistics(
         self,
@@ -135,60 +306,40 @@ class FeedbackProcessor:
         Returns:
             Statistics dictionary
         """
-        query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
-        all_feedback = self.memory_store.search(query)
-        
-        # Filter
-        if country:
-            all_feedback = [
-                fb for fb in all_feedback
-                if fb.content.get('country') == country
-            ]
-        
-        if agent:
-            all_feedback = [
-                fb for fb in all_feedback
-                if fb.content.get('agent_name') == agent
-            ]
-        
-        if feedback_type:
-            all_feedback = [
-                fb for fb in all_feedback
-                if FeedbackType(fb.content.get('feedback_type')) == feedback_type
-            ]
+        index = self._ensure_index()
         
-        # Calculate statistics
         stats = {
-            'total_feedback': len(all_feedback),
+            'total_feedback': 0,
             'by_type': defaultdict(int),
             'by_expert': defaultdict(int),
             'by_impact_scope': defaultdict(int),
             'average_correction_magnitude': 0.0
         }
         
-        correction_magnitudes = []
-        
-        for fb in all_feedback:
-            if not isinstance(fb, FeedbackMemoryEntry):
-                continue
+        magnitude_sum = 0.0
+        magnitude_count = 0
+        
+        # Merge matching buckets (one per country/agent/type, never per entry)
+        with self._index_lock:
+            for (fb_country, fb_agent, fb_type), counts in index.counts.items():
+                if country and fb_country != country:
+                    continue
+                if agent and fb_agent != agent:
+                    continue
+                if feedback_type and fb_type != feedback_type:
+                    continue
             
-            fb_type = FeedbackType(fb.content.get('feedback_type'))
-            stats['by_type'][fb_type.value] += 1
-            stats['by_expert'][fb.content.get('expert_id')] += 1
-            stats['by_impact_scope'][fb.content.get('impact_scope', 'specific')] += 1
-            
-            # Calculate correction magnitude for score adjustments
-            if fb_type == FeedbackType.SCORE_ADJUSTMENT:
-                try:
-                    orig = float(fb.content.get('original_value', 0))
-                    corr = float(fb.content.get('corrected_value', 0))
-                    magnitude = abs(corr - orig)
-                    correction_magnitudes.append(magnitude)
-                except (TypeError, ValueError):
-                    pass
-        
-        if correction_magnitudes:
-            stats['average_correction_magnitude'] = sum(correction_magnitudes) / len(correction_magnitudes)
+                stats['total_feedback'] += counts.total
+                stats['by_type'][fb_type.value] += counts.total
+                for expert, n in counts.by_expert.items():
+                    stats['by_expert'][expert] += n
+                for scope, n in counts.by_impact_scope.items():
+                    stats['by_impact_scope'][scope] += n
+                magnitude_sum += counts.magnitude_sum
+                magnitude_count += counts.magnitude_count
+        
+        if magnitude_count:
+            stats['average_correction_magnitude'] = magnitude_sum / magnitude_count
         
         return stats
     
@@ -208,57 +359,42 @@ class FeedbackProcessor:
         Returns:
             List of adjustment patterns
         """
-        query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
-        all_feedback = self.memory_store.search(query)
-        
-        # Filter for score adjustments
-        adjustments = [
-            fb for fb in all_feedback
-            if isinstance(fb, FeedbackMemoryEntry) and
-            FeedbackType(fb.content.get('feedback_type')) == FeedbackType.SCORE_ADJUSTMENT
-        ]
-        
-        if country:
-            adjustments = [fb for fb in adjustments if fb.content.get('country') == country]
-        
-        if parameter:
-            adjustments = [fb for fb in adjustments if fb.content.get('parameter') == parameter]
-        
-        # Group by context and calculate patterns
-        context_adjustments: Dict[str, List[float]] = defaultdict(list)
-        
-        for adj in adjustments:
-            # Create context key from relevant attributes
-            context_parts = []
-            if adj.content.get('country'):
-                context_parts.append(f"country:{adj.content['country']}")
-            if adj.content.get('parameter'):
-                context_parts.append(f"param:{adj.content['parameter']}")
+        index = self._ensure_index()
+        
+        with self._index_lock:
+            if country and parameter:
+                # Exact context - single lookup
+                aggregate = index.score_adjustments.get((country, parameter))
+                candidates = [((country, parameter), aggregate)] if aggregate else []
+            else:
+                candidates = [
+                    (key, aggregate) for key, aggregate in index.score_adjustments.items()
+                    if (not country or key[0] == country) and
+                    (not parameter or key[1] == parameter)
+                ]
+        
+            # Extract patterns with sufficient occurrences
+            patterns = []
+            for (adj_country, adj_parameter), aggregate in candidates:
+                if aggregate.count < min_occurrences:
+                    continue
             
-            context_key = "|".join(context_parts) if context_parts else "general"
+                # Context key from relevant attributes
+                context_parts = []
+                if adj_country:
+                    context_parts.append(f"country:{adj_country}")
+                if adj_parameter:
+                    context_parts.append(f"param:{adj_parameter}")
+                context = "|".join(context_parts) if context_parts else "general"
             
-            try:
-                orig = float(adj.content.get('original_value', 0))
-                corr = float(adj.content.get('corrected_value', 0))
-                adjustment = corr - orig
-                context_adjustments[context_key].append(adjustment)
-            except (TypeError, ValueError):
-                continue
-        
-        # Extract patterns with sufficient occurrences
-        patterns = []
-        for context, adjustments_list in context_adjustments.items():
-            if len(adjustments_list) >= min_occurrences:
-                avg_adjustment = sum(adjustments_list) / len(adjustments_list)
-                
                 patterns.append({
                     'context': context,
-                    'occurrences': len(adjustments_list),
-                    'average_adjustment': avg_adjustment,
-                    'min_adjustment': min(adjustments_list),
-                    'max_adjustment': max(adjustments_list),
-                    'std_deviation': self._calculate_std(adjustments_list),
-                    'confidence': min(len(adjustments_list) / 10.0, 1.0)  # Cap at 10 occurrences
+                    'occurrences': aggregate.count,
+                    'average_adjustment': aggregate.mean,
+                    'min_adjustment': aggregate.minimum,
+                    'max_adjustment': aggregate.maximum,
+                    'std_deviation': aggregate.std_deviation,
+                    'confidence': min(aggregate.count / 10.0, 1.0)  # Cap at 10 occurrences
                 })
         
         patterns.sort(key=lambda x: x['confidence'], reverse=True)
@@ -334,15 +470,11 @@ class FeedbackProcessor:
         Returns:
             List of reasoning improvement patterns
         """
-        query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
-        all_feedback = self.memory_store.search(query)
+        index = self._ensure_index()
         
-        # Filter for reasoning corrections
-        corrections = [
-            fb for fb in all_feedback
-            if isinstance(fb, FeedbackMemoryEntry) and
-            FeedbackType(fb.content.get('feedback_type')) == FeedbackType.REASONING_CORRECTION
-        ]
+        # Reasoning corrections, newest first
+        with self._index_lock:
+            corrections = list(reversed(index.by_type.get(FeedbackType.REASONING_CORRECTION, [])))
         
         if country:
             corrections = [fb for fb in corrections if fb.content.get('country') == country]
@@ -428,42 +560,23 @@ class FeedbackProcessor:
     
     def _adapt_weights(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Adapt scoring weights based on feedback."""
-        # Get weight modification feedback
-        query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
-        all_feedback = self.memory_store.search(query)
+        index = self._ensure_index()
         
-        weight_mods = [
-            fb for fb in all_feedback
-            if isinstance(fb, FeedbackMemoryEntry) and
-            FeedbackType(fb.content.get('feedback_type')) == FeedbackType.WEIGHT_MODIFICATION
-        ]
+        with self._index_lock:
+            weight_changes = {
+                param: (aggregate.count, aggregate.mean)
+                for param, aggregate in index.weight_changes.items()
+            }
         
-        if not weight_mods:
+        if not weight_changes:
             return config
         
-        # Extract weight changes
-        weight_changes: Dict[str, List[float]] = defaultdict(list)
-        
-        for mod in weight_mods:
-            param = mod.content.get('parameter')
-            if not param:
-                continue
-            
-            try:
-                orig = float(mod.content.get('original_value', 0))
-                corr = float(mod.content.get('corrected_value', 0))
-                change = corr - orig
-                weight_changes[param].append(change)
-            except (TypeError, ValueError):
-                continue
-        
         # Apply average changes with learning rate
         new_config = config.copy()
         
-        for param, changes in weight_changes.items():
-            if len(changes) >= self.min_feedback_count:
-                avg_change = sum(changes) / len(changes)
-                adjusted_change = avg_change * self.learning_rate
+        for param, (count, mean) in weight_changes.items():
+            if count >= self.min_feedback_count:
+                adjusted_change = mean * self.learning_rate
                 
                 # Update config (path depends on structure)
                 # This is simplified - real implementation would navigate config structure
@@ -0,0 +1,359 @@
+"""Memory compactor for rolling up old episodic memories."""
+import math
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from src.core.logger import get_logger
+
+from ..base.memory_store import MemoryStore
+from ..base.memory_entry import (
+    EpisodicMemoryEntry, MemoryQuery, MemoryMetadata
+)
+from ..base.memory_types import MemoryType, MemoryCategory
+
+logger = get_logger(__name__)
+
+# Episodic memories older than this are folded into summaries
+DEFAULT_COMPACTION_HORIZON_DAYS = 180
+
+# Supported period buckets for summaries
+COMPACTION_BUCKETS = ('month', 'quarter', 'year')
+
+# Originals folded into summaries per compaction pass
+DEFAULT_COMPACTION_BATCH_SIZE = 1000
+
+# Justifications kept per summary
+REPRESENTATIVE_JUSTIFICATIONS = 3
+
+# Key in output_data marking a summary entry
+COMPACTION_KEY = 'compaction'
+
+# metadata.source of summary entries
+SUMMARY_SOURCE = 'memory_compactor'
+
+# Scalar input types kept per summarized memory for pattern recognition
+SCALAR_INPUT_TYPES = (int, float, bool, str)
+
+
+def is_compacted_summary(memory: EpisodicMemoryEntry) -> bool:
+    """Check whether an episodic memory is a compaction summary."""
+    return COMPACTION_KEY in memory.content.get('output_data', {})
+
+
+class MemoryCompactor:
+    """Roll up old episodic memories into per-period summaries.
+    
+    Episodic memories older than a horizon are grouped by
+    (agent, country, period bucket) and replaced by one summary
+    EpisodicMemoryEntry per group. The summary keeps score statistics
+    (count, mean, std dev, min, max) and representative justifications,
+    and exposes the mean as its score so retrieval and score suggestions
+    keep working on it. For pattern recognition it also keeps score rows:
+    each distinct (score, scalar inputs) combination of its originals with
+    the number of originals that had it. Existing summaries are merged
+    with new originals, so repeated runs are idempotent.
+    """
+    
+    def __init__(
+        self,
+        memory_store: MemoryStore,
+        config: Optional[Dict[str, Any]] = None,
+        embed_text: Optional[Callable[[str], Optional[List[float]]]] = None
+    ):
+        """Initialize memory compactor.
+        
+        Args:
+            memory_store: Memory store to compact
+            config: Optional configuration with:
+                - compaction_horizon_days: Age after which memories are compacted (default: 180)
+                - compaction_bucket: 'month', 'quarter' or 'year' (default: 'quarter')
+                - compaction_batch_size: Originals folded per pass (default: 1000)
+            embed_text: Optional function producing summary embeddings
+        """
+        self.memory_store = memory_store
+        self.config = config or {}
+        self.embed_text = embed_text
+        
+        self.horizon_days = self.config.get(
+            'compaction_horizon_days', DEFAULT_COMPACTION_HORIZON_DAYS
+        )
+        self.bucket = self.config.get('compaction_bucket', 'quarter')
+        self.batch_size = self.config.get(
+            'compaction_batch_size', DEFAULT_COMPACTION_BATCH_SIZE
+        )
+        
+        if self.bucket not in COMPACTION_BUCKETS:
+            raise ValueError(
+                f"Unknown compaction bucket '{self.bucket}'. "
+                f"Choose from: {', '.join(COMPACTION_BUCKETS)}"
+            )
+    
+    def compact(
+        self,
+        horizon_days: Optional[int] = None,
+        keep: Optional[Callable[[EpisodicMemoryEntry], bool]] = None
+    ) -> Dict[str, int]:
+        """Fold episodic memories older than the horizon into summaries.
+        
+        Args:
+            horizon_days: Override for the configured horizon
+            keep: Optional predicate; memories it accepts are left untouched
+                (e.g. analyses that expert feedback refers to)
+        
+        Returns:
+            Dictionary with counts of compacted, kept and summary memories
+        """
+        horizon = horizon_days if horizon_days is not None else self.horizon_days
+        cutoff = datetime.now() - timedelta(days=horizon)
+        
+        stats = {'compacted': 0, 'kept': 0, 'summaries': 0}
+        summaries = self._load_summaries()
+        
+        # Every episodic memory older than the cutoff, however many there are
+        query = MemoryQuery(
+            memory_types=[MemoryType.EPISODIC],
+            time_range=(datetime.min, cutoff),
+            include_expired=True
+        )
+        
+        originals: List[EpisodicMemoryEntry] = []
+        for page in self.memory_store.scan(query):
+            for memory in page:
+                if not isinstance(memory, EpisodicMemoryEntry) or is_compacted_summary(memory):
+                    continue
+                
+                if keep and keep(memory):
+                    stats['kept'] += 1
+                    continue
+                originals.append(memory)
+            
+            while len(originals) >= self.batch_size:
+                self._fold(originals[:self.batch_size], summaries, stats)
+                originals = originals[self.batch_size:]
+        
+        if originals:
+            self._fold(originals, summaries, stats)
+        
+        logger.info(
+            f"Compacted {stats['compacted']} episodic memories into "
+            f"{stats['summaries']} new summaries ({stats['kept']} kept)"
+        )
+        return stats
+    
+    def _fold(
+        self,
+        originals: List[EpisodicMemoryEntry],
+        summaries: Dict[Tuple[str, str], Dict[str, EpisodicMemoryEntry]],
+        stats: Dict[str, int]
+    ) -> None:
+        """Fold a batch of originals into their period summaries and delete them."""
+        # Group by (agent, country, period bucket)
+        groups: Dict[Tuple[str, str, str], List[EpisodicMemoryEntry]] = defaultdict(list)
+        for memory in originals:
+            key = (
+                memory.content.get('agent_name'),
+                memory.content.get('country'),
+                self._bucket_label(memory.timestamp)
+            )
+            groups[key].append(memory)
+        
+        for (agent, country, bucket), members in groups.items():
+            by_bucket = summaries.setdefault((agent, country), {})
+            existing = by_bucket.get(bucket)
+            
+            summary = self._build_summary(agent, country, bucket, members, existing)
+            
+            # Write the summary before removing what it replaces
+            self.memory_store.store(summary)
+            by_bucket[bucket] = summary
+            
+            if existing:
+                self.memory_store.delete(existing.id)
+            else:
+                stats['summaries'] += 1
+            
+            for memory in members:
+                if self.memory_store.delete(memory.id):
+                    stats['compacted'] += 1
+    
+    def _load_summaries(self) -> Dict[Tuple[str, str], Dict[str, EpisodicMemoryEntry]]:
+        """Get all existing summaries by (agent, country), then by bucket."""
+        query = MemoryQuery(
+            memory_types=[MemoryType.EPISODIC],
+            sources=[SUMMARY_SOURCE],
+            include_expired=True
+        )
+        
+        summaries: Dict[Tuple[str, str], Dict[str, EpisodicMemoryEntry]] = defaultdict(dict)
+        for page in self.memory_store.scan(query):
+            for memory in page:
+                if isinstance(memory, EpisodicMemoryEntry) and is_compacted_summary(memory):
+                    key = (memory.content.get('agent_name'), memory.content.get('country'))
+                    summaries[key][memory.content.get('period')] = memory
+        return summaries
+    
+    def _bucket_label(self, timestamp: datetime) -> str:
+        """Get the period bucket label for a timestamp."""
+        if self.bucket == 'month':
+            return f"{timestamp.year}-{timestamp.month:02d}"
+        if self.bucket == 'year':
+            return str(timestamp.year)
+        return f"{timestamp.year}-Q{(timestamp.month - 1) // 3 + 1}"
+    
+    def _build_summary(
+        self,
+        agent: str,
+        country: str,
+        bucket: str,
+        members: List[EpisodicMemoryEntry],
+        existing: Optional[EpisodicMemoryEntry] = None
+    ) -> EpisodicMemoryEntry:
+        """Build a summary entry from originals, merged with an existing summary."""
+        scored: List[Tuple[float, Optional[str]]] = []
+        for memory in members:
+            output = memory.content.get('output_data', {})
+            try:
+                if output.get('score') is not None:
+                    scored.append((float(output['score']), output.get('justification')))
+            except (TypeError, ValueError):
+                continue
+        scores = [score for score, _ in scored]
+        
+        # Score statistics (population), merged with the existing summary
+        count = len(scores)
+        mean = sum(scores) / count if count else 0.0
+        m2 = sum((s - mean) ** 2 for s in scores)
+        minimum = min(scores) if scores else None
+        maximum = max(scores) if scores else None
+        
+        previous = existing.content['output_data'][COMPACTION_KEY] if existing else {}
+        prev_stats = previous.get('score_stats', {})
+        if prev_stats.get('count'):
+            prev_count = prev_stats['count']
+            total = count + prev_count
+            delta = prev_stats['mean'] - mean
+            m2 += prev_stats['std_dev'] ** 2 * prev_count + delta ** 2 * count * prev_count / total
+            mean += delta * prev_count / total
+            count = total
+            minimum = prev_stats['min'] if minimum is None else min(minimum, prev_stats['min'])
+            maximum = prev_stats['max'] if maximum is None else max(maximum, prev_stats['max'])
+        
+        score_stats = {
+            'count': count,
+            'mean': mean,
+            'std_dev': math.sqrt(m2 / count) if count else 0.0,
+            'min': minimum,
+            'max': maximum
+        }
+        
+        # Representative justifications: closest to the mean score first
+        justifications = []
+        for _, text in sorted(scored, key=lambda x: abs(x[0] - mean)):
+            if text and text not in justifications:
+                justifications.append(text)
+        for text in previous.get('representative_justifications', []):
+            if text not in justifications:
+                justifications.append(text)
+        justifications = justifications[:REPRESENTATIVE_JUSTIFICATIONS]
+        
+        memory_count = len(members) + previous.get('memory_count', 0)
+        success_count = sum(1 for m in members if m.content.get('success', True))
+        success_count += previous.get('success_count', 0)
+        execution_time = sum(m.content.get('execution_time_ms', 0.0) for m in members)
+        execution_time += previous.get('total_execution_time_ms', 0.0)
+        periods = sorted(
+            set(previous.get('periods', []))
+            | {m.content.get('period') for m in members if m.content.get('period')}
+        )
+        
+        timestamps = [m.timestamp for m in members]
+        if existing:
+            timestamps.append(existing.timestamp)
+        
+        score_rows = self._merge_score_rows(members, previous.get('score_rows', []))
+        
+        expirations = [m.expires_at for m in members]
+        if existing:
+            expirations.append(existing.expires_at)
+        
+        summary = EpisodicMemoryEntry(
+            agent_name=agent,
+            country=country,
+            period=bucket,
+            input_data={'periods': periods},
+            output_data={
+                'score': score_stats['mean'] if score_stats['count'] else None,
+                'justification': justifications[0] if justifications else None,
+                COMPACTION_KEY: {
+                    'bucket': self.bucket,
+                    'memory_count': memory_count,
+                    'success_count': success_count,
+                    'total_execution_time_ms': execution_time,
+                    'score_stats': score_stats,
+                    'score_rows': score_rows,
+                    'representative_justifications': justifications,
+                    'periods': periods
+                }
+            },
+            execution_time_ms=execution_time / memory_count if memory_count else 0.0,
+            success=success_count > 0,
+            category=MemoryCategory.PARAMETER_ANALYSIS,
+            metadata=MemoryMetadata(source=SUMMARY_SOURCE)
+        )
+        
+        # Keep the summary inside the period it covers
+        summary.timestamp = max(timestamps)
+        
+        # Summary lives as long as its longest-lived original
+        summary.expires_at = None if any(e is None for e in expirations) else max(expirations)
+        
+        if self.embed_text:
+            text = f"Agent: {agent} | Country: {country} | Period: {bucket}"
+            if score_stats['count']:
+                text += f" | Score: {score_stats['mean']:.2f}"
+            if justifications:
+                text += f" | Reasoning: {justifications[0][:300]}"
+            summary.embedding = self.embed_text(text)
+        
+        return summary
+    
+    def _merge_score_rows(
+        self,
+        members: List[EpisodicMemoryEntry],
+        previous_rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Count originals per distinct (score, scalar inputs), merged with previous rows."""
+        rows: Dict[Tuple, Dict[str, Any]] = {}
+        
+        def add(score: Optional[float], inputs: Dict[str, Any], count: int) -> None:
+            # Type names keep True and 1 (or 1 and 1.0) apart
+            key = (score, tuple(sorted(
+                (name, type(value).__name__, value) for name, value in inputs.items()
+            )))
+            row = rows.get(key)
+            if row is None:
+                rows[key] = {'score': score, 'inputs': inputs, 'count': count}
+            else:
+                row['count'] += count
+        
+        for row in previous_rows:
+            add(row['score'], row['inputs'], row['count'])
+        
+        for memory in members:
+            score = memory.content.get('output_data', {}).get('score')
+            try:
+                score = float(score) if score is not None else None
+            except (TypeError, ValueError):
+                score = None
+            if score is not None and math.isnan(score):
+                score = None
+            
+            inputs = {
+                name: value
+                for name, value in memory.content.get('input_data', {}).items()
+                if isinstance(value, SCALAR_INPUT_TYPES)
+            }
+            add(score, inputs, 1)
+        
+        return list(rows.values())
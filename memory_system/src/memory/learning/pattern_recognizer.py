@@ -1,7 +1,10 @@
 """Pattern recognizer for learning from historical analyses."""
-from typing import List, Dict, Any, Optional, Set
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple
 from collections import defaultdict, Counter
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import numpy as np
 
 from src.core.logger import get_logger
 
@@ -13,10 +16,157 @@ from ..base.memory_entry import (
 from ..base.memory_types import (
     MemoryType, MemoryCategory
 )
+from .memory_compactor import COMPACTION_KEY, SCALAR_INPUT_TYPES
 
 logger = get_logger(__name__)
 
 
+class EpisodicColumns:
+    """Append-only columnar snapshot of episodic memories.
+    
+    Holds one column per field that scoring-pattern recognition needs
+    (score, timestamp, scalar input attributes), so the statistics can be
+    computed with NumPy instead of walking memory entries.
+    
+    Each row carries a weight: the number of memories it stands for. An
+    original memory is one row of weight 1; a compaction summary adds one
+    row per score row it kept, weighted by its count and stamped with the
+    summary timestamp, so statistics match those of the originals.
+    """
+    
+    def __init__(self, agent: Optional[str] = None, country: Optional[str] = None):
+        """Initialize empty columns.
+        
+        Args:
+            agent: Agent name shared by all rows (None if mixed)
+            country: Country shared by all rows (None if mixed)
+        """
+        self.agent = agent
+        self.country = country
+        self._scores: List[float] = []
+        self._timestamps: List[float] = []
+        self._weights: List[float] = []
+        # input key -> (row indices, values)
+        self._inputs: Dict[str, Tuple[List[int], List[Any]]] = defaultdict(lambda: ([], []))
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    
+    def __len__(self) -> int:
+        return len(self._scores)
+    
+    @property
+    def memory_count(self) -> int:
+        """Number of memories the rows stand for."""
+        return int(round(sum(self._weights)))
+    
+    def append(self, memory: EpisodicMemoryEntry) -> None:
+        """Append one memory as a new row (or a summary as its score rows)."""
+        output = memory.content.get('output_data', {})
+        timestamp = memory.timestamp.timestamp()
+        
+        compaction = output.get(COMPACTION_KEY)
+        if compaction is None:
+            self._append_row(output.get('score'), memory.content.get('input_data', {}), timestamp, 1)
+        elif 'score_rows' in compaction:
+            for row in compaction['score_rows']:
+                self._append_row(row['score'], row['inputs'], timestamp, row['count'])
+        else:
+            # Summary written before score rows were kept: its mean stands in
+            stats = compaction.get('score_stats', {})
+            if stats.get('count'):
+                self._append_row(stats['mean'], {}, timestamp, stats['count'])
+            unscored = compaction.get('memory_count', 0) - stats.get('count', 0)
+            if unscored > 0:
+                self._append_row(None, {}, timestamp, unscored)
+        
+        self._arrays = None
+    
+    def _append_row(
+        self,
+        score: Any,
+        inputs: Dict[str, Any],
+        timestamp: float,
+        weight: float
+    ) -> None:
+        """Append one row standing for weight memories."""
+        row = len(self._scores)
+        
+        try:
+            score = float(score) if score is not None else np.nan
+        except (TypeError, ValueError):
+            score = np.nan
+        
+        self._scores.append(score)
+        self._timestamps.append(timestamp)
+        self._weights.append(weight)
+        
+        for key, value in inputs.items():
+            if isinstance(value, SCALAR_INPUT_TYPES):
+                rows, values = self._inputs[key]
+                rows.append(row)
+                values.append(value)
+    
+    def extend(self, other: 'EpisodicColumns') -> None:
+        """Append all rows of another column set."""
+        offset = len(self._scores)
+        self._scores.extend(other._scores)
+        self._timestamps.extend(other._timestamps)
+        self._weights.extend(other._weights)
+        for key, (rows, values) in other._inputs.items():
+            own_rows, own_values = self._inputs[key]
+            own_rows.extend(r + offset for r in rows)
+            own_values.extend(values)
+        self._arrays = None
+    
+    @property
+    def scores(self) -> np.ndarray:
+        """Score column (NaN where the memory had no numeric score)."""
+        return self._as_arrays()[0]
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        """POSIX timestamp column."""
+        return self._as_arrays()[1]
+    
+    @property
+    def weights(self) -> np.ndarray:
+        """Weight column (memories per row)."""
+        return self._as_arrays()[2]
+    
+    def inputs(self) -> Dict[str, Tuple[np.ndarray, List[Any]]]:
+        """Input attribute columns as (row indices, values) per key."""
+        return {
+            key: (np.asarray(rows, dtype=np.intp), values)
+            for key, (rows, values) in self._inputs.items()
+        }
+    
+    def select(self, mask: np.ndarray) -> 'EpisodicColumns':
+        """Return a new column set containing only rows where mask is True."""
+        selected = EpisodicColumns(self.agent, self.country)
+        keep = np.flatnonzero(mask)
+        new_index = np.full(len(self._scores), -1, dtype=np.intp)
+        new_index[keep] = np.arange(len(keep))
+        
+        selected._scores = self.scores[keep].tolist()
+        selected._timestamps = self.timestamps[keep].tolist()
+        selected._weights = self.weights[keep].tolist()
+        for key, (rows, values) in self._inputs.items():
+            for row, value in zip(rows, values):
+                if new_index[row] >= 0:
+                    sel_rows, sel_values = selected._inputs[key]
+                    sel_rows.append(int(new_index[row]))
+                    sel_values.append(value)
+        return selected
+    
+    def _as_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self._scores, dtype=float),
+                np.asarray(self._timestamps, dtype=float),
+                np.asarray(self._weights, dtype=float)
+            )
+        return self._arrays
+
+
 class PatternRecognizer:
     """Recognize patterns from historical analyses.
     
@@ -25,6 +175,14 @@ class PatternRecognizer:
     - Reasoning patterns (common justification structures)
     - Decision patterns (how experts make judgments)
     - Temporal patterns (seasonal or time-based trends)
+    
+    Episodic memories are kept in a columnar snapshot partitioned by
+    (agent, country), built once from the store and extended through
+    add_memory(). Recognized scoring patterns are cached per
+    (agent, country) and invalidated only when a matching memory arrives.
+    
+    Rebuilds scan the store without holding the snapshot lock and swap the
+    new partitions in under it; add_memory and readers take the same lock.
     """
     
     def __init__(
@@ -45,6 +203,143 @@ class PatternRecognizer:
         self.min_pattern_occurrences = config.get('min_pattern_occurrences', 3)
         self.min_pattern_confidence = config.get('min_pattern_confidence', 0.6)
         
+        # Columnar snapshot and pattern cache
+        self._snapshot_ready = False
+        self._partitions: Dict[Tuple[Optional[str], Optional[str]], EpisodicColumns] = {}
+        self._seen_ids: Set[str] = set()
+        self._pattern_cache: Dict[Tuple[Optional[str], Optional[str]], List[Dict[str, Any]]] = {}
+        self._snapshot_lock = threading.RLock()
+        # Memories added while a rebuild scans the store, folded in at the swap
+        self._rebuilds_running = 0
+        self._added_during_rebuild: List[EpisodicMemoryEntry] = []
+        # Rebuilds are numbered when they start; one only swaps in if no
+        # later-started rebuild (or invalidation) has superseded it
+        self._rebuild_ticket = 0
+        self._snapshot_ticket = 0
+    
+    # --- Snapshot maintenance ---
+    
+    def rebuild_snapshot(self) -> int:
+        """Rebuild the columnar snapshot of episodic memories from the store.
+        
+        The new snapshot is built off to the side and swapped in whole.
+        
+        Returns:
+            Number of memories in the snapshot
+        """
+        with self._snapshot_lock:
+            self._rebuilds_running += 1
+            self._rebuild_ticket += 1
+            ticket = self._rebuild_ticket
+        
+        partitions: Dict[Tuple[Optional[str], Optional[str]], EpisodicColumns] = {}
+        seen_ids: Set[str] = set()
+        try:
+            # Page through the whole history; only the columns are kept
+            query = MemoryQuery(memory_types=[MemoryType.EPISODIC])
+            for page in self.memory_store.scan(query):
+                for memory in page:
+                    self._append(partitions, seen_ids, memory)
+            
+            with self._snapshot_lock:
+                # Memories added during the scan that the scan missed
+                for memory in self._added_during_rebuild:
+                    self._append(partitions, seen_ids, memory)
+                
+                if ticket > self._snapshot_ticket:
+                    self._partitions = partitions
+                    self._seen_ids = seen_ids
+                    self._pattern_cache = {}
+                    self._snapshot_ready = True
+                    self._snapshot_ticket = ticket
+        finally:
+            with self._snapshot_lock:
+                self._rebuilds_running -= 1
+                if not self._rebuilds_running:
+                    self._added_during_rebuild = []
+        
+        logger.debug(f"Built pattern snapshot with {len(seen_ids)} episodic memories")
+        return len(seen_ids)
+    
+    def add_memory(self, memory: EpisodicMemoryEntry) -> None:
+        """Add a newly recorded episodic memory to the snapshot.
+        
+        Only cached patterns covering the memory's agent/country are invalidated.
+        
+        Args:
+            memory: Episodic memory that was just stored
+        """
+        with self._snapshot_lock:
+            if self._rebuilds_running:
+                self._added_during_rebuild.append(memory)
+            
+            if not self._snapshot_ready:
+                return  # Snapshot will pick it up from the store when built
+            
+            if not self._append(self._partitions, self._seen_ids, memory):
+                return
+            
+            agent = memory.content.get('agent_name')
+            country = memory.content.get('country')
+            for key in (
+                (agent, country), (agent, None), (None, country), (None, None)
+            ):
+                self._pattern_cache.pop(key, None)
+    
+    def invalidate_snapshot(self) -> None:
+        """Drop the snapshot so it is rebuilt from the store on next use.
+        
+        Call after memories were deleted from the store. Rebuilds already
+        scanning are discarded, since they may still see the deleted memories.
+        """
+        with self._snapshot_lock:
+            self._snapshot_ready = False
+            self._partitions = {}
+            self._seen_ids = set()
+            self._pattern_cache = {}
+            self._snapshot_ticket = self._rebuild_ticket
+    
+    @staticmethod
+    def _append(
+        partitions: Dict[Tuple[Optional[str], Optional[str]], EpisodicColumns],
+        seen_ids: Set[str],
+        memory
+    ) -> bool:
+        """Append memory to its partition. Returns False if skipped."""
+        if not isinstance(memory, EpisodicMemoryEntry) or memory.id in seen_ids:
+            return False
+        
+        key = (memory.content.get('agent_name'), memory.content.get('country'))
+        partition = partitions.get(key)
+        if partition is None:
+            partition = partitions[key] = EpisodicColumns(*key)
+        
+        partition.append(memory)
+        seen_ids.add(memory.id)
+        return True
+    
+    def _ensure_snapshot(self) -> None:
+        """Build the snapshot on first use."""
+        if not self._snapshot_ready:
+            self.rebuild_snapshot()
+    
+    def _matching_partitions(
+        self,
+        agent: Optional[str],
+        country: Optional[str]
+    ) -> List[EpisodicColumns]:
+        """Get partitions matching the optional agent/country filters."""
+        if agent and country:
+            partition = self._partitions.get((agent, country))
+            return [partition] if partition is not None else []
+        
+        return [
+            partition for (p_agent, p_country), partition in self._partitions.items()
+            if (not agent or p_agent == agent) and (not country or p_country == country)
+        ]
+    
+    # --- Scoring patterns ---
+    
     def recognize_scoring_patterns(
         self,
         country: Optional[str] = None,
@@ -61,39 +356,55 @@ class PatternRecognizer:
         Returns:
             List of recognized patterns
         """
-        # Get episodic memories
-        query = MemoryQuery(
-            memory_types=[MemoryType.EPISODIC],
-            countries=[country] if country else None,
-            agents=[parameter] if parameter else None
-        )
+        self._ensure_snapshot()
         
-        memories = self.memory_store.search(query)
+        with self._snapshot_lock:
+            return self._recognize_scoring_patterns(country, parameter, time_window_days)
+    
+    def _recognize_scoring_patterns(
+        self,
+        country: Optional[str],
+        parameter: Optional[str],
+        time_window_days: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Recognize scoring patterns over the snapshot (snapshot lock held)."""
+        cache_key = (parameter or None, country or None)
+        if time_window_days is None and cache_key in self._pattern_cache:
+            return self._pattern_cache[cache_key]
         
-        if not memories:
-            return []
+        partitions = self._matching_partitions(parameter, country)
         
         # Filter by time window
         if time_window_days:
-            from datetime import timedelta
-            cutoff = datetime.now() - timedelta(days=time_window_days)
-            memories = [m for m in memories if m.timestamp >= cutoff]
+            cutoff = (datetime.now() - timedelta(days=time_window_days)).timestamp()
+            partitions = [p.select(p.timestamps >= cutoff) for p in partitions]
+        
+        partitions = [p for p in partitions if len(p)]
+        if not partitions:
+            return []
+        
+        if len(partitions) == 1:
+            columns = partitions[0]
+        else:
+            columns = EpisodicColumns()
+            for partition in partitions:
+                columns.extend(partition)
         
         # Analyze score distributions
         patterns = []
         
         # Pattern 1: Score clustering
-        score_clusters = self._find_score_clusters(memories)
+        score_clusters = self._find_score_clusters(columns)
         if score_clusters:
             patterns.append({
                 'pattern_type': 'score_clustering',
                 'description': 'Scores tend to cluster around specific values',
                 'clusters': score_clusters,
-                'confidence': self._calculate_cluster_confidence(score_clusters, len(memories))
+                'confidence': self._calculate_cluster_confidence(score_clusters, columns.memory_count)
             })
         
         # Pattern 2: Score-input correlations
-        correlations = self._find_score_correlations(memories)
+        correlations = self._find_score_correlations(columns)
         if correlations:
             patterns.append({
                 'pattern_type': 'score_correlation',
@@ -103,7 +414,7 @@ class PatternRecognizer:
             })
         
         # Pattern 3: Consistent scoring ranges by context
-        context_ranges = self._find_context_score_ranges(memories)
+        context_ranges = self._find_context_score_ranges(partitions)
         if context_ranges:
             patterns.append({
                 'pattern_type': 'context_ranges',
@@ -112,45 +423,48 @@ class PatternRecognizer:
                 'confidence': self._calculate_range_confidence(context_ranges)
             })
         
+        if time_window_days is None:
+            self._pattern_cache[cache_key] = patterns
+        
         return patterns
     
     def _find_score_clusters(
         self,
-        memories: List[EpisodicMemoryEntry]
+        columns: EpisodicColumns
     ) -> List[Dict[str, Any]]:
         """Find score clustering patterns."""
-        scores = []
-        for mem in memories:
-            if isinstance(mem, EpisodicMemoryEntry):
-                output = mem.content.get('output_data', {})
-                score = output.get('score')
-                if score is not None:
-                    try:
-                        scores.append(float(score))
-                    except (TypeError, ValueError):
-                        continue
-        
-        if len(scores) < self.min_pattern_occurrences:
+        scores = columns.scores
+        valid = ~np.isnan(scores)
+        scores = scores[valid]
+        weights = columns.weights[valid]
+        
+        total_scores = int(round(weights.sum()))
+        if total_scores < self.min_pattern_occurrences:
             return []
         
         # Simple clustering: group scores into 0.5-point bins
-        bins = defaultdict(list)
-        for score in scores:
-            bin_key = round(score * 2) / 2  # Round to nearest 0.5
-            bins[bin_key].append(score)
+        bin_keys = np.round(scores * 2) / 2  # Round to nearest 0.5
+        order = np.argsort(bin_keys, kind='stable')
+        sorted_keys = bin_keys[order]
+        sorted_scores = scores[order]
+        
+        centers, starts = np.unique(sorted_keys, return_index=True)
+        counts = np.rint(np.add.reduceat(weights[order], starts)).astype(int)
+        mins = np.minimum.reduceat(sorted_scores, starts)
+        maxs = np.maximum.reduceat(sorted_scores, starts)
         
         # Find bins with significant clustering
-        clusters = []
-        total_scores = len(scores)
-        
-        for bin_center, bin_scores in bins.items():
-            if len(bin_scores) >= self.min_pattern_occurrences:
-                clusters.append({
-                    'center': bin_center,
-                    'count': len(bin_scores),
-                    'percentage': len(bin_scores) / total_scores,
-                    'range': (min(bin_scores), max(bin_scores))
-                })
+        significant = np.flatnonzero(counts >= self.min_pattern_occurrences)
+        
+        clusters = [
+            {
+                'center': float(centers[i]),
+                'count': int(counts[i]),
+                'percentage': float(counts[i]) / total_scores,
+                'range': (float(mins[i]), float(maxs[i]))
+            }
+            for i in significant
+        ]
         
         return sorted(clusters, key=lambda x: x['count'], reverse=True)
     
@@ -171,50 +485,37 @@ class PatternRecognizer:
     
     def _find_score_correlations(
         self,
-        memories: List[EpisodicMemoryEntry]
+        columns: EpisodicColumns
     ) -> List[Dict[str, Any]]:
         """Find correlations between inputs and scores."""
-        # Collect input-score pairs
-        input_scores: Dict[str, List[tuple[Any, float]]] = defaultdict(list)
-        
-        for mem in memories:
-            if not isinstance(mem, EpisodicMemoryEntry):
-                continue
-            
-            input_data = mem.content.get('input_data', {})
-            output_data = mem.content.get('output_data', {})
-            score = output_data.get('score')
-            
-            if score is None:
-                continue
-            
-            try:
-                score_float = float(score)
-            except (TypeError, ValueError):
-                continue
-            
-            # Track each input attribute
-            for key, value in input_data.items():
-                if isinstance(value, (int, float, bool, str)):
-                    input_scores[key].append((value, score_float))
-        
-        # Calculate correlations
+        scores = columns.scores
+        weights = columns.weights
         correlations = []
         
-        for input_key, pairs in input_scores.items():
-            if len(pairs) < self.min_pattern_occurrences:
+        for input_key, (rows, values) in columns.inputs().items():
+            # Only rows with a valid score take part
+            row_scores = scores[rows]
+            valid = ~np.isnan(row_scores)
+            row_weights = weights[rows][valid]
+            if int(round(row_weights.sum())) < self.min_pattern_occurrences:
                 continue
+            row_scores = row_scores[valid]
+            values = [v for v, ok in zip(values, valid) if ok]
             
             # For categorical: average score per category
-            if isinstance(pairs[0][0], str):
-                category_scores: Dict[str, List[float]] = defaultdict(list)
-                for value, score in pairs:
-                    category_scores[value].append(score)
+            if any(isinstance(v, str) for v in values):
+                categories_arr, inverse = np.unique(
+                    np.asarray([str(v) for v in values]), return_inverse=True
+                )
+                counts = np.rint(np.bincount(inverse, weights=row_weights)).astype(int)
+                sums = np.bincount(inverse, weights=row_scores * row_weights)
                 
                 # Find significant differences
-                categories = [(cat, sum(scores)/len(scores), len(scores))
-                             for cat, scores in category_scores.items()
-                             if len(scores) >= 2]
+                keep = np.flatnonzero(counts >= 2)
+                categories = [
+                    (str(categories_arr[i]), float(sums[i] / counts[i]), int(counts[i]))
+                    for i in keep
+                ]
                 
                 if len(categories) >= 2:
                     categories.sort(key=lambda x: x[1], reverse=True)
@@ -232,11 +533,10 @@ class PatternRecognizer:
                         })
             
             # For numeric: correlation coefficient
-            elif isinstance(pairs[0][0], (int, float)):
-                values = [p[0] for p in pairs]
-                scores = [p[1] for p in pairs]
-                
-                correlation = self._calculate_correlation(values, scores)
+            else:
+                correlation = self._calculate_correlation(
+                    np.asarray(values, dtype=float), row_scores, row_weights
+                )
                 
                 if abs(correlation) >= 0.5:  # Moderate correlation
                     correlations.append({
@@ -251,30 +551,25 @@ class PatternRecognizer:
     
     def _calculate_correlation(
         self,
-        x_values: List[float],
-        y_values: List[float]
+        x_values,
+        y_values,
+        weights=None
     ) -> float:
-        """Calculate Pearson correlation coefficient."""
-        if len(x_values) != len(y_values) or len(x_values) < 2:
-            return 0.0
-        
-        n = len(x_values)
-        
-        # Convert to float
-        x = [float(v) for v in x_values]
-        y = [float(v) for v in y_values]
-        
-        # Calculate means
-        x_mean = sum(x) / n
-        y_mean = sum(y) / n
+        """Calculate (weighted) Pearson correlation coefficient."""
+        x = np.asarray(x_values, dtype=float)
+        y = np.asarray(y_values, dtype=float)
+        w = np.ones(len(x)) if weights is None else np.asarray(weights, dtype=float)
         
-        # Calculate correlation
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
+        if len(x) != len(y) or len(x) < 2:
+            return 0.0
         
-        x_variance = sum((x[i] - x_mean) ** 2 for i in range(n))
-        y_variance = sum((y[i] - y_mean) ** 2 for i in range(n))
+        x_centered = x - np.average(x, weights=w)
+        y_centered = y - np.average(y, weights=w)
         
-        denominator = (x_variance * y_variance) ** 0.5
+        numerator = float(np.dot(w * x_centered, y_centered))
+        denominator = float(np.sqrt(
+            np.dot(w * x_centered, x_centered) * np.dot(w * y_centered, y_centered)
+        ))
         
         if denominator == 0:
             return 0.0
@@ -283,61 +578,42 @@ class PatternRecognizer:
     
     def _find_context_score_ranges(
         self,
-        memories: List[EpisodicMemoryEntry]
+        partitions: List[EpisodicColumns]
     ) -> List[Dict[str, Any]]:
         """Find consistent score ranges for specific contexts."""
-        # Group by context attributes
-        context_scores: Dict[str, List[float]] = defaultdict(list)
+        ranges = []
         
-        for mem in memories:
-            if not isinstance(mem, EpisodicMemoryEntry):
-                continue
-            
-            # Build context key from relevant attributes
+        # Each (agent, country) partition is one context
+        for partition in partitions:
             context_parts = []
-            
-            country = mem.content.get('country')
-            if country:
-                context_parts.append(f"country:{country}")
-            
-            agent = mem.content.get('agent_name')
-            if agent:
-                context_parts.append(f"agent:{agent}")
+            if partition.country:
+                context_parts.append(f"country:{partition.country}")
+            if partition.agent:
+                context_parts.append(f"agent:{partition.agent}")
             
             if not context_parts:
                 continue
             
-            context_key = "|".join(context_parts)
-            
-            # Get score
-            output = mem.content.get('output_data', {})
-            score = output.get('score')
+            scores = partition.scores
+            valid = ~np.isnan(scores)
+            scores = scores[valid]
+            weights = partition.weights[valid]
             
-            if score is not None:
-                try:
-                    context_scores[context_key].append(float(score))
-                except (TypeError, ValueError):
-                    continue
-        
-        # Find contexts with consistent ranges
-        ranges = []
-        
-        for context, scores in context_scores.items():
-            if len(scores) < self.min_pattern_occurrences:
+            count = int(round(weights.sum()))
+            if count < self.min_pattern_occurrences:
                 continue
             
-            avg_score = sum(scores) / len(scores)
-            min_score = min(scores)
-            max_score = max(scores)
-            std_dev = self._calculate_std(scores)
+            # Population standard deviation
+            average = float(np.average(scores, weights=weights))
+            std_dev = float(np.sqrt(np.average((scores - average) ** 2, weights=weights)))
             
             # Consistent if std dev is low
             if std_dev < 1.5:
                 ranges.append({
-                    'context': context,
-                    'count': len(scores),
-                    'average': avg_score,
-                    'range': (min_score, max_score),
+                    'context': "|".join(context_parts),
+                    'count': count,
+                    'average': average,
+                    'range': (float(scores.min()), float(scores.max())),
                     'std_dev': std_dev,
                     'consistency': max(0, 1.0 - std_dev / 3.0)  # Lower std = higher consistency
                 })
@@ -1,7 +1,9 @@
 """Similarity engine for finding similar past cases."""
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from sentence_transformers import SentenceTransformer
+
+import numpy as np
+
 from src.core.logger import get_logger
 
 from ..base.memory_store import MemoryStore
@@ -15,6 +17,19 @@ from ..base.memory_types import (
 
 logger = get_logger(__name__)
 
+# Default weights for combining scores in hybrid retrieval
+DEFAULT_HYBRID_WEIGHTS = {
+    'similarity': 0.5,
+    'recency': 0.3,
+    'frequency': 0.2
+}
+
+# Days for recency score to decay by a factor of e
+DEFAULT_RECENCY_DECAY_DAYS = 30
+
+# Hybrid retrieval scores top_k * this many candidates
+DEFAULT_HYBRID_CANDIDATE_MULTIPLIER = 4
+
 
 class SimilarityEngine:
     """Engine for finding similar memories and cases.
@@ -37,18 +52,47 @@ class SimilarityEngine:
         Args:
             memory_store: Memory store to search
             embedding_model: Sentence transformer model for embeddings
-            config: Optional configuration
+            config: Optional configuration with:
+                - hybrid_weights: Weights for similarity/recency/frequency
+                - recency_decay_days: Recency decay constant (default: 30)
+                - hybrid_candidate_multiplier: Candidates per result (default: 4)
         """
         self.memory_store = memory_store
         self.config = config or {}
         
-        # Initialize embedding model
-        try:
-            self.embedding_model = SentenceTransformer(embedding_model)
-            logger.info(f"Loaded embedding model: {embedding_model}")
-        except Exception as e:
-            logger.warning(f"Failed to load embedding model: {e}. Embeddings disabled.")
-            self.embedding_model = None
+        self.hybrid_weights = {
+            **DEFAULT_HYBRID_WEIGHTS,
+            **self.config.get('hybrid_weights', {})
+        }
+        self.recency_decay_days = self.config.get(
+            'recency_decay_days', DEFAULT_RECENCY_DECAY_DAYS
+        )
+        self.hybrid_candidate_multiplier = self.config.get(
+            'hybrid_candidate_multiplier', DEFAULT_HYBRID_CANDIDATE_MULTIPLIER
+        )
+        
+        # Embedding model is loaded on first use (sentence-transformers pulls in torch)
+        self.embedding_model_name = embedding_model
+        self._embedding_model = None
+        self._embedding_model_loaded = False
+    
+    @property
+    def embedding_model(self):
+        """Lazy-load the sentence transformer model.
+        
+        Returns:
+            SentenceTransformer instance or None if unavailable
+        """
+        if not self._embedding_model_loaded:
+            self._embedding_model_loaded = True
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedding_model = SentenceTransformer(self.embedding_model_name)
+                logger.info(f"Loaded embedding model: {self.embedding_model_name}")
+            except Exception as e:
+                logger.warning(f"Failed to load embedding model: {e}. Embeddings disabled.")
+                self._embedding_model = None
+        return self._embedding_model
     
     def embed_text(self, text: str) -> Optional[List[float]]:
         """Generate embedding for text.
@@ -247,41 +291,83 @@ class SimilarityEngine:
         context: Optional[Dict[str, Any]],
         top_k: int
     ) -> List[Tuple[EpisodicMemoryEntry, float]]:
-        """Find using hybrid approach (combines multiple strategies)."""
-        # Get candidates from different strategies
-        similarity_results = self._find_by_similarity(country, parameter, context, top_k)
-        recency_results = self._find_by_recency(country, parameter, top_k)
-        frequency_results = self._find_by_frequency(country, parameter, top_k)
-        
-        # Combine scores with weights
-        weights = {
-            'similarity': 0.5,
-            'recency': 0.3,
-            'frequency': 0.2
-        }
+        """Find using hybrid approach (combines multiple strategies).
         
-        # Build score map
-        score_map: Dict[str, float] = {}
+        Fetches one candidate set filtered by country and agent, then scores
+        similarity, recency decay and access frequency together.
+        """
+        candidate_count = top_k * self.hybrid_candidate_multiplier
+        
+        # Create query text from context
+        query_text = f"Country: {country}"
+        if parameter:
+            query_text += f", Parameter: {parameter}"
+        if context:
+            query_text += f", Context: {str(context)}"
         
-        for memory, score in similarity_results:
-            score_map[memory.id] = score_map.get(memory.id, 0) + score * weights['similarity']
+        embedding = self.embed_text(query_text)
         
-        for memory, score in recency_results:
-            score_map[memory.id] = score_map.get(memory.id, 0) + score * weights['recency']
+        if embedding:
+            filters = {
+                'memory_type': MemoryType.EPISODIC.value,
+                'country': country
+            }
+            if parameter:
+                filters['agent_name'] = parameter
+            
+            candidates = [
+                (mem, score) for mem, score in self.memory_store.search_similar(
+                    embedding=embedding,
+                    top_k=candidate_count,
+                    filters=filters
+                )
+                if isinstance(mem, EpisodicMemoryEntry)
+            ]
+        else:
+            query = MemoryQuery(
+                memory_types=[MemoryType.EPISODIC],
+                countries=[country],
+                agents=[parameter] if parameter else None,
+                top_k=candidate_count
+            )
+            # Without embeddings, structural match stands in for similarity
+            # (country and agent already match through the query filters)
+            base_score = 0.4 + (0.3 if parameter else 0.0)
+            candidates = [
+                (mem, base_score + (0.2 if mem.content.get('success', False) else 0.0))
+                for mem in self.memory_store.search(query)
+                if isinstance(mem, EpisodicMemoryEntry)
+            ]
+        
+        if not candidates:
+            return []
+        
+        now = datetime.now()
+        similarity = np.array([score for _, score in candidates], dtype=float)
+        days_old = np.array(
+            [(now - mem.timestamp).days for mem, _ in candidates], dtype=float
+        )
+        access_counts = np.array(
+            [mem.metadata.access_count for mem, _ in candidates], dtype=float
+        )
         
-        for memory, score in frequency_results:
-            score_map[memory.id] = score_map.get(memory.id, 0) + score * weights['frequency']
+        # Exponential decay: score = e^(-days/decay_days)
+        recency = np.exp(-days_old / self.recency_decay_days)
         
-        # Get unique memories
-        memory_map = {}
-        for memory, _ in similarity_results + recency_results + frequency_results:
-            memory_map[memory.id] = memory
+        # Normalize access count to 0-1
+        max_access = access_counts.max()
+        frequency = access_counts / max_access if max_access > 0 else np.zeros_like(access_counts)
         
-        # Build final results
-        results = [(memory_map[mem_id], score) for mem_id, score in score_map.items()]
-        results.sort(key=lambda x: x[1], reverse=True)
+        weights = self.hybrid_weights
+        scores = (
+            weights['similarity'] * similarity
+            + weights['recency'] * recency
+            + weights['frequency'] * frequency
+        )
         
-        return results[:top_k]
+        # Highest scores first; stable so ties keep store order
+        order = np.argsort(-scores, kind='stable')[:top_k]
+        return [(candidates[i][0], float(scores[i])) for i in order]
     
     def _find_by_relevance(
         self,
@@ -1,6 +1,8 @@
 """Memory store implementations."""
 from .chromadb_store import ChromaDBMemoryStore
+from .quantized_index import QuantizedEmbeddingIndex
 
 __all__ = [
-    'ChromaDBMemoryStore'
+    'ChromaDBMemoryStore',
+    'QuantizedEmbeddingIndex'
 ]
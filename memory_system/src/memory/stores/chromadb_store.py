@@ -1,9 +1,9 @@
 """ChromaDB implementation of memory store."""
 import json
-from typing import List, Dict, Any, Optional
+import os
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from datetime import datetime
-import chromadb
-from chromadb.config import Settings
 from src.core.logger import get_logger
 
 from memory_system.src.memory.base.memory_store import MemoryStore, MemoryStoreRegistry
@@ -14,9 +14,28 @@ from memory_system.src.memory.base import (
 from memory_system.src.memory.base.memory_types import (
     MemoryType, DEFAULT_EMBEDDING_MODEL
 )
+from memory_system.src.memory.stores.quantized_index import (
+    QuantizedEmbeddingIndex, QUANTIZED_DTYPES, DEFAULT_RERANK_FACTOR
+)
 
 logger = get_logger(__name__)
 
+# Rows fetched per page when scanning a collection
+DEFAULT_SCAN_PAGE_SIZE = 1000
+
+# IDs per collection.delete() call
+DEFAULT_DELETE_BATCH_SIZE = 500
+
+# Entries per collection.add() call in store_batch
+DEFAULT_WRITE_BATCH_SIZE = 1000
+
+# Memory IDs whose collection is remembered (separate collections only)
+DEFAULT_ROUTING_CACHE_SIZE = 10000
+
+# Stored in ChromaDB in place of the real vector when embeddings live in
+# the quantized index (ChromaDB requires an embedding per record)
+PLACEHOLDER_EMBEDDING = [0.0]
+
 
 class ChromaDBMemoryStore(MemoryStore):
     """ChromaDB-based memory storage.
@@ -30,9 +49,21 @@ class ChromaDBMemoryStore(MemoryStore):
         
         Config options:
             - persist_directory: Path to persist data (default: ./chroma_memory)
-            - embedding_model: Sentence transformer model name
+            - embedding_model: Sentence transformer model name (embeds text queries
+              when embedding_storage is quantized)
             - collection_name: Base collection name (default: renewable_rankings_memory)
             - use_separate_collections: One collection per memory type (default: False)
+            - scan_page_size: Rows per page for maintenance scans (default: 1000)
+            - delete_batch_size: IDs per batched delete (default: 500)
+            - write_batch_size: Entries per batched add (default: 1000)
+            - routing_cache_size: Recently used memory IDs whose collection is
+              remembered when use_separate_collections is set (default: 10000)
+            - embedding_storage: 'chroma' (default), or 'int8' / 'float16' to keep
+              embeddings in a quantized memory-mapped index instead of ChromaDB.
+              Fixed per collection: an existing collection must be reopened
+              with the storage it was created with
+            - embedding_index_path: Index directory (default: <persist_directory>/embedding_index)
+            - rerank_factor: Quantized candidates re-ranked exactly per result (default: 4)
         """
         super().__init__(config)
         
@@ -40,13 +71,43 @@ class ChromaDBMemoryStore(MemoryStore):
         self.embedding_model = config.get('embedding_model', DEFAULT_EMBEDDING_MODEL)
         self.collection_name = config.get('collection_name', 'renewable_rankings_memory')
         self.use_separate_collections = config.get('use_separate_collections', False)
+        self.scan_page_size = config.get('scan_page_size', DEFAULT_SCAN_PAGE_SIZE)
+        self.delete_batch_size = config.get('delete_batch_size', DEFAULT_DELETE_BATCH_SIZE)
+        self.write_batch_size = config.get('write_batch_size', DEFAULT_WRITE_BATCH_SIZE)
+        self.routing_cache_size = config.get('routing_cache_size', DEFAULT_ROUTING_CACHE_SIZE)
+        self.embedding_storage = config.get('embedding_storage', 'chroma')
+        self.embedding_index_path = config.get(
+            'embedding_index_path',
+            os.path.join(self.persist_directory, 'embedding_index')
+        )
+        self.rerank_factor = config.get('rerank_factor', DEFAULT_RERANK_FACTOR)
         
-        self.client: Optional[chromadb.Client] = None
+        if self.embedding_storage != 'chroma' and self.embedding_storage not in QUANTIZED_DTYPES:
+            raise ValueError(
+                f"Unknown embedding_storage '{self.embedding_storage}'. "
+                f"Choose from: chroma, {', '.join(QUANTIZED_DTYPES)}"
+            )
+        
+        self.client: Optional[Any] = None
         self.collections: Dict[str, Any] = {}
         
+        # Memory ID -> collection key for recently used IDs (LRU), so point
+        # lookups go to one collection. Unused with a single collection
+        self._id_collection: 'OrderedDict[str, str]' = OrderedDict()
+        
+        self.embedding_index: Optional[QuantizedEmbeddingIndex] = None
+        
+        # Embeds text queries in quantized mode (sentence-transformers pulls in torch)
+        self._embedding_model = None
+        self._embedding_model_loaded = False
+        
     def initialize(self) -> None:
         """Initialize ChromaDB client and collections."""
         try:
+            # Imported here so that importing the store module stays cheap
+            import chromadb
+            from chromadb.config import Settings
+            
             # Create persistent client
             self.client = chromadb.Client(Settings(
                 persist_directory=self.persist_directory,
@@ -67,6 +128,14 @@ class ChromaDBMemoryStore(MemoryStore):
                     name=self.collection_name
                 )
             
+            if self.embedding_storage in QUANTIZED_DTYPES:
+                self.embedding_index = QuantizedEmbeddingIndex(
+                    self.embedding_index_path,
+                    dtype=self.embedding_storage
+                )
+            
+            self._check_embedding_storage()
+            
             self._initialized = True
             logger.info(
                 f"ChromaDB memory store initialized at {self.persist_directory} "
@@ -77,12 +146,131 @@ class ChromaDBMemoryStore(MemoryStore):
             logger.error(f"Failed to initialize ChromaDB memory store: {e}")
             raise
     
+    def _check_embedding_storage(self) -> None:
+        """Check that existing collections were written in the configured mode.
+        
+        ChromaDB fixes a collection's dimension on first write, so a
+        collection of full embeddings cannot take placeholder rows and vice
+        versa. Raises ValueError instead of failing on the first write.
+        """
+        quantized = self.embedding_index is not None
+        
+        for collection in self.collections.values():
+            sample = collection.get(limit=1, include=['embeddings'])
+            embeddings = sample.get('embeddings')
+            if embeddings is None or len(embeddings) == 0:
+                continue
+            
+            dimension = len(embeddings[0])
+            if quantized == (dimension == len(PLACEHOLDER_EMBEDDING)):
+                continue
+            
+            stored_as = 'placeholder' if not quantized else f"{dimension}-dimensional"
+            raise ValueError(
+                f"Collection '{collection.name}' holds {stored_as} embeddings and cannot be "
+                f"opened with embedding_storage '{self.embedding_storage}'. Keep the "
+                f"embedding_storage it was created with, or use a new collection_name."
+            )
+    
+    @property
+    def query_encoder(self):
+        """Lazy-load the sentence transformer used to embed text queries.
+        
+        Returns:
+            SentenceTransformer instance or None if unavailable
+        """
+        if not self._embedding_model_loaded:
+            self._embedding_model_loaded = True
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedding_model = SentenceTransformer(self.embedding_model)
+                logger.info(f"Loaded query embedding model: {self.embedding_model}")
+            except Exception as e:
+                logger.warning(f"Failed to load query embedding model: {e}")
+                self._embedding_model = None
+        return self._embedding_model
+    
+    def _embed_query(self, text: str) -> Optional[List[float]]:
+        """Embed a text query for the quantized index (None if no model)."""
+        model = self.query_encoder
+        if model is None:
+            return None
+        return model.encode(text).tolist()
+    
     def _get_collection(self, memory_type: Optional[MemoryType] = None):
         """Get appropriate collection for memory type."""
         if self.use_separate_collections and memory_type:
             return self.collections.get(memory_type.value)
         return self.collections.get('default')
     
+    def _collection_key(self, memory_type: MemoryType) -> str:
+        """Get the collections key a memory type is stored under."""
+        return memory_type.value if self.use_separate_collections else 'default'
+    
+    def _locate(self, memory_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Find the stored record for each memory ID.
+        
+        IDs in the routing index are fetched from their own collection; the
+        rest (e.g. written by another process) are probed across collections
+        and added to the index. Issues at most one get per collection.
+        
+        Args:
+            memory_ids: IDs to look up
+            
+        Returns:
+            Dict of memory ID -> {'key', 'document', 'metadata'} for IDs found
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        
+        routed: Dict[str, List[str]] = {}
+        unrouted: List[str] = []
+        for memory_id in dict.fromkeys(memory_ids):
+            key = self._id_collection.get(memory_id)
+            if key in self.collections:
+                self._id_collection.move_to_end(memory_id)
+                routed.setdefault(key, []).append(memory_id)
+            else:
+                unrouted.append(memory_id)
+        
+        for key, collection in self.collections.items():
+            ids = routed.get(key, []) + unrouted
+            if not ids:
+                continue
+            
+            result = collection.get(ids=ids, include=['documents', 'metadatas'])
+            for memory_id, document, metadata in zip(
+                result['ids'], result['documents'], result['metadatas']
+            ):
+                found[memory_id] = {
+                    'key': key,
+                    'document': document,
+                    'metadata': metadata
+                }
+                self._route(memory_id, key)
+            
+            unrouted = [mid for mid in unrouted if mid not in found]
+        
+        # Routed IDs that were not found have been deleted elsewhere
+        for ids in routed.values():
+            self._unroute(memory_id for memory_id in ids if memory_id not in found)
+        
+        return found
+    
+    def _route(self, memory_id: str, key: str) -> None:
+        """Remember the collection of a memory ID, evicting the least recently used."""
+        if not self.use_separate_collections:
+            return
+        
+        self._id_collection[memory_id] = key
+        self._id_collection.move_to_end(memory_id)
+        while len(self._id_collection) > self.routing_cache_size:
+            self._id_collection.popitem(last=False)
+    
+    def _unroute(self, memory_ids) -> None:
+        """Forget the collection of deleted memory IDs."""
+        for memory_id in memory_ids:
+            self._id_collection.pop(memory_id, None)
+    
     def _entry_to_document(self, entry: BaseMemoryEntry) -> Dict[str, Any]:
         """Convert memory entry to ChromaDB document format."""
         # Create searchable text from entry content
@@ -194,14 +382,22 @@ class ChromaDBMemoryStore(MemoryStore):
             collection = self._get_collection(entry.memory_type)
             doc = self._entry_to_document(entry)
             
+            embeddings = [doc['embedding']] if doc['embedding'] else None
+            if self.embedding_index is not None:
+                if doc['embedding']:
+                    self.embedding_index.add(entry.id, doc['embedding'])
+                embeddings = [PLACEHOLDER_EMBEDDING]
+            
             # Add to collection
             collection.add(
                 ids=[doc['id']],
                 documents=[doc['document']],
                 metadatas=[doc['metadata']],
-                embeddings=[doc['embedding']] if doc['embedding'] else None
+                embeddings=embeddings
             )
             
+            self._route(entry.id, self._collection_key(entry.memory_type))
+            
             logger.debug(f"Stored memory {entry.id} of type {entry.memory_type.value}")
             return entry.id
             
@@ -209,38 +405,98 @@ class ChromaDBMemoryStore(MemoryStore):
             logger.error(f"Failed to store memory: {e}")
             raise
     
+    def store_batch(self, entries: List[BaseMemoryEntry]) -> List[str]:
+        """Store multiple memory entries with batched adds per collection."""
+        self.ensure_initialized()
+        
+        try:
+            batches: List[Tuple[str, List[BaseMemoryEntry]]] = []
+            by_key: Dict[str, List[BaseMemoryEntry]] = {}
+            for entry in entries:
+                by_key.setdefault(self._collection_key(entry.memory_type), []).append(entry)
+            for key, keyed in by_key.items():
+                for start in range(0, len(keyed), self.write_batch_size):
+                    batches.append((key, keyed[start:start + self.write_batch_size]))
+            
+            for key, batch in batches:
+                collection = self.collections[key]
+                docs = [self._entry_to_document(entry) for entry in batch]
+                
+                if self.embedding_index is not None:
+                    self.embedding_index.add_batch([
+                        (doc['id'], doc['embedding']) for doc in docs if doc['embedding']
+                    ])
+                    embeddings = [PLACEHOLDER_EMBEDDING] * len(docs)
+                elif all(doc['embedding'] for doc in docs):
+                    embeddings = [doc['embedding'] for doc in docs]
+                else:
+                    # Mixed batches fall back to one add per entry
+                    for entry in batch:
+                        self.store(entry)
+                    continue
+                
+                collection.add(
+                    ids=[doc['id'] for doc in docs],
+                    documents=[doc['document'] for doc in docs],
+                    metadatas=[doc['metadata'] for doc in docs],
+                    embeddings=embeddings
+                )
+                for doc in docs:
+                    self._route(doc['id'], key)
+            
+            logger.debug(f"Stored batch of {len(entries)} memories")
+            return [entry.id for entry in entries]
+            
+        except Exception as e:
+            logger.error(f"Failed to store memory batch: {e}")
+            raise
+    
     def retrieve(self, memory_id: str) -> Optional[BaseMemoryEntry]:
         """Retrieve a specific memory by ID."""
+        entries = self.retrieve_batch([memory_id])
+        return entries[0] if entries else None
+    
+    def retrieve_batch(self, memory_ids: List[str]) -> List[Optional[BaseMemoryEntry]]:
+        """Retrieve multiple memories by ID.
+        
+        Uses one get per collection and one metadata update per collection
+        for the access statistics.
+        """
         self.ensure_initialized()
         
         try:
-            # Try all collections if using separate collections
-            collections = self.collections.values()
+            found = self._locate(memory_ids)
             
-            for collection in collections:
-                result = collection.get(ids=[memory_id])
+            entries: Dict[str, BaseMemoryEntry] = {}
+            access_updates: Dict[str, Tuple[List[str], List[Dict[str, Any]]]] = {}
+            
+            for memory_id, record in found.items():
+                entry = self._document_to_entry(
+                    memory_id,
+                    record['document'],
+                    record['metadata']
+                )
+                entry.update_access()
+                entries[memory_id] = entry
                 
-                if result['ids']:
-                    entry = self._document_to_entry(
-                        result['ids'][0],
-                        result['documents'][0],
-                        result['metadatas'][0]
-                    )
-                    entry.update_access()
-                    
-                    # Update access stats in store
-                    self.update(memory_id, {
-                        'access_count': entry.metadata.access_count,
-                        'last_accessed': entry.metadata.last_accessed.isoformat()
-                    })
-                    
-                    return entry
+                metadata = dict(record['metadata'])
+                metadata.update({
+                    'access_count': entry.metadata.access_count,
+                    'last_accessed': entry.metadata.last_accessed.isoformat()
+                })
+                ids, metadatas = access_updates.setdefault(record['key'], ([], []))
+                ids.append(memory_id)
+                metadatas.append(metadata)
             
-            return None
+            # Update access stats in store
+            for key, (ids, metadatas) in access_updates.items():
+                self.collections[key].update(ids=ids, metadatas=metadatas)
+            
+            return [entries.get(memory_id) for memory_id in memory_ids]
             
         except Exception as e:
-            logger.error(f"Failed to retrieve memory {memory_id}: {e}")
-            return None
+            logger.error(f"Failed to retrieve memories {memory_ids}: {e}")
+            return [None] * len(memory_ids)
     
     def search(self, query: MemoryQuery) -> List[BaseMemoryEntry]:
         """Search for memories matching query."""
@@ -248,20 +504,36 @@ class ChromaDBMemoryStore(MemoryStore):
         
         try:
             # ChromaDB has limited where clause support - use simple filter or get all
-            where = None
-            
-            # Use only memory_type filter if specified, otherwise get all
-            if query.memory_types and len(query.memory_types) == 1:
-                where = {'memory_type': query.memory_types[0].value}
-            elif query.memory_types:
-                where = {'memory_type': {'$in': [mt.value for mt in query.memory_types]}}
+            where = self._memory_type_filter(query)
             
             # Query collection(s)
             collections = self.collections.values()
             all_results = []
             
+            query_embedding = query.query_embedding
+            if self.embedding_index is not None and query.query_text and not query_embedding:
+                # ChromaDB only holds placeholders, so embed the text ourselves
+                query_embedding = self._embed_query(query.query_text)
+                if query_embedding is None:
+                    logger.warning(
+                        "Text query needs an embedding model with quantized "
+                        "embedding_storage; returning no results"
+                    )
+                    return []
+            
+            if self.embedding_index is not None and query_embedding:
+                # Vectors live in the quantized index, not in ChromaDB
+                for entry, similarity in self.search_similar(
+                    query_embedding,
+                    top_k=query.top_k * 3,  # Get more to filter
+                    filters=where
+                ):
+                    if similarity >= query.similarity_threshold and self._matches_query(entry, query):
+                        all_results.append(entry)
+                collections = []
+            
             for collection in collections:
-                if query.query_text:
+                if query.query_text and self.embedding_index is None:
                     # Text-based query
                     results = collection.query(
                         query_texts=[query.query_text],
@@ -296,30 +568,7 @@ class ChromaDBMemoryStore(MemoryStore):
                         )
                         
                         # Apply all filters in Python
-                        # Category filter
-                        if query.categories and entry.category not in query.categories:
-                            continue
-                        
-                        # Country filter
-                        if query.countries:
-                            country = entry.content.get('country')
-                            if country not in query.countries:
-                                continue
-                        
-                        # Agent filter
-                        if query.agents:
-                            agent = entry.content.get('agent_name')
-                            if agent not in query.agents:
-                                continue
-                        
-                        # Time range filter
-                        if query.time_range:
-                            start, end = query.time_range
-                            if not (start <= entry.timestamp <= end):
-                                continue
-                        
-                        # Expired filter
-                        if not query.include_expired and entry.is_expired():
+                        if not self._matches_query(entry, query):
                             continue
                         
                         # Similarity threshold filter
@@ -339,6 +588,48 @@ class ChromaDBMemoryStore(MemoryStore):
             logger.error(f"Failed to search memories: {e}")
             return []
     
+    def _memory_type_filter(self, query: MemoryQuery) -> Optional[Dict[str, Any]]:
+        """ChromaDB where clause for a query's memory types (None for all)."""
+        if query.memory_types and len(query.memory_types) == 1:
+            return {'memory_type': query.memory_types[0].value}
+        if query.memory_types:
+            return {'memory_type': {'$in': [mt.value for mt in query.memory_types]}}
+        return None
+    
+    def _matches_query(self, entry: BaseMemoryEntry, query: MemoryQuery) -> bool:
+        """Apply MemoryQuery filters that ChromaDB cannot express."""
+        # Category filter
+        if query.categories and entry.category not in query.categories:
+            return False
+        
+        # Country filter
+        if query.countries:
+            country = entry.content.get('country')
+            if country not in query.countries:
+                return False
+        
+        # Agent filter
+        if query.agents:
+            agent = entry.content.get('agent_name')
+            if agent not in query.agents:
+                return False
+        
+        # Source filter
+        if query.sources and entry.metadata.source not in query.sources:
+            return False
+        
+        # Time range filter
+        if query.time_range:
+            start, end = query.time_range
+            if not (start <= entry.timestamp <= end):
+                return False
+        
+        # Expired filter
+        if not query.include_expired and entry.is_expired():
+            return False
+        
+        return True
+    
     def search_similar(
         self,
         embedding: List[float],
@@ -352,10 +643,21 @@ class ChromaDBMemoryStore(MemoryStore):
             collections = self.collections.values()
             all_results = []
             
-            # Simplify filters for ChromaDB - use only memory_type if present
+            # Push supported metadata filters down to ChromaDB so the vector
+            # query only returns matching candidates
+            conditions = [
+                {key: filters[key]}
+                for key in ('memory_type', 'country', 'agent_name')
+                if filters and key in filters
+            ]
             simple_filter = None
-            if filters and 'memory_type' in filters:
-                simple_filter = {'memory_type': filters['memory_type']}
+            if len(conditions) == 1:
+                simple_filter = conditions[0]
+            elif conditions:
+                simple_filter = {'$and': conditions}
+            
+            if self.embedding_index is not None:
+                return self._search_quantized(embedding, top_k, simple_filter)
             
             for collection in collections:
                 results = collection.query(
@@ -408,29 +710,58 @@ class ChromaDBMemoryStore(MemoryStore):
             logger.error(f"Failed to search similar memories: {e}")
             return []
     
+    def _search_quantized(
+        self,
+        embedding: List[float],
+        top_k: int,
+        where: Optional[Dict[str, Any]]
+    ) -> List[tuple[BaseMemoryEntry, float]]:
+        """Vector search over the quantized index with exact re-ranking."""
+        candidate_ids = None
+        if where:
+            # Restrict the scan to IDs matching the metadata filter
+            candidate_ids = set()
+            for collection in self.collections.values():
+                for ids, _ in self._scan_metadata(collection, where=where, include_metadata=False):
+                    candidate_ids.update(ids)
+        
+        hits = self.embedding_index.search(
+            embedding,
+            top_k=top_k,
+            candidate_ids=candidate_ids,
+            rerank_factor=self.rerank_factor
+        )
+        
+        found = self._locate([memory_id for memory_id, _ in hits])
+        
+        results = []
+        for memory_id, similarity in hits:
+            record = found.get(memory_id)
+            if record:
+                entry = self._document_to_entry(memory_id, record['document'], record['metadata'])
+                results.append((entry, similarity))
+        return results
+    
     def update(self, memory_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing memory entry."""
         self.ensure_initialized()
         
         try:
-            # Find which collection contains this memory
-            for collection in self.collections.values():
-                result = collection.get(ids=[memory_id])
-                
-                if result['ids']:
-                    # Update metadata
-                    current_metadata = result['metadatas'][0]
-                    current_metadata.update(updates)
-                    
-                    collection.update(
-                        ids=[memory_id],
-                        metadatas=[current_metadata]
-                    )
-                    
-                    logger.debug(f"Updated memory {memory_id}")
-                    return True
+            record = self._locate([memory_id]).get(memory_id)
+            if not record:
+                return False
             
-            return False
+            # Update metadata
+            current_metadata = record['metadata']
+            current_metadata.update(updates)
+            
+            self.collections[record['key']].update(
+                ids=[memory_id],
+                metadatas=[current_metadata]
+            )
+            
+            logger.debug(f"Updated memory {memory_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to update memory {memory_id}: {e}")
@@ -441,22 +772,148 @@ class ChromaDBMemoryStore(MemoryStore):
         self.ensure_initialized()
         
         try:
-            for collection in self.collections.values():
-                result = collection.get(ids=[memory_id])
-                
-                if result['ids']:
-                    collection.delete(ids=[memory_id])
-                    logger.debug(f"Deleted memory {memory_id}")
-                    return True
+            record = self._locate([memory_id]).get(memory_id)
+            if not record:
+                return False
             
-            return False
+            self.collections[record['key']].delete(ids=[memory_id])
+            self._unroute([memory_id])
+            if self.embedding_index is not None:
+                self.embedding_index.remove([memory_id])
+            logger.debug(f"Deleted memory {memory_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to delete memory {memory_id}: {e}")
             return False
     
+    def _scan_metadata(
+        self,
+        collection,
+        where: Optional[Dict[str, Any]] = None,
+        include_metadata: bool = True
+    ) -> Iterator[Tuple[List[str], List[Dict[str, Any]]]]:
+        """Scan a collection page by page.
+        
+        Only IDs (and optionally metadata) are fetched, never documents or
+        embeddings, and at most scan_page_size rows are held at a time.
+        
+        Args:
+            collection: ChromaDB collection to scan
+            where: Optional metadata filter
+            include_metadata: Whether to fetch metadata alongside IDs
+            
+        Yields:
+            (ids, metadatas) per page; metadatas is empty if not requested
+        """
+        include = ['metadatas'] if include_metadata else []
+        offset = 0
+        
+        while True:
+            page = collection.get(
+                where=where,
+                limit=self.scan_page_size,
+                offset=offset,
+                include=include
+            )
+            ids = page['ids']
+            if not ids:
+                return
+            
+            yield ids, page['metadatas'] or []
+            
+            if len(ids) < self.scan_page_size:
+                return
+            offset += len(ids)
+    
+    def _metadata_matches(self, metadata: Dict[str, Any], query: MemoryQuery, now: datetime) -> bool:
+        """Apply the MemoryQuery filters that stored metadata can answer."""
+        if query.categories and metadata.get('category') not in {c.value for c in query.categories}:
+            return False
+        
+        if query.countries and metadata.get('country') not in query.countries:
+            return False
+        
+        if query.agents and metadata.get('agent_name') not in query.agents:
+            return False
+        
+        if query.sources and metadata.get('source') not in query.sources:
+            return False
+        
+        try:
+            if query.time_range:
+                start, end = query.time_range
+                if not (start <= datetime.fromisoformat(metadata['timestamp']) <= end):
+                    return False
+            
+            if not query.include_expired and metadata.get('expires_at'):
+                if datetime.fromisoformat(metadata['expires_at']) < now:
+                    return False
+        except (KeyError, TypeError, ValueError):
+            # Leave malformed metadata to the entry-level check
+            return True
+        
+        return True
+    
+    def scan(self, query: MemoryQuery) -> Iterator[List[BaseMemoryEntry]]:
+        """Iterate over every memory matching a query's filters, page by page.
+        
+        Matching IDs are collected from a metadata-only scan first, then
+        documents are fetched by ID scan_page_size at a time. Memory use is
+        bounded by the matching IDs plus one page of documents, and callers
+        may delete the entries of a page without shifting later pages.
+        """
+        self.ensure_initialized()
+        
+        where = self._memory_type_filter(query)
+        now = datetime.now()
+        
+        try:
+            for collection in self.collections.values():
+                ids: List[str] = []
+                for page_ids, metadatas in self._scan_metadata(collection, where=where):
+                    ids.extend(
+                        memory_id for memory_id, metadata in zip(page_ids, metadatas)
+                        if self._metadata_matches(metadata or {}, query, now)
+                    )
+                
+                for start in range(0, len(ids), self.scan_page_size):
+                    result = collection.get(
+                        ids=ids[start:start + self.scan_page_size],
+                        include=['documents', 'metadatas']
+                    )
+                    
+                    entries = []
+                    for memory_id, document, metadata in zip(
+                        result['ids'], result['documents'], result['metadatas']
+                    ):
+                        entry = self._document_to_entry(memory_id, document, metadata)
+                        if self._matches_query(entry, query):
+                            entries.append(entry)
+                    
+                    if entries:
+                        yield entries
+                        
+        except Exception as e:
+            logger.error(f"Failed to scan memories: {e}")
+            raise
+    
+    def _delete_ids(self, collection, ids: List[str]) -> None:
+        """Delete IDs from a collection in batches of delete_batch_size."""
+        for start in range(0, len(ids), self.delete_batch_size):
+            collection.delete(ids=ids[start:start + self.delete_batch_size])
+        
+        self._unroute(ids)
+        
+        if self.embedding_index is not None:
+            self.embedding_index.remove(ids)
+    
     def delete_expired(self) -> int:
-        """Delete all expired memories."""
+        """Delete all expired memories.
+        
+        Scans each collection page by page and deletes expired entries as
+        it goes, so memory use does not grow with the size of the store.
+        """
         self.ensure_initialized()
         
         count = 0
@@ -464,24 +921,38 @@ class ChromaDBMemoryStore(MemoryStore):
         
         try:
             for collection in self.collections.values():
-                # Get all memories and filter expired ones
-                results = collection.get()
+                offset = 0
                 
-                expired_ids = []
-                if results['ids']:
-                    for i, metadata in enumerate(results['metadatas']):
-                        expires_at_str = metadata.get('expires_at')
+                while True:
+                    page = collection.get(
+                        limit=self.scan_page_size,
+                        offset=offset,
+                        include=['metadatas']
+                    )
+                    ids = page['ids']
+                    if not ids:
+                        break
+                    
+                    expired_ids = []
+                    for memory_id, metadata in zip(ids, page['metadatas']):
+                        expires_at_str = (metadata or {}).get('expires_at')
                         if expires_at_str:
                             try:
                                 expires_at = datetime.fromisoformat(expires_at_str)
                                 if expires_at < now:
-                                    expired_ids.append(results['ids'][i])
+                                    expired_ids.append(memory_id)
                             except (ValueError, TypeError):
                                 continue
-                
-                if expired_ids:
-                    collection.delete(ids=expired_ids)
-                    count += len(expired_ids)
+                    
+                    if expired_ids:
+                        self._delete_ids(collection, expired_ids)
+                        count += len(expired_ids)
+                    
+                    if len(ids) < self.scan_page_size:
+                        break
+                    
+                    # Deleted rows no longer occupy offsets
+                    offset += len(ids) - len(expired_ids)
             
             logger.info(f"Deleted {count} expired memories")
             return count
@@ -497,8 +968,14 @@ class ChromaDBMemoryStore(MemoryStore):
         try:
             total = 0
             for collection in self.collections.values():
-                result = collection.get(where=filters)
-                total += len(result['ids'])
+                if not filters:
+                    total += collection.count()
+                    continue
+                
+                for ids, _ in self._scan_metadata(
+                    collection, where=filters, include_metadata=False
+                ):
+                    total += len(ids)
             return total
             
         except Exception as e:
@@ -518,17 +995,20 @@ class ChromaDBMemoryStore(MemoryStore):
             }
             
             for collection in self.collections.values():
-                # Get all entries
-                result = collection.get()
-                stats['total_memories'] += len(result['ids'])
-                
-                # Count by type and category
-                for metadata in result['metadatas']:
-                    memory_type = metadata.get('memory_type', 'unknown')
-                    category = metadata.get('category', 'unknown')
+                for ids, metadatas in self._scan_metadata(collection):
+                    stats['total_memories'] += len(ids)
                     
-                    stats['by_type'][memory_type] = stats['by_type'].get(memory_type, 0) + 1
-                    stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
+                    # Count by type and category
+                    for metadata in metadatas:
+                        metadata = metadata or {}
+                        memory_type = metadata.get('memory_type', 'unknown')
+                        category = metadata.get('category', 'unknown')
+                        
+                        stats['by_type'][memory_type] = stats['by_type'].get(memory_type, 0) + 1
+                        stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
+            
+            if self.embedding_index is not None:
+                stats['embedding_index'] = self.embedding_index.get_statistics()
             
             return stats
             
@@ -536,6 +1016,19 @@ class ChromaDBMemoryStore(MemoryStore):
             logger.error(f"Failed to get statistics: {e}")
             return {}
     
+    def vacuum(self) -> int:
+        """Rewrite the quantized index without deleted embeddings."""
+        self.ensure_initialized()
+        
+        if self.embedding_index is None:
+            return 0
+        
+        try:
+            return self.embedding_index.vacuum()
+        except Exception as e:
+            logger.error(f"Failed to vacuum embedding index: {e}")
+            return 0
+    
     def clear_all(self) -> bool:
         """Clear all memories from storage."""
         self.ensure_initialized()
@@ -546,6 +1039,9 @@ class ChromaDBMemoryStore(MemoryStore):
             
             # Reinitialize collections
             self.collections.clear()
+            self._id_collection.clear()
+            if self.embedding_index is not None:
+                self.embedding_index.clear()
             self._initialized = False
             self.initialize()
             
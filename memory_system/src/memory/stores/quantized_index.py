@@ -0,0 +1,475 @@
+"""Quantized, memory-mapped embedding index."""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads in this process are serialized
+    fcntl = None
+
+from src.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Supported storage dtypes for the quantized vectors
+QUANTIZED_DTYPES = {
+    'int8': np.int8,
+    'float16': np.float16
+}
+
+# Rows scored per chunk during the quantized scan
+SCAN_CHUNK_ROWS = 65536
+
+# Candidates re-ranked at full precision per requested result
+DEFAULT_RERANK_FACTOR = 4
+
+# Share of dead rows (tombstoned or superseded) above which vacuum() rewrites the files
+VACUUM_DEAD_RATIO = 0.25
+
+
+class QuantizedEmbeddingIndex:
+    """Append-only embedding index stored in memory-mapped files.
+    
+    Layout under the index directory:
+    - index.json: dimension and dtype
+    - vectors.q: quantized rows (int8 or float16)
+    - row_stats.f32: per-row (scale, squared norm) as float32
+    - vectors.f32: full-precision rows, read only when re-ranking
+    - ids.txt: one memory ID per row; a row is committed once its ID is written
+    - deleted.txt: tombstoned memory IDs
+    - index.lock: flock target serializing writers across processes
+    
+    Search scans the quantized rows and re-ranks the best candidates
+    against the exact vectors. Writers hold an exclusive lock on
+    index.lock and write each row at the committed row count, so rows stay
+    aligned across files when several processes add at once. Readers take
+    a shared lock while picking up new rows. Files only grow until
+    vacuum() rewrites them without dead rows.
+    
+    Similarity is 1 - squared L2 distance, matching ChromaDB's default space.
+    """
+    
+    def __init__(self, path: str, dtype: str = 'int8'):
+        """Initialize index, creating the directory if needed.
+        
+        Args:
+            path: Directory for index files
+            dtype: Quantized storage type ('int8' or 'float16')
+        """
+        if dtype not in QUANTIZED_DTYPES:
+            raise ValueError(
+                f"Unsupported embedding dtype '{dtype}'. "
+                f"Choose from: {', '.join(QUANTIZED_DTYPES)}"
+            )
+        
+        self.path = path
+        self.dtype = dtype
+        self.dimension: Optional[int] = None
+        
+        os.makedirs(path, exist_ok=True)
+        self._meta_path = os.path.join(path, 'index.json')
+        self._vectors_path = os.path.join(path, 'vectors.q')
+        self._stats_path = os.path.join(path, 'row_stats.f32')
+        self._exact_path = os.path.join(path, 'vectors.f32')
+        self._ids_path = os.path.join(path, 'ids.txt')
+        self._deleted_path = os.path.join(path, 'deleted.txt')
+        self._lock_path = os.path.join(path, 'index.lock')
+        
+        # flock is per open file, so threads of one process also need a lock
+        self._lock = threading.Lock()
+        
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._deleted: Set[str] = set()
+        self._ids_offset = 0
+        self._deleted_offset = 0
+        # Identity of the ids file read so far; changes when vacuum() replaces it
+        self._ids_inode: Optional[int] = None
+        
+        self._vectors: Optional[np.ndarray] = None
+        self._stats: Optional[np.ndarray] = None
+        self._exact: Optional[np.ndarray] = None
+        
+        self.refresh()
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+    
+    def add(self, memory_id: str, embedding: List[float]) -> None:
+        """Append an embedding.
+        
+        Args:
+            memory_id: Memory ID the embedding belongs to
+            embedding: Full-precision embedding vector
+        """
+        self.add_batch([(memory_id, embedding)])
+    
+    def add_batch(self, items: List[Tuple[str, List[float]]]) -> None:
+        """Append several embeddings with one write per file.
+        
+        Args:
+            items: (memory_id, embedding) pairs
+        """
+        if not items:
+            return
+        
+        vectors = np.asarray([embedding for _, embedding in items], dtype=np.float32)
+        
+        with self._locked(exclusive=True):
+            self._sync()
+            
+            if self.dimension is None:
+                self.dimension = int(vectors.shape[1])
+                with open(self._meta_path, 'w') as f:
+                    json.dump({'dimension': self.dimension, 'dtype': self.dtype}, f)
+            elif vectors.shape[1] != self.dimension:
+                raise ValueError(
+                    f"Embedding has dimension {vectors.shape[1]}, index expects {self.dimension}"
+                )
+            
+            rows = [self._quantize(vector) for vector in vectors]
+            quantized = np.stack([row for row, _ in rows])
+            stats = np.column_stack([
+                np.array([scale for _, scale in rows], dtype=np.float32),
+                np.einsum('ij,ij->i', vectors, vectors)
+            ]).astype(np.float32)
+            
+            # Write at the committed row count, overwriting any partial rows
+            # a crashed writer left behind; IDs last so rows commit together
+            n_rows = len(self._ids)
+            self._write_at(self._exact_path, n_rows * vectors[0].nbytes, vectors.tobytes())
+            self._write_at(self._stats_path, n_rows * stats[0].nbytes, stats.tobytes())
+            self._write_at(self._vectors_path, n_rows * quantized[0].nbytes, quantized.tobytes())
+            self._write_at(
+                self._ids_path, self._ids_offset,
+                ''.join(memory_id + '\n' for memory_id, _ in items).encode()
+            )
+            
+            # Maps are refreshed lazily by the next search or get
+            self._sync()
+    
+    def remove(self, memory_ids: List[str]) -> int:
+        """Tombstone embeddings so they no longer match.
+        
+        Args:
+            memory_ids: Memory IDs to remove
+        
+        Returns:
+            Number of embeddings removed
+        """
+        with self._locked(exclusive=True):
+            self._sync()
+            
+            removed = [mid for mid in memory_ids if mid in self._rows]
+            if not removed:
+                return 0
+            
+            with open(self._deleted_path, 'a') as f:
+                f.write(''.join(mid + '\n' for mid in removed))
+            
+            self._sync()
+        return len(removed)
+    
+    def vacuum(self, min_dead_ratio: float = VACUUM_DEAD_RATIO) -> int:
+        """Rewrite the index files without dead rows.
+        
+        Rows die when their memory is removed or re-added. Other processes
+        notice the rewritten files on their next refresh and reload them.
+        
+        Args:
+            min_dead_ratio: Only rewrite when at least this share of rows is dead
+        
+        Returns:
+            Number of rows reclaimed
+        """
+        with self._locked(exclusive=True):
+            self._sync()
+            
+            dead = len(self._ids) - len(self._rows)
+            if dead == 0 or dead < min_dead_ratio * len(self._ids):
+                return 0
+            
+            self._map_files()
+            live = np.fromiter(self._rows.values(), dtype=np.intp, count=len(self._rows))
+            live.sort()
+            
+            for file_path, rows in (
+                (self._exact_path, self._exact),
+                (self._stats_path, self._stats),
+                (self._vectors_path, self._vectors)
+            ):
+                with open(file_path + '.tmp', 'wb') as f:
+                    for start in range(0, len(live), SCAN_CHUNK_ROWS):
+                        f.write(np.ascontiguousarray(rows[live[start:start + SCAN_CHUNK_ROWS]]).tobytes())
+            with open(self._ids_path + '.tmp', 'w') as f:
+                f.write(''.join(self._ids[row] + '\n' for row in live))
+            
+            self._vectors = self._stats = self._exact = None
+            for file_path in (self._exact_path, self._stats_path, self._vectors_path, self._ids_path):
+                os.replace(file_path + '.tmp', file_path)
+            if os.path.exists(self._deleted_path):
+                os.remove(self._deleted_path)
+            
+            self._reset()
+            self._sync()
+        
+        logger.info(f"Vacuumed {dead} dead rows from embedding index at {self.path}")
+        return dead
+    
+    def get(self, memory_id: str) -> Optional[List[float]]:
+        """Get the full-precision embedding for a memory."""
+        with self._locked(exclusive=False):
+            self._sync()
+            row = self._rows.get(memory_id)
+            if row is None:
+                return None
+            self._map_files()
+            return self._exact[row].tolist()
+    
+    def search(
+        self,
+        embedding: List[float],
+        top_k: int = 5,
+        candidate_ids: Optional[Set[str]] = None,
+        rerank_factor: int = DEFAULT_RERANK_FACTOR
+    ) -> List[Tuple[str, float]]:
+        """Find the most similar embeddings.
+        
+        Args:
+            embedding: Query vector
+            top_k: Number of results
+            candidate_ids: Optional set of IDs to restrict the search to
+            rerank_factor: Quantized candidates re-ranked per result
+        
+        Returns:
+            List of (memory_id, similarity) sorted by similarity
+        """
+        # Snapshot under the lock; the scan itself runs unlocked on the
+        # mapped arrays, which writers never modify in place
+        with self._locked(exclusive=False):
+            self._sync()
+            self._map_files()
+            
+            if not self._rows or top_k <= 0:
+                return []
+            
+            query = np.asarray(embedding, dtype=np.float32)
+            if query.shape[0] != self.dimension:
+                raise ValueError(
+                    f"Query has dimension {query.shape[0]}, index expects {self.dimension}"
+                )
+            
+            # Rows eligible for this search
+            if candidate_ids is not None:
+                rows = np.fromiter(
+                    (self._rows[mid] for mid in candidate_ids if mid in self._rows),
+                    dtype=np.intp
+                )
+                rows.sort()
+            elif len(self._rows) < len(self._ids):
+                rows = np.fromiter(self._rows.values(), dtype=np.intp, count=len(self._rows))
+                rows.sort()
+            else:
+                rows = None  # All committed rows
+            
+            ids, vectors, stats, exact = self._ids, self._vectors, self._stats, self._exact
+        
+        if rows is not None and len(rows) == 0:
+            return []
+        
+        # Stage 1: approximate distances over quantized rows
+        approx = self._approximate_distances(query, vectors, stats, rows)
+        row_ids = rows if rows is not None else np.arange(len(approx))
+        
+        n_candidates = min(len(approx), top_k * max(rerank_factor, 1))
+        if n_candidates < len(approx):
+            best = np.argpartition(approx, n_candidates - 1)[:n_candidates]
+        else:
+            best = np.arange(len(approx))
+        candidate_rows = np.sort(row_ids[best])
+        
+        # Stage 2: exact re-rank of the candidates
+        diff = exact[candidate_rows] - query
+        exact_distances = np.einsum('ij,ij->i', diff, diff)
+        order = np.argsort(exact_distances, kind='stable')[:top_k]
+        
+        return [
+            (ids[candidate_rows[i]], float(1.0 - exact_distances[i]))
+            for i in order
+        ]
+    
+    def refresh(self) -> None:
+        """Pick up rows and tombstones written by this or another process."""
+        with self._locked(exclusive=False):
+            self._sync()
+            self._map_files()
+    
+    def clear(self) -> None:
+        """Remove all embeddings and index files."""
+        with self._locked(exclusive=True):
+            self._vectors = self._stats = self._exact = None
+            for file_path in (
+                self._meta_path, self._vectors_path, self._stats_path,
+                self._exact_path, self._ids_path, self._deleted_path
+            ):
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            
+            self._reset()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get index size statistics."""
+        return {
+            'dtype': self.dtype,
+            'dimension': self.dimension,
+            'rows': len(self._ids),
+            'live_rows': len(self._rows),
+            'quantized_bytes': self._file_size(self._vectors_path),
+            'exact_bytes': self._file_size(self._exact_path)
+        }
+    
+    def _quantize(self, vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Quantize a vector, returning (quantized row, scale)."""
+        if self.dtype == 'float16':
+            return vector.astype(np.float16), 1.0
+        
+        # Symmetric per-row int8 quantization
+        max_abs = float(np.abs(vector).max()) if vector.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0 else 1.0
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return quantized, scale
+    
+    def _approximate_distances(
+        self,
+        query: np.ndarray,
+        vectors: np.ndarray,
+        stats: np.ndarray,
+        rows: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Squared L2 distances from query to quantized rows, chunk by chunk."""
+        n_rows = len(vectors) if rows is None else len(rows)
+        distances = np.empty(n_rows, dtype=np.float32)
+        query_norm = float(np.dot(query, query))
+        
+        for start in range(0, n_rows, SCAN_CHUNK_ROWS):
+            end = min(start + SCAN_CHUNK_ROWS, n_rows)
+            selector = slice(start, end) if rows is None else rows[start:end]
+            
+            chunk = vectors[selector].astype(np.float32)
+            scales = stats[selector, 0]
+            norms = stats[selector, 1]
+            
+            # |x - q|^2 = |x|^2 + |q|^2 - 2 * scale * (x_q . q)
+            distances[start:end] = norms + query_norm - 2.0 * scales * (chunk @ query)
+        
+        return distances
+    
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the thread lock and a shared or exclusive flock on index.lock."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            
+            with open(self._lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _reset(self) -> None:
+        """Forget everything read from the index files."""
+        self._vectors = self._stats = self._exact = None
+        self.dimension = None
+        self._ids = []
+        self._rows = {}
+        self._deleted = set()
+        self._ids_offset = 0
+        self._deleted_offset = 0
+        self._ids_inode = None
+    
+    def _sync(self) -> None:
+        """Read IDs and tombstones appended since the last sync (lock held)."""
+        try:
+            ids_inode = os.stat(self._ids_path).st_ino
+        except FileNotFoundError:
+            ids_inode = None
+        
+        # Files were rewritten by vacuum() or removed by clear()
+        if ids_inode != self._ids_inode and self._ids_offset:
+            self._reset()
+        self._ids_inode = ids_inode
+        
+        if self.dimension is None and os.path.exists(self._meta_path):
+            with open(self._meta_path, 'r') as f:
+                meta = json.load(f)
+            if meta['dtype'] != self.dtype:
+                raise ValueError(
+                    f"Index at {self.path} stores {meta['dtype']}, not {self.dtype}"
+                )
+            self.dimension = meta['dimension']
+        
+        if ids_inode is not None:
+            with open(self._ids_path, 'r') as f:
+                f.seek(self._ids_offset)
+                data = f.read()
+            # Ignore a trailing partial line left by a crashed writer
+            complete = data[:data.rfind('\n') + 1]
+            self._ids_offset += len(complete.encode())
+            for memory_id in complete.splitlines():
+                self._ids.append(memory_id)
+                if memory_id not in self._deleted:
+                    self._rows[memory_id] = len(self._ids) - 1
+        
+        if os.path.exists(self._deleted_path):
+            with open(self._deleted_path, 'r') as f:
+                f.seek(self._deleted_offset)
+                data = f.read()
+            complete = data[:data.rfind('\n') + 1]
+            self._deleted_offset += len(complete.encode())
+            for memory_id in complete.splitlines():
+                self._deleted.add(memory_id)
+                self._rows.pop(memory_id, None)
+    
+    def _map_files(self) -> None:
+        """Memory-map the committed rows of each data file read-only."""
+        n_rows = len(self._ids)
+        if n_rows == 0 or self.dimension is None:
+            self._vectors = self._stats = self._exact = None
+            return
+        
+        if self._vectors is not None and len(self._vectors) == n_rows:
+            return
+        
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=QUANTIZED_DTYPES[self.dtype],
+            mode='r', shape=(n_rows, self.dimension)
+        )
+        self._stats = np.memmap(
+            self._stats_path, dtype=np.float32, mode='r', shape=(n_rows, 2)
+        )
+        self._exact = np.memmap(
+            self._exact_path, dtype=np.float32, mode='r', shape=(n_rows, self.dimension)
+        )
+    
+    @staticmethod
+    def _write_at(file_path: str, offset: int, data: bytes) -> None:
+        """Write data at offset and truncate anything after it."""
+        with open(file_path, 'r+b' if os.path.exists(file_path) else 'wb') as f:
+            f.seek(offset)
+            f.write(data)
+            f.truncate()
+    
+    @staticmethod
+    def _file_size(file_path: str) -> int:
+        return os.path.getsize(file_path) if os.path.exists(file_path) else 0
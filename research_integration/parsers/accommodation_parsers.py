@@ -109,7 +109,7 @@ class OwnershipHurdlesParser(BaseParser):
         # Look for approval rate
         approval_keywords = ['approval rate', 'success rate', 'permit approval']
         approval_metric = self._find_metric(metrics, approval_keywords)
-        approval_rate = self._extract_numeric_value(approval_metric, 70.0) if approval_metric else 70.0
+        approval_rate = self._extract_numeric_value(approval_metric, 70.0, unit='%') if approval_metric else 70.0
 
         # Infer ownership type from overview
         overview = self._get_overview(research_doc).lower()
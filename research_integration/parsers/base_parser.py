@@ -5,18 +5,78 @@ and common utility methods.
 """
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
+import functools
 import logging
 
+from .metric_index import get_metric_index
+from .units import parse_quantity, convert
+
 logger = logging.getLogger(__name__)
 
 
+def _default_parse_store():
+    """Store of the shared research reader, or None if unavailable."""
+    try:
+        from research_system import get_research_reader
+        return get_research_reader().research_store
+    except Exception as e:
+        logger.debug(f"Parse cache unavailable: {e}")
+        return None
+
+
+def _memoize_parse(parse, parser_class):
+    """Wrap a parser class's parse() with the research store's parse cache.
+
+    Results are keyed by (parser class, PARSER_VERSION, document checksum),
+    so each document content is parsed once and then shared by every agent
+    and process reading the same store.
+    """
+    @functools.wraps(parse)
+    def cached_parse(self, research_doc):
+        checksum = (getattr(research_doc, 'metadata', None) or {}).get('checksum')
+        store = self._parse_store() if checksum and self.use_parse_cache else None
+        if store is None:
+            return parse(self, research_doc)
+
+        parser_key = f"{parser_class.__name__}-v{parser_class.PARSER_VERSION}"
+        result = store.load_parse_result(parser_key, checksum)
+        if result is None:
+            result = parse(self, research_doc)
+            if result:
+                store.save_parse_result(parser_key, checksum, result)
+        elif 'research_version' in result:
+            # Identical content can be stored under several versions
+            result['research_version'] = research_doc.version
+        return result
+
+    return cached_parse
+
+
 class BaseParser(ABC):
     """Abstract base class for research document parsers.
 
     Each parameter-specific parser inherits from this class and implements
     the parse() method to extract relevant metrics for that parameter.
+
+    parse() results are cached by document checksum in the research store.
+    Bump a parser's PARSER_VERSION whenever its output changes, so results
+    cached by older code are no longer used.
     """
 
+    # Version of this parser's output format and extraction logic
+    PARSER_VERSION = 2
+
+    # Store holding cached parse results (None: the shared research reader's)
+    parse_store = None
+
+    # Set False to always parse documents afresh
+    use_parse_cache = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'parse' in cls.__dict__:
+            cls.parse = _memoize_parse(cls.__dict__['parse'], cls)
+
     def __init__(self, parameter_name: str):
         """Initialize parser.
 
@@ -26,6 +86,10 @@ class BaseParser(ABC):
         self.parameter_name = parameter_name
         logger.debug(f"Initialized {self.__class__.__name__} for {parameter_name}")
 
+    def _parse_store(self):
+        """Research store used for the parse cache, or None."""
+        return self.parse_store if self.parse_store is not None else _default_parse_store()
+
     @abstractmethod
     def parse(self, research_doc) -> Dict[str, Any]:
         """Parse research document and extract parameter-specific metrics.
@@ -106,6 +170,8 @@ class BaseParser(ABC):
     ) -> Optional[Dict[str, Any]]:
         """Find first metric matching any of the keywords.
 
+        Case-insensitive lookups go through the document's shared MetricIndex.
+
         Args:
             metrics: List of metric dictionaries
             keywords: Keywords to search for in metric names
@@ -114,19 +180,12 @@ class BaseParser(ABC):
         Returns:
             First matching metric dictionary, or None if not found
         """
-        for metric in metrics:
-            if not isinstance(metric, dict):
-                continue
+        if not case_insensitive:
+            matches = self._scan_metrics(metrics, keywords)
+            return matches[0] if matches else None
 
-            metric_name = metric.get('metric', '')
-            if case_insensitive:
-                metric_name = metric_name.lower()
-                keywords = [kw.lower() for kw in keywords]
-
-            if any(kw in metric_name for kw in keywords):
-                return metric
-
-        return None
+        positions = get_metric_index(metrics).positions(keywords)
+        return metrics[positions[0]] if positions else None
 
     def _find_all_metrics(
         self,
@@ -144,34 +203,36 @@ class BaseParser(ABC):
         Returns:
             List of matching metric dictionaries
         """
-        matches = []
+        if not case_insensitive:
+            return self._scan_metrics(metrics, keywords)
 
-        for metric in metrics:
-            if not isinstance(metric, dict):
-                continue
+        return [metrics[position] for position in get_metric_index(metrics).positions(keywords)]
 
-            metric_name = metric.get('metric', '')
-            if case_insensitive:
-                metric_name = metric_name.lower()
-                search_keywords = [kw.lower() for kw in keywords]
-            else:
-                search_keywords = keywords
-
-            if any(kw in metric_name for kw in search_keywords):
-                matches.append(metric)
-
-        return matches
+    @staticmethod
+    def _scan_metrics(metrics: List[Dict[str, Any]], keywords: List[str]) -> List[Dict[str, Any]]:
+        """Case-sensitive substring scan of metric names."""
+        return [
+            metric for metric in metrics
+            if isinstance(metric, dict) and any(kw in metric.get('metric', '') for kw in keywords)
+        ]
 
     def _extract_numeric_value(
         self,
         metric: Dict[str, Any],
-        default: float = 0.0
+        default: float = 0.0,
+        unit: Optional[str] = None
     ) -> float:
         """Extract numeric value from metric.
 
+        Thousands separators, scale words ("4.5bn") and units in the value
+        or the metric's unit field are understood (see units.parse_quantity).
+
         Args:
             metric: Metric dictionary
             default: Default value if extraction fails
+            unit: Unit to express the value in (e.g. "GW", "MW", "TWh", "%").
+                Values with a unit of another kind give the default; values
+                without a known unit are returned as written.
 
         Returns:
             Numeric value or default
@@ -179,18 +240,21 @@ class BaseParser(ABC):
         if not metric:
             return default
 
-        value_str = metric.get('value', str(default))
-
-        try:
-            # Try direct float conversion
-            return float(value_str)
-        except (ValueError, TypeError):
-            # Try to extract number from string
-            import re
-            numbers = re.findall(r'-?\d+\.?\d*', str(value_str))
-            if numbers:
-                return float(numbers[0])
+        quantity = parse_quantity(metric.get('value', default), metric.get('unit'))
+        if quantity is None:
+            return default
+
+        if unit is None:
+            return quantity.value
+
+        value = convert(quantity, unit)
+        if value is None:
+            logger.debug(
+                f"{self.__class__.__name__}: metric '{metric.get('metric')}' is in "
+                f"{quantity.unit}, expected {unit}"
+            )
             return default
+        return value
 
     def _validate_parsed_data(self, data: Dict[str, Any]) -> bool:
         """Validate that parsed data has required fields.
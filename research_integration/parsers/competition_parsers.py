@@ -40,7 +40,7 @@ class OwnershipConsolidationParser(BaseParser):
         # Look for top 3 market share
         share_keywords = ['top 3', 'market share', 'concentration ratio']
         share_metric = self._find_metric(metrics, share_keywords)
-        top3_share = self._extract_numeric_value(share_metric, 50.0) if share_metric else 50.0
+        top3_share = self._extract_numeric_value(share_metric, 50.0, unit='%') if share_metric else 50.0
 
         # Look for number of players
         players_keywords = ['number of', 'players', 'competitors', 'participants']
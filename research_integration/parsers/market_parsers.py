@@ -37,22 +37,22 @@ class PowerMarketSizeParser(BaseParser):
         # Look for annual demand
         demand_keywords = ['annual demand', 'electricity demand', 'power demand', 'consumption', 'twh']
         demand_metric = self._find_metric(metrics, demand_keywords)
-        annual_demand = self._extract_numeric_value(demand_metric, 100.0) if demand_metric else 100.0
+        annual_demand = self._extract_numeric_value(demand_metric, 100.0, unit='TWh') if demand_metric else 100.0
 
         # Look for peak demand
         peak_keywords = ['peak demand', 'peak load', 'maximum demand']
         peak_metric = self._find_metric(metrics, peak_keywords)
-        peak_demand = self._extract_numeric_value(peak_metric, 20.0) if peak_metric else 20.0
+        peak_demand = self._extract_numeric_value(peak_metric, 20.0, unit='GW') if peak_metric else 20.0
 
         # Look for growth rate
         growth_keywords = ['growth', 'demand growth', 'increase']
         growth_metric = self._find_metric(metrics, growth_keywords)
-        demand_growth = self._extract_numeric_value(growth_metric, 3.0) if growth_metric else 3.0
+        demand_growth = self._extract_numeric_value(growth_metric, 3.0, unit='%') if growth_metric else 3.0
 
         # Look for per capita
         capita_keywords = ['per capita', 'per person', 'kwh per capita']
         capita_metric = self._find_metric(metrics, capita_keywords)
-        per_capita = self._extract_numeric_value(capita_metric, 5000.0) if capita_metric else 5000.0
+        per_capita = self._extract_numeric_value(capita_metric, 5000.0, unit='kWh') if capita_metric else 5000.0
 
         return self._create_base_response(
             research_doc,
@@ -99,11 +99,11 @@ class ResourceAvailabilityParser(BaseParser):
         # Look for capacity factors
         solar_cf_keywords = ['solar capacity factor', 'pv capacity factor']
         solar_cf_metric = self._find_metric(metrics, solar_cf_keywords)
-        solar_cf = self._extract_numeric_value(solar_cf_metric, 20.0) if solar_cf_metric else 20.0
+        solar_cf = self._extract_numeric_value(solar_cf_metric, 20.0, unit='%') if solar_cf_metric else 20.0
 
         wind_cf_keywords = ['wind capacity factor', 'wind cf']
         wind_cf_metric = self._find_metric(metrics, wind_cf_keywords)
-        wind_cf = self._extract_numeric_value(wind_cf_metric, 35.0) if wind_cf_metric else 35.0
+        wind_cf = self._extract_numeric_value(wind_cf_metric, 35.0, unit='%') if wind_cf_metric else 35.0
 
         return self._create_base_response(
             research_doc,
@@ -140,7 +140,7 @@ class EnergyDependenceParser(BaseParser):
         # Look for import dependency
         import_keywords = ['import', 'dependency', 'import dependency', 'net import']
         import_metric = self._find_metric(metrics, import_keywords)
-        import_dependency = self._extract_numeric_value(import_metric, 30.0) if import_metric else 30.0
+        import_dependency = self._extract_numeric_value(import_metric, 30.0, unit='%') if import_metric else 30.0
 
         # Look for security score
         security_keywords = ['energy security', 'security score', 'security index']
@@ -191,26 +191,26 @@ class RenewablesPenetrationParser(BaseParser):
         # Look for renewable share
         share_keywords = ['renewable share', 'renewables share', 'renewable penetration', 'green energy share']
         share_metric = self._find_metric(metrics, share_keywords)
-        renewable_share = self._extract_numeric_value(share_metric, 25.0) if share_metric else 25.0
+        renewable_share = self._extract_numeric_value(share_metric, 25.0, unit='%') if share_metric else 25.0
 
         # Look for total capacity
         capacity_keywords = ['renewable capacity', 'installed capacity', 'total capacity']
         capacity_metric = self._find_metric(metrics, capacity_keywords)
-        renewable_capacity = self._extract_numeric_value(capacity_metric, 50.0) if capacity_metric else 50.0
+        renewable_capacity = self._extract_numeric_value(capacity_metric, 50.0, unit='GW') if capacity_metric else 50.0
 
         # Look for growth rate
         growth_keywords = ['growth rate', 'annual growth', 'increase']
         growth_metric = self._find_metric(metrics, growth_keywords)
-        growth_rate = self._extract_numeric_value(growth_metric, 10.0) if growth_metric else 10.0
+        growth_rate = self._extract_numeric_value(growth_metric, 10.0, unit='%') if growth_metric else 10.0
 
         # Look for technology breakdown
         solar_keywords = ['solar share', 'solar percent', 'pv share']
         solar_metric = self._find_metric(metrics, solar_keywords)
-        solar_share = self._extract_numeric_value(solar_metric, 12.0) if solar_metric else 12.0
+        solar_share = self._extract_numeric_value(solar_metric, 12.0, unit='%') if solar_metric else 12.0
 
         wind_keywords = ['wind share', 'wind percent']
         wind_metric = self._find_metric(metrics, wind_keywords)
-        wind_share = self._extract_numeric_value(wind_metric, 13.0) if wind_metric else 13.0
+        wind_share = self._extract_numeric_value(wind_metric, 13.0, unit='%') if wind_metric else 13.0
 
         return self._create_base_response(
             research_doc,
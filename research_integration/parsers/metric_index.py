@@ -0,0 +1,207 @@
+"""Keyword index over research document metrics.
+
+Parsers look metrics up by keyword many times per document. Instead of
+lowercasing and substring-scanning every metric name for each lookup, a
+MetricIndex normalises the names once and scans each of them a single time
+with one precompiled matcher covering every keyword parsers have asked for.
+Lookups then only merge the matching positions of the requested keywords,
+so indexing is linear in document size and independent of lookup count.
+
+Indexes are shared by content: lists with the same metric names at the
+same positions use one index, and a list edited in place gets a new one.
+"""
+from collections import OrderedDict
+from typing import Dict, Any, List, Iterable, FrozenSet, Optional, Tuple
+import re
+import threading
+
+# Distinct metric name lists whose index is kept (parsers of one document share it)
+METRIC_INDEX_CACHE_SIZE = 256
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex matching the longest of the keywords at a position.
+
+    Alternatives are nested by common prefix, so the regex engine discards
+    most keywords after one character instead of trying each in turn.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Longer keywords are tried first; ending here is the fallback
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Precompiled multi-keyword matcher reporting every keyword in a text."""
+
+    def __init__(self, keywords: FrozenSet[str]):
+        """Compile a matcher.
+
+        Args:
+            keywords: Lowercase, non-empty keywords to match
+        """
+        self.keywords = keywords
+        # Zero-width lookahead finds matches starting at every position
+        self._pattern = re.compile('(?=(' + _trie_pattern(keywords) + '))') if keywords else None
+        # Keywords that are prefixes of a match start at the same position
+        self._prefixes = {
+            keyword: [keyword[:end] for end in range(1, len(keyword) + 1) if keyword[:end] in keywords]
+            for keyword in keywords
+        }
+
+    def find(self, text: str) -> List[str]:
+        """Keywords occurring anywhere in text (may repeat)."""
+        if self._pattern is None:
+            return []
+        found = []
+        for match in self._pattern.finditer(text):
+            found.extend(self._prefixes[match.group(1)])
+        return found
+
+
+class _KeywordVocabulary:
+    """Every keyword parsers have looked up, compiled into one matcher."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.matcher = KeywordMatcher(frozenset())
+
+    def covering(self, keywords: FrozenSet[str]) -> KeywordMatcher:
+        """Get a matcher for the vocabulary, first adding any new keywords."""
+        matcher = self.matcher
+        if keywords <= matcher.keywords:
+            return matcher
+        with self._lock:
+            if not keywords <= self.matcher.keywords:
+                self.matcher = KeywordMatcher(self.matcher.keywords | keywords)
+            return self.matcher
+
+
+_vocabulary = _KeywordVocabulary()
+
+
+# Keyword lists as given -> lowercase keyword sets (parser literals, so few)
+_normalized_keywords: Dict[tuple, FrozenSet[str]] = {}
+
+
+def _normalized(keywords: Iterable[str]) -> FrozenSet[str]:
+    """Lowercase keyword set, memoized per keyword list."""
+    key = tuple(keywords)
+    wanted = _normalized_keywords.get(key)
+    if wanted is None:
+        wanted = _normalized_keywords[key] = frozenset(keyword.lower() for keyword in key)
+    return wanted
+
+
+class MetricIndex:
+    """Lowercased metric names of one document, indexed by keyword."""
+
+    def __init__(self, metrics: List[Any]):
+        """Index a key_metrics list.
+
+        Args:
+            metrics: List of metric dictionaries (other items are ignored)
+        """
+        self.size = len(metrics)
+        self._names = [
+            (position, str(metric.get('metric') or '').lower())
+            for position, metric in enumerate(metrics)
+            if isinstance(metric, dict)
+        ]
+        # (keywords scanned for, keyword -> ascending metric positions)
+        self._state = (frozenset(), {})
+        self._lock = threading.Lock()
+
+    def positions(self, keywords: Iterable[str]) -> List[int]:
+        """Positions of metrics whose name contains any keyword (case-insensitive).
+
+        Args:
+            keywords: Keywords to search for in metric names
+
+        Returns:
+            Ascending metric positions
+        """
+        if not self._names:
+            return []
+
+        wanted = _normalized(keywords)
+        if '' in wanted:
+            # The empty string occurs in every name
+            return [position for position, _ in self._names]
+
+        scanned, postings = self._state
+        if not wanted <= scanned:
+            scanned, postings = self._scan(_vocabulary.covering(wanted))
+
+        hits = [postings[keyword] for keyword in wanted if keyword in postings]
+        if not hits:
+            return []
+        if len(hits) == 1:
+            return hits[0]
+        return sorted(set().union(*hits))
+
+    def _scan(self, matcher: KeywordMatcher):
+        """Match every name once against the whole vocabulary."""
+        with self._lock:
+            if matcher.keywords <= self._state[0]:
+                return self._state
+
+            postings: Dict[str, List[int]] = {}
+            for position, name in self._names:
+                for keyword in set(matcher.find(name)):
+                    postings.setdefault(keyword, []).append(position)
+
+            self._state = (matcher.keywords, postings)
+            return self._state
+
+
+# Metric names by position -> index
+_indexes: OrderedDict = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _content_key(metrics: List[Any]) -> Tuple[Optional[str], ...]:
+    """Metric names by position (None for non-dict items): all an index depends on."""
+    return tuple(
+        str(metric.get('metric') or '') if isinstance(metric, dict) else None
+        for metric in metrics
+    )
+
+
+def get_metric_index(metrics: List[Any]) -> MetricIndex:
+    """Get the shared index of a metrics list, building it on first use.
+
+    The cache is keyed by the metric names, so editing a list in place
+    (renaming, adding or removing metrics) never returns a stale index.
+
+    Args:
+        metrics: key_metrics list of a research document
+
+    Returns:
+        MetricIndex for the list
+    """
+    key = _content_key(metrics)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    index = MetricIndex(metrics)
+    with _indexes_lock:
+        _indexes[key] = index
+        _indexes.move_to_end(key)
+        # Oldest first: parsers finish with one document before the next
+        while len(_indexes) > METRIC_INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    return index
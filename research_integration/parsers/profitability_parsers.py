@@ -37,12 +37,12 @@ class ExpectedReturnParser(BaseParser):
         # Look for IRR
         irr_keywords = ['irr', 'internal rate of return', 'project irr']
         irr_metric = self._find_metric(metrics, irr_keywords)
-        irr_percent = self._extract_numeric_value(irr_metric, 8.0) if irr_metric else 8.0
+        irr_percent = self._extract_numeric_value(irr_metric, 8.0, unit='%') if irr_metric else 8.0
 
         # Look for ROE
         roe_keywords = ['roe', 'return on equity']
         roe_metric = self._find_metric(metrics, roe_keywords)
-        roe_percent = self._extract_numeric_value(roe_metric, 10.0) if roe_metric else 10.0
+        roe_percent = self._extract_numeric_value(roe_metric, 10.0, unit='%') if roe_metric else 10.0
 
         # Look for payback period
         payback_keywords = ['payback', 'payback period', 'recovery period']
@@ -89,17 +89,17 @@ class RevenueStreamStabilityParser(BaseParser):
         # Look for contract coverage
         coverage_keywords = ['contract coverage', 'contracted revenue', 'ppa coverage']
         coverage_metric = self._find_metric(metrics, coverage_keywords)
-        contract_coverage = self._extract_numeric_value(coverage_metric, 70.0) if coverage_metric else 70.0
+        contract_coverage = self._extract_numeric_value(coverage_metric, 70.0, unit='%') if coverage_metric else 70.0
 
         # Look for volatility
         volatility_keywords = ['volatility', 'revenue risk', 'price risk']
         volatility_metric = self._find_metric(metrics, volatility_keywords)
-        revenue_volatility = self._extract_numeric_value(volatility_metric, 15.0) if volatility_metric else 15.0
+        revenue_volatility = self._extract_numeric_value(volatility_metric, 15.0, unit='%') if volatility_metric else 15.0
 
         # Merchant exposure
         merchant_keywords = ['merchant', 'spot market', 'market exposure']
         merchant_metric = self._find_metric(metrics, merchant_keywords)
-        merchant_exposure = self._extract_numeric_value(merchant_metric, 30.0) if merchant_metric else 30.0
+        merchant_exposure = self._extract_numeric_value(merchant_metric, 30.0, unit='%') if merchant_metric else 30.0
 
         # PPA term
         term_keywords = ['ppa term', 'contract term', 'ppa duration']
@@ -155,7 +155,7 @@ class OfftakerStatusParser(BaseParser):
         # Look for default risk
         risk_keywords = ['default risk', 'credit risk', 'payment risk']
         risk_metric = self._find_metric(metrics, risk_keywords)
-        default_risk = self._extract_numeric_value(risk_metric, 5.0) if risk_metric else 5.0
+        default_risk = self._extract_numeric_value(risk_metric, 5.0, unit='%') if risk_metric else 5.0
 
         # Infer offtaker type from overview
         overview = self._get_overview(research_doc).lower()
@@ -203,17 +203,17 @@ class LongTermInterestRatesParser(BaseParser):
         # Look for benchmark rate (10-year government bond)
         benchmark_keywords = ['10-year', 'government bond', 'treasury', 'benchmark rate']
         benchmark_metric = self._find_metric(metrics, benchmark_keywords)
-        benchmark_rate = self._extract_numeric_value(benchmark_metric, 4.0) if benchmark_metric else 4.0
+        benchmark_rate = self._extract_numeric_value(benchmark_metric, 4.0, unit='%') if benchmark_metric else 4.0
 
         # Look for corporate bond rate
         corporate_keywords = ['corporate bond', 'corporate rate', 'investment grade']
         corporate_metric = self._find_metric(metrics, corporate_keywords)
-        corporate_rate = self._extract_numeric_value(corporate_metric, 5.0) if corporate_metric else 5.0
+        corporate_rate = self._extract_numeric_value(corporate_metric, 5.0, unit='%') if corporate_metric else 5.0
 
         # Look for inflation
         inflation_keywords = ['inflation', 'cpi', 'consumer price']
         inflation_metric = self._find_metric(metrics, inflation_keywords)
-        inflation_rate = self._extract_numeric_value(inflation_metric, 2.5) if inflation_metric else 2.5
+        inflation_rate = self._extract_numeric_value(inflation_metric, 2.5, unit='%') if inflation_metric else 2.5
 
         # Calculate real rate
         real_rate = benchmark_rate - inflation_rate
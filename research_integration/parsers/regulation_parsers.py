@@ -46,7 +46,7 @@ class AmbitionParser(BaseParser):
                 continue
 
             metric_name = metric.get('metric', '').lower()
-            value = self._extract_numeric_value(metric)
+            value = self._extract_numeric_value(metric, unit='GW')
 
             # Match metric to category
             if 'solar' in metric_name or 'pv' in metric_name:
@@ -180,7 +180,7 @@ class TrackRecordParser(BaseParser):
         # Look for completion rate
         completion_keywords = ['completion rate', 'success rate', 'project completion']
         completion_metric = self._find_metric(metrics, completion_keywords)
-        completion_rate = self._extract_numeric_value(completion_metric, 75.0) if completion_metric else 75.0
+        completion_rate = self._extract_numeric_value(completion_metric, 75.0, unit='%') if completion_metric else 75.0
 
         # Look for number of projects
         projects_keywords = ['projects completed', 'number of projects', 'project count']
@@ -190,7 +190,7 @@ class TrackRecordParser(BaseParser):
         # Look for capacity
         capacity_keywords = ['total capacity', 'installed capacity', 'capacity mw']
         capacity_metric = self._find_metric(metrics, capacity_keywords)
-        total_capacity_mw = self._extract_numeric_value(capacity_metric, 0) if capacity_metric else 0
+        total_capacity_mw = self._extract_numeric_value(capacity_metric, 0, unit='MW') if capacity_metric else 0
 
         # Look for construction time
         time_keywords = ['construction time', 'build time', 'development time']
@@ -301,7 +301,7 @@ class ContractTermsParser(BaseParser):
         # Look for escalation rate
         escalation_keywords = ['escalation', 'price increase', 'annual increase']
         escalation_metric = self._find_metric(metrics, escalation_keywords)
-        escalation_rate = self._extract_numeric_value(escalation_metric, 2.0) if escalation_metric else 2.0
+        escalation_rate = self._extract_numeric_value(escalation_metric, 2.0, unit='%') if escalation_metric else 2.0
 
         # Infer offtaker type from overview
         overview = self._get_overview(research_doc).lower()
@@ -0,0 +1,221 @@
+"""Numeric value and unit extraction for research metrics.
+
+Research metrics carry values as free text ("1.2 TW", "800 MW", "35%",
+"USD 4.5bn", "33,000") with an optional separate unit field ("GWh",
+"Billion USD", "% of power mix"). parse_quantity() reads the number, scale
+word and unit in one pass of a precompiled regex and normalises the value
+to a canonical unit:
+
+- power: GW
+- energy: TWh
+- shares and rates: %
+- money: USD (other currencies keep their code, scaled but not converted)
+
+Rates such as "USD/kWh" or "kWh per capita" and unknown units are returned
+as plain numbers with no canonical unit.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+import re
+
+# Written unit (lowercase, single-spaced) -> (canonical unit, factor to canonical)
+UNIT_FACTORS = {
+    'kw': ('GW', 1e-6),
+    'mw': ('GW', 1e-3),
+    'gw': ('GW', 1.0),
+    'tw': ('GW', 1e3),
+    'kwh': ('TWh', 1e-9),
+    'mwh': ('TWh', 1e-6),
+    'gwh': ('TWh', 1e-3),
+    'twh': ('TWh', 1.0),
+    'pwh': ('TWh', 1e3),
+    '%': ('%', 1.0),
+    'percent': ('%', 1.0),
+    'per cent': ('%', 1.0),
+    'pct': ('%', 1.0),
+    'percentage point': ('%', 1.0),
+    'percentage points': ('%', 1.0),
+    'bps': ('%', 0.01),
+    'basis points': ('%', 0.01),
+    'usd': ('USD', 1.0),
+    'us$': ('USD', 1.0),
+    '$': ('USD', 1.0),
+    'dollar': ('USD', 1.0),
+    'dollars': ('USD', 1.0),
+    'eur': ('EUR', 1.0),
+    '€': ('EUR', 1.0),
+    'euro': ('EUR', 1.0),
+    'euros': ('EUR', 1.0),
+    'gbp': ('GBP', 1.0),
+    '£': ('GBP', 1.0),
+    'inr': ('INR', 1.0),
+    '₹': ('INR', 1.0),
+    'cny': ('CNY', 1.0),
+    'jpy': ('JPY', 1.0),
+    'brl': ('BRL', 1.0),
+    'aud': ('AUD', 1.0),
+    'cad': ('CAD', 1.0),
+    'zar': ('ZAR', 1.0),
+}
+
+# Canonical units that are currencies
+CURRENCIES = {'USD', 'EUR', 'GBP', 'INR', 'CNY', 'JPY', 'BRL', 'AUD', 'CAD', 'ZAR'}
+
+# Scale words; the one-letter forms only count next to a currency ("$4.5m")
+SCALES = {
+    'thousand': 1e3,
+    'k': 1e3,
+    'million': 1e6,
+    'mn': 1e6,
+    'm': 1e6,
+    'billion': 1e9,
+    'bn': 1e9,
+    'b': 1e9,
+    'trillion': 1e12,
+    'tn': 1e12,
+}
+
+# Regex building blocks
+_CURRENCY = r'US\$|USD|EUR|GBP|INR|CNY|JPY|BRL|AUD|CAD|ZAR|[$€£₹]'
+_UNIT = (
+    r'(?:[kmgtp]wh|[kmgt]w|%|percentage\s+points?|percent|per\s+cent|pct|bps|basis\s+points'
+    r'|dollars?|euros?|' + _CURRENCY + r')(?![a-z])'
+)
+_SCALE = r'(?:thousand|million|billion|trillion|mn|bn|tn)(?![a-z])'
+_SHORT_SCALE = r'[kmb](?![a-z/²])'
+# "/" or "per" after the unit makes it a rate ("USD/kWh", "kWh per capita")
+_RATE = r'\s*(?:/|per\s+(?!cent))'
+
+_NUMBER = r'(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:e[-+]?\d+)?|\.\d+'
+
+# Number with its surrounding currency, scale and unit, e.g. "USD 4.5bn", "33,000 GWh".
+# In a range ("10-12 GW") the first number is taken with the unit after the range.
+_QUANTITY = re.compile(
+    r'(?P<currency>' + _CURRENCY + r')?\s*'
+    r'(?P<number>-?(?:' + _NUMBER + r'))'
+    r'(?:\s*(?:-|–|to)\s*(?:' + _NUMBER + r'))?'
+    r'\s*(?P<scale>' + _SCALE + '|' + _SHORT_SCALE + r')?'
+    r'\s*(?P<unit>' + _UNIT + r')?'
+    r'(?P<rate>' + _RATE + r')?',
+    re.IGNORECASE
+)
+
+# Separate unit field, e.g. "Billion USD", "USD Billion", "% of power mix", "EUR/MWh"
+_UNIT_FIELD = re.compile(
+    r'\s*(?P<scale>' + _SCALE + r')?'
+    r'\s*(?P<unit>' + _UNIT + r')?'
+    r'\s*(?P<scale_after>' + _SCALE + r')?'
+    r'(?P<rate>' + _RATE + r')?',
+    re.IGNORECASE
+)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+@dataclass(frozen=True)
+class Quantity:
+    """A numeric value, in its canonical unit when the unit is known."""
+    value: float
+    unit: Optional[str] = None  # GW, TWh, %, USD (or another currency code); None if unknown
+
+
+def _unit_factor(written: Optional[str]) -> Optional[Tuple[str, float]]:
+    """Look up a written unit's canonical unit and factor."""
+    if not written:
+        return None
+    return UNIT_FACTORS.get(_WHITESPACE.sub(' ', written.lower()))
+
+
+def _clean(value: float) -> float:
+    """Drop float noise introduced by unit factors (e.g. 0.30000000000000004)."""
+    return float(f"{value:.12g}")
+
+
+def parse_quantity(value: Any, unit: Optional[str] = None) -> Optional[Quantity]:
+    """Read the first number in a metric value, with its unit.
+
+    Args:
+        value: Metric value (number or text)
+        unit: The metric's separate unit field, used when the value has none
+
+    Returns:
+        Quantity, or None if the value contains no number
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return _parse(None, float(value), unit if isinstance(unit, str) else None)
+    return _parse(str(value), None, unit if isinstance(unit, str) else None)
+
+
+# Parsers of one document read the same values; quantities are immutable
+@lru_cache(maxsize=4096)
+def _parse(text: Optional[str], number: Optional[float], unit: Optional[str]) -> Optional[Quantity]:
+    """Parse a value given as text or as a number, with its unit field."""
+    scale, written, rate = 1.0, None, False
+    if text is not None:
+        match = _QUANTITY.search(text)
+        if match is None:
+            return None
+        number = float(match.group('number').replace(',', ''))
+        written = match.group('unit') or match.group('currency')
+        rate = match.group('rate') is not None
+        scale_word = (match.group('scale') or '').lower()
+        factor = _unit_factor(written)
+        if scale_word in ('k', 'm', 'b') and not (factor and factor[0] in CURRENCIES):
+            scale_word = ''
+        scale = SCALES.get(scale_word, 1.0)
+
+    if written is None and not rate and unit:
+        field = _UNIT_FIELD.match(unit)
+        written = field.group('unit')
+        rate = field.group('rate') is not None
+        if scale == 1.0:
+            scale = SCALES.get((field.group('scale') or field.group('scale_after') or '').lower(), 1.0)
+
+    factor = None if rate else _unit_factor(written)
+    if factor is None:
+        return Quantity(value=_clean(number * scale) if scale != 1.0 else number)
+
+    canonical, multiplier = factor
+    multiplier *= scale
+    return Quantity(
+        value=_clean(number * multiplier) if multiplier != 1.0 else number,
+        unit=canonical
+    )
+
+
+@lru_cache(maxsize=None)
+def _target_factor(target_unit: str) -> Tuple[str, float]:
+    """Canonical unit and factor of a target unit such as "MW" or "USD billion"."""
+    target = _UNIT_FIELD.match(target_unit)
+    factor = _unit_factor(target.group('unit'))
+    if factor is None:
+        raise ValueError(f"Unknown target unit: {target_unit}")
+    canonical, multiplier = factor
+    scale = SCALES.get((target.group('scale') or target.group('scale_after') or '').lower(), 1.0)
+    return canonical, multiplier * scale
+
+
+def convert(quantity: Quantity, target_unit: str) -> Optional[float]:
+    """Express a quantity in a target unit.
+
+    Quantities without a known unit are returned unchanged, as the number
+    was written.
+
+    Args:
+        quantity: Parsed quantity
+        target_unit: Unit such as "GW", "MW", "TWh", "%", "USD" or "USD billion"
+
+    Returns:
+        Value in the target unit, or None if the quantity's unit is of
+        another kind (e.g. a percentage when GW is wanted)
+    """
+    if quantity.unit is None:
+        return quantity.value
+
+    canonical, multiplier = _target_factor(target_unit)
+    if canonical != quantity.unit:
+        return None
+    return _clean(quantity.value / multiplier) if multiplier != 1.0 else quantity.value
@@ -0,0 +1,373 @@
+"""Throughput benchmark for the research parsers.
+
+Loads every research document under research_system/data/research_documents
+(latest version of each parameter-country combination, or every version
+with --all-versions) and runs each registered parser repeatedly over the
+documents of its parameter (every document with --all-documents). For each
+parser, and for the whole corpus parsed by its parameters' parsers
+('ALL PARSERS'), it reports:
+1. documents per second
+2. per-document latency percentiles (p50/p95/p99)
+3. allocations per document: peak traced memory and memory blocks still
+   allocated after the parse (tracemalloc, measured in a separate pass)
+
+The parse-result cache is disabled so parsing itself is measured; pass
+--parse-cache to benchmark cached lookups instead. The metric index and
+parsed-quantity caches are cleared before every timed parse, so each parse
+sees its document as new, as in a real run; pass --warm-caches to keep them.
+
+Results are written as JSON. --save-baseline stores them as the local
+baseline file (not versioned: numbers depend on the machine); later runs
+compare against it and exit non-zero when a parser's throughput drops by
+more than --max-regression percent plus the round-to-round spread of the
+two runs. Only compare runs made on the same, otherwise idle machine.
+
+Usage:
+    python research_integration/scripts/benchmark_parsers.py
+    python research_integration/scripts/benchmark_parsers.py --save-baseline
+    python research_integration/scripts/benchmark_parsers.py --parsers Ambition "Track Record"
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from research_integration.parsers import PARSER_REGISTRY, BaseParser, metric_index, units
+from research_system.src.storage.research_store import ResearchStore
+
+
+DEFAULT_SOURCE = 'research_system/data/research_documents'
+DEFAULT_ITERATIONS = 50
+DEFAULT_REPEAT = 5
+DEFAULT_OUTPUT = 'parser_benchmark_results.json'
+DEFAULT_BASELINE = 'research_integration/scripts/parser_benchmark_baseline.json'
+
+# Throughput drop (percent) against the baseline that fails the run
+DEFAULT_MAX_REGRESSION = 20.0
+
+ALL_PARSERS = 'ALL PARSERS'
+
+
+def percentile(sorted_samples: List[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile of sorted samples."""
+    if not sorted_samples:
+        return None
+    rank = (len(sorted_samples) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_samples) - 1)
+    return sorted_samples[low] + (sorted_samples[high] - sorted_samples[low]) * (rank - low)
+
+
+def latency_summary(samples_ms: List[float], total_s: float) -> Dict[str, Any]:
+    """Summarize per-document latency samples."""
+    samples = sorted(samples_ms)
+    return {
+        'parses': len(samples),
+        'total_s': total_s,
+        'docs_per_s': len(samples) / total_s if total_s > 0 else None,
+        'mean_ms': sum(samples) / len(samples) if samples else None,
+        'p50_ms': percentile(samples, 50),
+        'p95_ms': percentile(samples, 95),
+        'p99_ms': percentile(samples, 99),
+        'max_ms': samples[-1] if samples else None
+    }
+
+
+def load_corpus(source: str, all_versions: bool) -> List[Any]:
+    """Load research documents from a directory-layout store."""
+    store = ResearchStore(base_path=source, document_cache_size=0)
+    documents = []
+    for item in store.list_all_research():
+        if all_versions:
+            versions = [m.version for m in store.get_version_history(item['parameter'], item['country'])]
+        else:
+            versions = [None]
+        for version in versions:
+            doc = store.load(item['parameter'], item['country'], version)
+            if doc is not None:
+                documents.append(doc)
+    return documents
+
+
+def clear_value_caches() -> None:
+    """Drop cached metric indexes and parsed quantities, as for unseen documents."""
+    with metric_index._indexes_lock:
+        metric_index._indexes.clear()
+    units._parse.cache_clear()
+
+
+def measure_latency(
+    jobs: List[Tuple[BaseParser, Any]],
+    iterations: int,
+    repeat: int = 1,
+    warm_caches: bool = False
+) -> Dict[str, Any]:
+    """Time each (parser, document) parse over repeated rounds.
+
+    As with timeit, garbage collection is paused while timing and throughput
+    is taken from the fastest round, which is the least disturbed by other
+    load on the machine. Latency percentiles cover every round. Unless
+    warm_caches is set, value caches are cleared (untimed) before each parse.
+    """
+    samples = []
+    rounds = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            elapsed = 0.0
+            for _ in range(iterations):
+                for parser, doc in jobs:
+                    if not warm_caches:
+                        clear_value_caches()
+                    t0 = time.perf_counter()
+                    parser.parse(doc)
+                    t1 = time.perf_counter()
+                    elapsed += t1 - t0
+                    samples.append((t1 - t0) * 1000)
+            rounds.append(elapsed)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    summary = {'documents': len(jobs)}
+    summary.update(latency_summary(samples, sum(rounds)))
+    fastest = min(rounds)
+    summary['docs_per_s'] = len(jobs) * iterations / fastest if fastest > 0 else None
+    # How far the slowest round trailed the fastest: the run's own noise
+    summary['spread_pct'] = (max(rounds) - fastest) / fastest * 100 if fastest > 0 else None
+    return summary
+
+
+def measure_allocations(jobs: List[Tuple[BaseParser, Any]], warm_caches: bool = False) -> Dict[str, Any]:
+    """Trace memory allocated by each (parser, document) parse, once."""
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    try:
+        for parser, doc in jobs:
+            if not warm_caches:
+                clear_value_caches()
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+            result = parser.parse(doc)
+            peaks.append(tracemalloc.get_traced_memory()[1] - traced_before)
+            after = tracemalloc.take_snapshot()
+            blocks.append(sum(
+                stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0
+            ))
+            del result
+    finally:
+        tracemalloc.stop()
+
+    count = len(jobs) or 1
+    return {
+        'peak_bytes_per_doc': sum(peaks) / count,
+        'max_peak_bytes': max(peaks) if peaks else 0,
+        'blocks_per_doc': sum(blocks) / count
+    }
+
+
+def benchmark(
+    documents: List[Any],
+    parser_names: List[str],
+    iterations: int,
+    repeat: int,
+    all_documents: bool,
+    trace_allocations: bool,
+    warm_caches: bool = False
+) -> Dict[str, Any]:
+    """Benchmark each parser, then the corpus as a whole."""
+    parsers = {name: PARSER_REGISTRY[name]() for name in parser_names}
+    groups = []
+    for name, parser in parsers.items():
+        # Stored parameter names are title-cased ("Status Of Grid")
+        jobs = [(parser, doc) for doc in documents if all_documents or doc.parameter.lower() == name.lower()]
+        if jobs:
+            groups.append((name, jobs))
+    groups.append((ALL_PARSERS, [job for _, jobs in groups for job in jobs]))
+
+    results: Dict[str, Any] = {}
+    for name, jobs in groups:
+        # Warm-up pass: imports, compiled patterns and keyword matchers
+        measure_latency(jobs, 1, warm_caches=warm_caches)
+
+        result = measure_latency(jobs, iterations, repeat, warm_caches)
+        if trace_allocations:
+            result.update(measure_allocations(jobs, warm_caches))
+        results[name] = result
+
+        line = (
+            f"  {name:28} {result['docs_per_s']:>10,.0f} docs/s"
+            f"  p50 {result['p50_ms'] * 1000:7.1f}us  p95 {result['p95_ms'] * 1000:7.1f}us"
+            f"  p99 {result['p99_ms'] * 1000:7.1f}us"
+        )
+        if trace_allocations:
+            line += f"  {result['peak_bytes_per_doc'] / 1024:6.1f} KiB  {result['blocks_per_doc']:6.1f} blocks"
+        print(line)
+
+    return results
+
+
+# Metadata that must match for results to be comparable
+COMPARABLE_SETTINGS = ('source', 'all_versions', 'all_documents', 'parse_cache', 'warm_caches')
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline_path: str, max_regression: float) -> int:
+    """Print throughput and p95 changes relative to the baseline.
+
+    A parser regresses when its throughput drops by more than max_regression
+    plus the larger round-to-round spread of the two runs, so a noisy run
+    needs a bigger drop to fail.
+
+    Returns:
+        Number of parsers whose throughput regressed beyond max_regression
+    """
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+
+    print(f"\n{'=' * 70}")
+    print(f"  Comparison with {baseline_path}")
+    print(f"{'=' * 70}")
+
+    differing = [
+        key for key in COMPARABLE_SETTINGS
+        if report['metadata'].get(key) != baseline['metadata'].get(key)
+    ]
+    if differing:
+        print(f"  ⚠️  Not compared: baseline was run with different {', '.join(differing)}")
+        return 0
+
+    results = report['results']
+    previous_results = baseline['results']
+    if set(results) != set(previous_results):
+        # The corpus total depends on which parsers ran
+        results = {name: result for name, result in results.items() if name != ALL_PARSERS}
+
+    regressions = 0
+    for name, current in results.items():
+        previous = previous_results.get(name)
+        if not previous or not previous.get('docs_per_s') or not current.get('docs_per_s'):
+            continue
+
+        throughput_change = (current['docs_per_s'] - previous['docs_per_s']) / previous['docs_per_s'] * 100
+        changes = [f"docs/s {throughput_change:+.1f}%"]
+        if current.get('p95_ms') and previous.get('p95_ms'):
+            changes.append(f"p95 {(current['p95_ms'] - previous['p95_ms']) / previous['p95_ms'] * 100:+.1f}%")
+
+        noise = max(current.get('spread_pct') or 0.0, previous.get('spread_pct') or 0.0)
+        if noise:
+            changes.append(f"noise ±{noise:.1f}%")
+
+        flag = ''
+        if throughput_change < -(max_regression + noise):
+            regressions += 1
+            flag = '  ❌ REGRESSION'
+        print(f"  {name:28} {', '.join(changes)}{flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the research parsers')
+    parser.add_argument('--source', default=DEFAULT_SOURCE,
+                        help='Directory-layout research store to load')
+    parser.add_argument('--all-versions', action='store_true',
+                        help='Parse every stored version, not only the latest')
+    parser.add_argument('--all-documents', action='store_true',
+                        help="Run every parser over every document, not only its parameter's")
+    parser.add_argument('--parsers', nargs='+', default=None,
+                        help='Parameter names to benchmark (default: all registered)')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help='Passes over the corpus per timed round')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Timed rounds per parser; throughput is from the fastest')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='Keep the parse-result cache enabled')
+    parser.add_argument('--warm-caches', action='store_true',
+                        help='Keep metric index and quantity caches between parses')
+    parser.add_argument('--no-allocations', action='store_true',
+                        help='Skip the tracemalloc allocation pass')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help='Path for JSON results')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='Baseline results JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Write these results to the baseline file')
+    parser.add_argument('--max-regression', type=float, default=DEFAULT_MAX_REGRESSION,
+                        help='Throughput drop (percent) beyond run noise that fails the comparison')
+    args = parser.parse_args()
+
+    # Parsers log a warning for every document missing a metric
+    logging.basicConfig(level=logging.ERROR)
+
+    parser_names = args.parsers or list(PARSER_REGISTRY)
+    unknown = [name for name in parser_names if name not in PARSER_REGISTRY]
+    if unknown:
+        print(f"❌ Unknown parsers: {', '.join(unknown)}")
+        return 1
+
+    BaseParser.use_parse_cache = args.parse_cache
+
+    documents = load_corpus(args.source, args.all_versions)
+    if not documents:
+        print(f"❌ No research documents found in {args.source}")
+        return 1
+    print(f"Loaded {len(documents)} research documents from {args.source}")
+    print(f"{len(parser_names)} parsers × {args.repeat} rounds × {args.iterations} iterations\n")
+
+    results = benchmark(
+        documents, parser_names, args.iterations, args.repeat, args.all_documents,
+        not args.no_allocations, args.warm_caches
+    )
+
+    report = {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'source': args.source,
+            'documents': len(documents),
+            'all_versions': args.all_versions,
+            'all_documents': args.all_documents,
+            'iterations': args.iterations,
+            'repeat': args.repeat,
+            'parse_cache': args.parse_cache,
+            'warm_caches': args.warm_caches
+        },
+        'results': results
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+
+    if args.save_baseline:
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Baseline written to {args.baseline}")
+        return 0
+
+    if Path(args.baseline).exists():
+        regressions = compare_to_baseline(report, args.baseline, args.max_regression)
+        if regressions:
+            print(f"\n❌ {regressions} parsers slower than the baseline by more than {args.max_regression:.0f}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
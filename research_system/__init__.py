@@ -6,7 +6,8 @@ research documents for renewable energy investment parameters.
 
 from .src import (
     ResearchOrchestrator,
-    ResearchAgent,
+    ResearchReader,
+    get_research_reader,
     ResearchStore,
     ResearchDocument,
     PromptGenerator,
@@ -19,6 +20,8 @@ __version__ = '1.0.0'
 
 __all__ = [
     'ResearchOrchestrator',
+    'ResearchReader',
+    'get_research_reader',
     'ResearchAgent',
     'ResearchStore',
     'ResearchDocument',
@@ -27,3 +30,11 @@ __all__ = [
     'VersionStrategy',
     'ChangeType',
 ]
+
+
+def __getattr__(name):
+    # Loaded lazily, see research_system.src
+    if name == 'ResearchAgent':
+        from .src import ResearchAgent
+        return ResearchAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Export stored research to an NDJSON or Parquet dataset for analytics
+
+Walks the configured research store once and writes one record per document
+(metadata, scores, sections, key metrics and sources). The format follows the
+output file extension: .ndjson/.jsonl, or .parquet (requires pip install
+pyarrow).
+
+Usage:
+    python research_system/export_research_dataset.py research.ndjson
+    python research_system/export_research_dataset.py research.parquet --all-versions
+    python research_system/export_research_dataset.py new.ndjson --since 2026-01-01 --parameters Ambition "Track Record"
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)-8s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+from research_system.src.research_reader import DEFAULT_CONFIG_PATH, load_research_config, create_research_store
+from research_system.src.storage import ResearchExporter
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Export stored research to NDJSON or Parquet")
+    parser.add_argument('output', help='Output file (.ndjson, .jsonl or .parquet)')
+    parser.add_argument('--format', choices=['ndjson', 'parquet'], default=None,
+                        help='Output format (default: from the file extension)')
+    parser.add_argument('--config', default=DEFAULT_CONFIG_PATH,
+                        help='Research configuration (selects the store)')
+    parser.add_argument('--parameters', nargs='+', default=None,
+                        help='Parameters to export (default: all)')
+    parser.add_argument('--countries', nargs='+', default=None,
+                        help='Countries to export (default: all)')
+    parser.add_argument('--since', default=None,
+                        help='Only versions created at or after this ISO date')
+    parser.add_argument('--until', default=None,
+                        help='Only versions created before this ISO date')
+    parser.add_argument('--all-versions', action='store_true',
+                        help='Export every stored version, not only the latest')
+    args = parser.parse_args()
+
+    store = create_research_store(load_research_config(args.config))
+    exporter = ResearchExporter(
+        store,
+        parameters=args.parameters,
+        countries=args.countries,
+        since=args.since,
+        until=args.until,
+        all_versions=args.all_versions
+    )
+
+    try:
+        stats = exporter.export(args.output, format=args.format)
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\n✅ Exported {stats['documents']} documents to {stats['path']} ({stats['format']}) "
+          f"in {stats['seconds']:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,9 +19,8 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime
-import time
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -142,10 +141,15 @@ def generate_batch(
     countries: List[str],
     period: str,
     use_cache: bool = False,
-    skip_existing: bool = True
+    skip_existing: bool = True,
+    max_workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None
 ) -> Dict[str, Any]:
     """Generate research for all parameter-country combinations.
 
+    Combinations run concurrently on the orchestrator's batch engine. With a
+    checkpoint, an interrupted run picks up where it stopped.
+
     Args:
         orchestrator: Research orchestrator
         parameters: List of parameters to generate research for
@@ -153,11 +157,12 @@ def generate_batch(
         period: Time period
         use_cache: Whether to use cached research (False = force new)
         skip_existing: Skip if research already exists
+        max_workers: Concurrent generations (default: batch.max_workers)
+        checkpoint_path: Progress file for resuming (None disables)
 
     Returns:
         Dictionary with results and statistics
     """
-    total_count = len(parameters) * len(countries)
     results = {
         'successful': [],
         'failed': [],
@@ -171,78 +176,68 @@ def generate_batch(
     print(" BATCH GENERATION STARTED")
     print("=" * 80 + "\n")
 
-    current = 0
-
-    for param in parameters:
-        param_name = param['name']
-        param_key = param['key']
-        subcat = param['subcategory']
-
-        print(f"\n{'─' * 80}")
-        print(f" 📌 PARAMETER: {param_name} ({subcat})")
-        print(f"{'─' * 80}\n")
-
-        for country in countries:
-            current += 1
-
-            print(f"[{current}/{total_count}] {country:20s} ", end="", flush=True)
-
-            try:
-                # Check if exists and skip_existing is True
-                if skip_existing:
-                    existing = orchestrator.research_store.load(param_name, country)
-                    if existing and orchestrator.research_store.is_cache_valid(param_name, country):
-                        print("⏭️  SKIPPED (exists)")
-                        results['skipped'].append({
-                            'parameter': param_name,
-                            'country': country,
-                            'version': existing.version
-                        })
-                        continue
-
-                # Generate research
-                start_time = time.time()
-                doc = orchestrator.get_research(
-                    parameter=param_name,
-                    country=country,
-                    period=period,
-                    use_cache=use_cache
-                )
-                elapsed = time.time() - start_time
-
-                # Get quality grade
-                grade = doc.content.get('_validation', {}).get('grade', 'N/A')
-
-                # Extract cost from metadata
-                metadata = doc.content.get('_metadata', {})
-                cost = metadata.get('cost_usd', 0.0)
-                tokens = metadata.get('total_tokens', 0)
-
-                results['total_cost'] += cost
-                results['total_tokens'] += tokens
-
-                print(f"✅ SUCCESS (v{doc.version}, Grade: {grade}, {elapsed:.1f}s, ${cost:.4f})")
-
-                results['successful'].append({
-                    'parameter': param_name,
-                    'country': country,
-                    'version': doc.version,
-                    'grade': grade,
-                    'elapsed': elapsed,
-                    'cost': cost,
-                    'tokens': tokens
-                })
-
-                # Small delay to avoid rate limits
-                time.sleep(0.5)
-
-            except Exception as e:
-                print(f"❌ FAILED: {str(e)[:60]}")
-                results['failed'].append({
-                    'parameter': param_name,
-                    'country': country,
-                    'error': str(e)
-                })
+    def on_result(item, progress):
+        """Record and print one finished combination."""
+        line = f"[{progress.done}/{progress.total}] {item.parameter:30s} {item.country:20s} "
+        rate = f"| {progress.throughput_per_minute:.1f} docs/min"
+        eta = progress.eta_seconds
+        if eta is not None:
+            rate += f", ETA {eta / 60:.0f}m"
+
+        if item.status == 'failed':
+            print(f"{line}❌ FAILED: {item.error[:60]} {rate}")
+            results['failed'].append({
+                'parameter': item.parameter,
+                'country': item.country,
+                'error': item.error
+            })
+            return
+
+        if item.status == 'resumed' or (item.status == 'cached' and skip_existing):
+            existing = item.result or orchestrator.research_store.load(item.parameter, item.country)
+            label = "RESUMED (checkpoint)" if item.status == 'resumed' else "SKIPPED (exists)"
+            print(f"{line}⏭️  {label} {rate}")
+            results['skipped'].append({
+                'parameter': item.parameter,
+                'country': item.country,
+                'version': existing.version if existing else None
+            })
+            return
+
+        doc = item.result
+
+        # Get quality grade
+        grade = doc.content.get('_validation', {}).get('grade', 'N/A')
+
+        # Extract cost from metadata
+        metadata = doc.content.get('_metadata', {})
+        cost = metadata.get('cost_usd', 0.0)
+        tokens = metadata.get('total_tokens', 0)
+
+        results['total_cost'] += cost
+        results['total_tokens'] += tokens
+
+        print(f"{line}✅ SUCCESS (v{doc.version}, Grade: {grade}, {item.elapsed:.1f}s, ${cost:.4f}) {rate}")
+
+        results['successful'].append({
+            'parameter': item.parameter,
+            'country': item.country,
+            'version': doc.version,
+            'grade': grade,
+            'elapsed': item.elapsed,
+            'cost': cost,
+            'tokens': tokens
+        })
+
+    orchestrator.run_batch(
+        parameters=[param['name'] for param in parameters],
+        countries=countries,
+        period=period,
+        use_cache=use_cache or skip_existing,
+        max_workers=max_workers,
+        checkpoint_path=checkpoint_path,
+        on_result=on_result
+    )
 
     results['end_time'] = datetime.now()
     results['duration'] = results['end_time'] - results['start_time']
@@ -389,7 +384,8 @@ def main():
         print(f"❌ Failed to initialize orchestrator: {e}")
         return 1
 
-    # Generate batch
+    # Generate batch (resumes from the checkpoint if a previous run was interrupted)
+    checkpoint_path = orchestrator.config.get('batch', {}).get('checkpoint_path')
     try:
         results = generate_batch(
             orchestrator=orchestrator,
@@ -397,9 +393,14 @@ def main():
             countries=countries,
             period=period,
             use_cache=False,  # Force new generation
-            skip_existing=True  # Skip if valid cache exists
+            skip_existing=True,  # Skip if valid cache exists
+            checkpoint_path=checkpoint_path
         )
 
+        # A clean run needs nothing resumed next time
+        if checkpoint_path and not results['failed']:
+            Path(checkpoint_path).unlink(missing_ok=True)
+
         # Print summary
         print_summary(results)
 
@@ -429,7 +430,7 @@ def main():
 
     except KeyboardInterrupt:
         print("\n\n⚠️  Batch generation interrupted by user.")
-        print("   Partial results may be saved.\n")
+        print("   Finished documents are saved; rerun to resume from the checkpoint.\n")
         return 1
 
     except Exception as e:
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Migrate research documents from the directory layout into a pack file
+
+Copies every version under research_system/data/research_documents into a
+PackedResearchStore (research.pack + research.idx) and, unless --no-verify is
+given, checks that every version loads to an identical ResearchDocument from
+both stores.
+
+Usage:
+    python research_system/migrate_research_store.py
+    python research_system/migrate_research_store.py --source path/to/docs --dest path/to/pack
+
+To read from the pack afterwards, set in research_config.yaml:
+    storage:
+      backend: packed
+      pack_path: ./research_system/data/research_pack
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s | %(levelname)-8s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+from research_system.src.storage import ResearchStore, PackedResearchStore
+
+
+def verify(source: ResearchStore, dest: PackedResearchStore) -> int:
+    """Compare every version loaded from both stores.
+
+    Returns:
+        Number of mismatching versions
+    """
+    mismatches = 0
+    for item in source.list_all_research():
+        parameter, country = item['parameter'], item['country']
+        for metadata in source.get_version_history(parameter, country):
+            expected = source.load(parameter, country, metadata.version)
+            actual = dest.load(parameter, country, metadata.version)
+            if actual is None or expected.to_dict() != actual.to_dict():
+                print(f"❌ Mismatch: {parameter}/{country} v{metadata.version}")
+                mismatches += 1
+    return mismatches
+
+
+def main():
+    """Main execution."""
+    parser = argparse.ArgumentParser(description="Migrate research documents into a pack file")
+    parser.add_argument('--source', default='research_system/data/research_documents',
+                        help='Directory-layout research store')
+    parser.add_argument('--dest', default='research_system/data/research_pack',
+                        help='Directory for research.pack and research.idx')
+    parser.add_argument('--no-verify', action='store_true',
+                        help='Skip comparing documents after migration')
+    args = parser.parse_args()
+
+    if not Path(args.source).is_dir():
+        print(f"❌ Source not found: {args.source}")
+        return 1
+
+    start = time.time()
+    dest = PackedResearchStore(base_path=args.dest)
+    stats = dest.import_directory(args.source)
+    elapsed = time.time() - start
+
+    print(f"\n✅ Imported {stats['imported']} versions ({stats['skipped']} skipped) in {elapsed:.1f}s")
+    print(f"   Pack: {dest.pack_path} ({dest.pack_path.stat().st_size / (1024 * 1024):.2f} MB)"
+          if dest.pack_path.exists() else f"   Pack: {dest.pack_path} (empty)")
+
+    if not args.no_verify:
+        mismatches = verify(ResearchStore(base_path=args.source), dest)
+        if mismatches:
+            print(f"\n❌ {mismatches} versions differ between source and pack")
+            return 1
+        print("✅ All versions load identically from the pack")
+
+    dest.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
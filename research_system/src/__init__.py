@@ -2,6 +2,7 @@
 
 Main Components:
 - ResearchOrchestrator: High-level API for research generation
+- ResearchReader: Shared read-only access to stored research for agents
 - ResearchAgent: LLM-powered research conductor
 - ResearchStore: Versioned document storage
 - PromptGenerator: Parameter-specific prompt generation
@@ -24,7 +25,7 @@ Example Usage:
 """
 
 from .research_orchestrator import ResearchOrchestrator
-from .research_agent import ResearchAgent
+from .research_reader import ResearchReader, get_research_reader
 from .storage.research_store import ResearchStore, ResearchDocument
 from .prompt_generator import PromptGenerator
 from .version_manager import VersionManager, VersionStrategy, ChangeType
@@ -33,6 +34,8 @@ __version__ = '1.0.0'
 
 __all__ = [
     'ResearchOrchestrator',
+    'ResearchReader',
+    'get_research_reader',
     'ResearchAgent',
     'ResearchStore',
     'ResearchDocument',
@@ -41,3 +44,11 @@ __all__ = [
     'VersionStrategy',
     'ChangeType',
 ]
+
+
+def __getattr__(name):
+    # ResearchAgent pulls in the LLM provider SDKs; import it on first access
+    if name == 'ResearchAgent':
+        from .research_agent import ResearchAgent
+        return ResearchAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
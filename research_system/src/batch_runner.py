@@ -0,0 +1,325 @@
+"""Batch Runner - Concurrent, resumable execution of research batches
+
+Runs parameter-country tasks on a bounded thread pool with:
+- A shared requests-per-minute limiter for LLM calls
+- A JSON checkpoint so an interrupted run resumes where it stopped
+- Live progress and throughput reporting
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from collections import deque
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Concurrent research tasks per batch
+DEFAULT_MAX_WORKERS = 4
+
+# Default LLM request budget (matches llm.max_requests_per_minute)
+DEFAULT_MAX_REQUESTS_PER_MINUTE = 20
+
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter on requests per minute."""
+
+    def __init__(self, max_requests_per_minute: int = DEFAULT_MAX_REQUESTS_PER_MINUTE):
+        """Initialize rate limiter.
+
+        Args:
+            max_requests_per_minute: Requests allowed in any 60 second window
+        """
+        self.max_requests_per_minute = max(1, max_requests_per_minute)
+        self._request_times: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a request may be made, then record it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._request_times and self._request_times[0] <= now - 60:
+                    self._request_times.popleft()
+
+                if len(self._request_times) < self.max_requests_per_minute:
+                    self._request_times.append(now)
+                    if waited > 0:
+                        logger.debug(f"Rate limiter released after {waited:.1f}s")
+                    return waited
+
+                wait_time = 60 - (now - self._request_times[0])
+
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one parameter-country task."""
+    parameter: str
+    country: str
+    status: str  # completed, cached, failed or resumed (done in an earlier run)
+    result: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Batch key "parameter|country"."""
+        return f"{self.parameter}|{self.country}"
+
+
+@dataclass
+class BatchProgress:
+    """Live progress of a batch run."""
+    total: int
+    done: int = 0
+    completed: int = 0
+    cached: int = 0
+    failed: int = 0
+    resumed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput_per_minute(self) -> float:
+        """Tasks finished per minute in this run (resumed tasks excluded)."""
+        finished = self.done - self.resumed
+        elapsed = self.elapsed_seconds
+        return finished * 60 / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until the run finishes."""
+        rate = self.throughput_per_minute
+        if rate <= 0:
+            return None
+        return (self.total - self.done) * 60 / rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data.pop('started_at')
+        data['elapsed_seconds'] = self.elapsed_seconds
+        data['throughput_per_minute'] = self.throughput_per_minute
+        data['eta_seconds'] = self.eta_seconds
+        return data
+
+
+class BatchCheckpoint:
+    """Persistent record of finished batch tasks.
+
+    The checkpoint is a JSON file rewritten atomically after every task.
+    A checkpoint written for a different context (e.g. another period) is
+    ignored so stale progress never skips work.
+    """
+
+    def __init__(self, path: str, context: Optional[Dict[str, Any]] = None):
+        """Initialize checkpoint, loading previous progress if present.
+
+        Args:
+            path: Checkpoint file path
+            context: Run settings the checkpoint must match to be resumed
+        """
+        self.path = Path(path)
+        self.context = context or {}
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.failed: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                if data.get('context', {}) == self.context:
+                    self.completed = data.get('completed', {})
+                    self.failed = data.get('failed', {})
+                    logger.info(
+                        f"Resuming from checkpoint {self.path}: "
+                        f"{len(self.completed)} done, {len(self.failed)} failed"
+                    )
+                else:
+                    logger.warning(f"Checkpoint {self.path} was written for another run, starting fresh")
+            except Exception as e:
+                logger.warning(f"Could not read checkpoint {self.path}: {e}")
+
+    def is_done(self, key: str) -> bool:
+        """Check whether a task finished in an earlier run."""
+        return key in self.completed
+
+    def record(self, item: BatchItemResult, info: Optional[Dict[str, Any]] = None) -> None:
+        """Record a finished task and persist the checkpoint.
+
+        Args:
+            item: Task outcome
+            info: Extra JSON-serializable details to keep (e.g. version)
+        """
+        entry = {
+            'status': item.status,
+            'elapsed': item.elapsed,
+            'finished_at': datetime.now().isoformat(),
+            **(info or {})
+        }
+
+        with self._lock:
+            if item.status == 'failed':
+                entry['error'] = item.error
+                self.failed[item.key] = entry
+            else:
+                self.completed[item.key] = entry
+                self.failed.pop(item.key, None)
+            self._write()
+
+    def _write(self) -> None:
+        """Write the checkpoint atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'context': self.context,
+                'updated_at': datetime.now().isoformat(),
+                'completed': self.completed,
+                'failed': self.failed
+            }, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class BatchRunner:
+    """Run parameter-country tasks on a bounded worker pool."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        checkpoint: Optional[BatchCheckpoint] = None
+    ):
+        """Initialize batch runner.
+
+        Args:
+            max_workers: Maximum concurrent tasks
+            checkpoint: Optional checkpoint for resuming interrupted runs
+        """
+        self.max_workers = max(1, max_workers)
+        self.checkpoint = checkpoint
+
+    def run(
+        self,
+        pairs: List[Tuple[str, str]],
+        task: Callable[[str, str], Tuple[Any, bool]],
+        on_result: Optional[Callable[[BatchItemResult, BatchProgress], None]] = None,
+        checkpoint_info: Optional[Callable[[BatchItemResult], Dict[str, Any]]] = None
+    ) -> List[BatchItemResult]:
+        """Run a task for every parameter-country pair.
+
+        Args:
+            pairs: (parameter, country) pairs
+            task: Function returning (result, served_from_cache) for a pair
+            on_result: Optional callback invoked as each task finishes
+                (in completion order)
+            checkpoint_info: Optional function giving extra checkpoint details
+
+        Returns:
+            Task outcomes, in the order of pairs
+        """
+        progress = BatchProgress(total=len(pairs))
+        outcomes: List[BatchItemResult] = []
+
+        def finish(item: BatchItemResult) -> None:
+            progress.done += 1
+            setattr(progress, item.status, getattr(progress, item.status) + 1)
+            outcomes.append(item)
+
+            if self.checkpoint and item.status != 'resumed':
+                self.checkpoint.record(item, checkpoint_info(item) if checkpoint_info else None)
+
+            # Callers with a callback report progress themselves
+            log = logger.debug if on_result else logger.info
+            eta = progress.eta_seconds
+            log(
+                f"[{progress.done}/{progress.total}] {item.key}: {item.status} "
+                f"({item.elapsed:.1f}s) | {progress.throughput_per_minute:.1f}/min"
+                + (f" | ETA {eta / 60:.1f}m" if eta is not None else "")
+            )
+            if on_result:
+                on_result(item, progress)
+
+        pending = []
+        for parameter, country in pairs:
+            if self.checkpoint and self.checkpoint.is_done(f"{parameter}|{country}"):
+                finish(BatchItemResult(parameter=parameter, country=country, status='resumed'))
+            else:
+                pending.append((parameter, country))
+
+        logger.info(
+            f"Batch started: {len(pending)} tasks on {self.max_workers} workers "
+            f"({progress.resumed} resumed from checkpoint)"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="research-batch")
+        try:
+            futures = {
+                executor.submit(self._run_one, task, parameter, country): (parameter, country)
+                for parameter, country in pending
+            }
+            for future in as_completed(futures):
+                finish(future.result())
+        except BaseException:
+            # Interrupted: drop queued tasks; finished ones are checkpointed
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        # Report in input order; resumed and fast tasks finish first
+        order: Dict[Tuple[str, str], int] = {}
+        for position, (parameter, country) in enumerate(pairs):
+            order.setdefault((parameter, country), position)
+        outcomes.sort(key=lambda item: order[(item.parameter, item.country)])
+
+        logger.info(
+            f"Batch complete: {progress.completed} generated, {progress.cached} cached, "
+            f"{progress.failed} failed, {progress.resumed} resumed "
+            f"in {progress.elapsed_seconds:.1f}s"
+        )
+        return outcomes
+
+    @staticmethod
+    def _run_one(
+        task: Callable[[str, str], Tuple[Any, bool]],
+        parameter: str,
+        country: str
+    ) -> BatchItemResult:
+        """Run one task, capturing its outcome."""
+        start = time.monotonic()
+        try:
+            result, cached = task(parameter, country)
+            return BatchItemResult(
+                parameter=parameter,
+                country=country,
+                status='cached' if cached else 'completed',
+                result=result,
+                elapsed=time.monotonic() - start
+            )
+        except Exception as e:
+            logger.error(f"Batch task failed for {parameter}/{country}: {e}")
+            return BatchItemResult(
+                parameter=parameter,
+                country=country,
+                status='failed',
+                error=str(e),
+                elapsed=time.monotonic() - start
+            )
@@ -0,0 +1,260 @@
+"""Content Diff - Structural comparison of research document versions
+
+Compares regenerated research with the previous version to decide how much
+actually changed:
+- key_metrics: matched by metric name; numeric values compared with a
+  tolerance, so reformatting ("1,000" vs "1000") is not a change
+- sections: word-level text similarity per narrative section
+- sources: added and removed sources, by URL or name
+
+The result classifies the update as PATCH, MINOR or MAJOR and summarizes
+whether values changed, so consumers of parsed values can skip work when
+only wording moved.
+"""
+
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+import re
+
+from .version_manager import ChangeType
+
+# Narrative sections compared by text similarity
+SECTION_KEYS = (
+    'overview',
+    'current_status',
+    'historical_trends',
+    'policy_framework',
+    'challenges',
+    'opportunities',
+    'future_outlook'
+)
+
+# Relative difference below which two metric values are the same number
+VALUE_TOLERANCE = 1e-3
+
+# Sections at least this similar are treated as edited, not rewritten (PATCH)
+SECTION_PATCH_SIMILARITY = 0.9
+
+# Average section similarity below which the research was redone (MAJOR)
+SECTION_MAJOR_SIMILARITY = 0.5
+
+# Share of metrics added, removed or changed above which the research was redone (MAJOR)
+METRIC_MAJOR_TURNOVER = 0.5
+
+_NUMBER = re.compile(r'-?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|-?\.\d+')
+
+
+def _number(value: Any) -> Optional[float]:
+    """First number in a metric value, or None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER.search(str(value)) if value is not None else None
+    return float(match.group().replace(',', '')) if match else None
+
+
+def _metrics_by_name(content: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Key metrics keyed by normalized metric name (first occurrence wins)."""
+    metrics = {}
+    for metric in content.get('key_metrics') or []:
+        if isinstance(metric, dict) and metric.get('metric'):
+            metrics.setdefault(' '.join(str(metric['metric']).lower().split()), metric)
+    return metrics
+
+
+def _source_keys(content: Dict[str, Any]) -> set:
+    """Identity (URL, else name) of each source."""
+    keys = set()
+    for source in content.get('sources') or []:
+        if isinstance(source, dict):
+            key = source.get('url') or source.get('name')
+            if key:
+                keys.add(str(key).strip().lower())
+    return keys
+
+
+def text_similarity(old: str, new: str) -> float:
+    """Word-level similarity of two texts, from 0.0 (disjoint) to 1.0 (equal)."""
+    if old == new:
+        return 1.0
+    old_words, new_words = old.split(), new.split()
+    if not old_words or not new_words:
+        return 0.0
+    return SequenceMatcher(None, old_words, new_words, autojunk=False).ratio()
+
+
+@dataclass
+class MetricChange:
+    """A key metric whose value or unit changed."""
+    metric: str
+    old_value: Any
+    new_value: Any
+    relative_change: Optional[float] = None  # None if not comparable as numbers
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'metric': self.metric,
+            'old_value': self.old_value,
+            'new_value': self.new_value,
+            'relative_change': self.relative_change
+        }
+
+
+@dataclass
+class ContentDiff:
+    """Structural differences between two versions of research content."""
+    metrics_added: List[str] = field(default_factory=list)
+    metrics_removed: List[str] = field(default_factory=list)
+    metrics_changed: List[MetricChange] = field(default_factory=list)
+    metrics_compared: int = 0  # Metrics present in either version
+    section_similarity: Dict[str, float] = field(default_factory=dict)  # Changed sections only
+    sections_compared: int = 0
+    sources_added: int = 0
+    sources_removed: int = 0
+    other_changes: List[str] = field(default_factory=list)  # Other top-level keys that changed
+
+    @property
+    def values_changed(self) -> bool:
+        """Whether any key metric was added, removed or changed in value."""
+        return bool(self.metrics_added or self.metrics_removed or self.metrics_changed)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing compared differs."""
+        return not (
+            self.values_changed or self.section_similarity
+            or self.sources_added or self.sources_removed or self.other_changes
+        )
+
+    @property
+    def metric_turnover(self) -> float:
+        """Share of metrics added, removed or changed."""
+        if not self.metrics_compared:
+            return 0.0
+        changed = len(self.metrics_added) + len(self.metrics_removed) + len(self.metrics_changed)
+        return changed / self.metrics_compared
+
+    @property
+    def average_section_similarity(self) -> float:
+        """Mean similarity over all compared sections (unchanged ones count as 1.0)."""
+        if not self.sections_compared:
+            return 1.0
+        unchanged = self.sections_compared - len(self.section_similarity)
+        return (unchanged + sum(self.section_similarity.values())) / self.sections_compared
+
+    @property
+    def change_type(self) -> ChangeType:
+        """Classify the update.
+
+        MAJOR: most metrics turned over, or the sections were rewritten.
+        MINOR: metric values, the metric set or a section changed materially.
+        PATCH: wording edits, source changes and other small corrections.
+        """
+        if (
+            self.metric_turnover > METRIC_MAJOR_TURNOVER
+            or self.average_section_similarity < SECTION_MAJOR_SIMILARITY
+        ):
+            return ChangeType.MAJOR
+        if self.values_changed or any(
+            similarity < SECTION_PATCH_SIMILARITY for similarity in self.section_similarity.values()
+        ):
+            return ChangeType.MINOR
+        return ChangeType.PATCH
+
+    def describe(self) -> str:
+        """One-line human-readable summary."""
+        parts = []
+        if self.metrics_changed:
+            parts.append(f"{len(self.metrics_changed)} metrics changed")
+        if self.metrics_added:
+            parts.append(f"{len(self.metrics_added)} metrics added")
+        if self.metrics_removed:
+            parts.append(f"{len(self.metrics_removed)} metrics removed")
+        if self.section_similarity:
+            parts.append(f"{len(self.section_similarity)} sections edited")
+        if self.sources_added or self.sources_removed:
+            parts.append(f"sources +{self.sources_added}/-{self.sources_removed}")
+        if self.other_changes:
+            parts.append(f"{', '.join(self.other_changes)} changed")
+        return '; '.join(parts) if parts else 'no structural changes'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary stored with the version's metadata."""
+        return {
+            'change_type': self.change_type.value,
+            'values_changed': self.values_changed,
+            'metrics_added': self.metrics_added,
+            'metrics_removed': self.metrics_removed,
+            'metrics_changed': [change.to_dict() for change in self.metrics_changed],
+            'section_similarity': {key: round(value, 3) for key, value in self.section_similarity.items()},
+            'sources_added': self.sources_added,
+            'sources_removed': self.sources_removed,
+            'other_changes': self.other_changes
+        }
+
+
+def _compare_metric(name: str, old: Dict[str, Any], new: Dict[str, Any]) -> Optional[MetricChange]:
+    """Compare one metric's value and unit; None if unchanged."""
+    old_value, new_value = old.get('value'), new.get('value')
+    same_unit = str(old.get('unit') or '').strip().lower() == str(new.get('unit') or '').strip().lower()
+
+    old_number, new_number = _number(old_value), _number(new_value)
+    if old_number is not None and new_number is not None:
+        scale = max(abs(old_number), abs(new_number))
+        relative = abs(new_number - old_number) / scale if scale else 0.0
+        if relative <= VALUE_TOLERANCE and same_unit:
+            return None
+        return MetricChange(name, old_value, new_value, relative if same_unit else None)
+
+    if old_value == new_value and same_unit:
+        return None
+    return MetricChange(name, old_value, new_value)
+
+
+def diff_research(old: Dict[str, Any], new: Dict[str, Any]) -> ContentDiff:
+    """Compare two versions of research content.
+
+    Args:
+        old: Previous version's content
+        new: New content
+
+    Returns:
+        ContentDiff describing the changes
+    """
+    diff = ContentDiff()
+
+    old_metrics, new_metrics = _metrics_by_name(old), _metrics_by_name(new)
+    diff.metrics_compared = len(old_metrics.keys() | new_metrics.keys())
+    for name, metric in new_metrics.items():
+        previous = old_metrics.get(name)
+        if previous is None:
+            diff.metrics_added.append(metric['metric'])
+            continue
+        change = _compare_metric(metric['metric'], previous, metric)
+        if change is not None:
+            diff.metrics_changed.append(change)
+    diff.metrics_removed = [metric['metric'] for name, metric in old_metrics.items() if name not in new_metrics]
+
+    for key in SECTION_KEYS:
+        old_text, new_text = old.get(key), new.get(key)
+        if not old_text and not new_text:
+            continue
+        diff.sections_compared += 1
+        similarity = text_similarity(str(old_text or ''), str(new_text or ''))
+        if similarity < 1.0:
+            diff.section_similarity[key] = similarity
+
+    old_sources, new_sources = _source_keys(old), _source_keys(new)
+    diff.sources_added = len(new_sources - old_sources)
+    diff.sources_removed = len(old_sources - new_sources)
+
+    compared = set(SECTION_KEYS) | {'key_metrics', 'sources'}
+    diff.other_changes = sorted(
+        key for key in old.keys() | new.keys()
+        if key not in compared and not key.startswith('_') and old.get(key) != new.get(key)
+    )
+
+    return diff
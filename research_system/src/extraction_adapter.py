@@ -24,12 +24,13 @@ class ResearchExtractionAdapter:
         """Initialize adapter.
 
         Args:
-            research_orchestrator: ResearchOrchestrator instance (creates if None)
+            research_orchestrator: ResearchOrchestrator or ResearchReader
+                (uses the shared research reader if None)
         """
         if research_orchestrator is None:
             # Lazy import to avoid circular dependencies
-            from .research_orchestrator import ResearchOrchestrator
-            self.orchestrator = ResearchOrchestrator()
+            from .research_reader import get_research_reader
+            self.orchestrator = get_research_reader()
         else:
             self.orchestrator = research_orchestrator
 
@@ -225,12 +226,9 @@ class ResearchExtractionAdapter:
         try:
             from datetime import datetime
 
-            version = self.orchestrator.research_store.version_manager.get_latest_version(
+            metadata = self.orchestrator.research_store.get_latest_metadata(
                 parameter, country
             )
-            metadata = self.orchestrator.research_store.version_manager.load_version_metadata(
-                parameter, country, version
-            )
 
             if metadata:
                 created = datetime.fromisoformat(metadata.created_at)
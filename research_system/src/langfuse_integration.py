@@ -6,15 +6,39 @@ This is completely optional and requires:
 1. pip install langfuse
 2. LANGFUSE_PUBLIC_KEY and LANGFUSE_SECRET_KEY in environment
 3. langfuse.enabled: true in research_config.yaml
+
+Events are handed to a background BatchExporter, so tracking never blocks
+research generation on network or disk I/O. Setting langfuse.file_sink to a
+path also writes every event there as NDJSON, which works fully offline
+(without the langfuse package or credentials).
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+import atexit
+import json
 import logging
 import os
+import queue
+import threading
+import time
+import uuid
 from datetime import datetime
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Events waiting for export; further events are dropped and counted
+DEFAULT_QUEUE_SIZE = 10000
+
+# Events exported per batch
+DEFAULT_BATCH_SIZE = 100
+
+# Seconds between exports of a partial batch
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Seconds flush() and shutdown wait for pending events
+DEFAULT_FLUSH_TIMEOUT = 10.0
+
 # Try to import Langfuse
 try:
     from langfuse import Langfuse
@@ -25,8 +49,213 @@ except ImportError:
     logger.debug("Langfuse not available (pip install langfuse to enable)")
 
 
+class LangfuseSink:
+    """Sends batches of events to Langfuse."""
+
+    def __init__(self, client: Any):
+        """Initialize Langfuse sink.
+
+        Args:
+            client: Langfuse client
+        """
+        self.client = client
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        """Replay events as Langfuse client calls, then flush the client."""
+        for event in events:
+            if event['type'] == 'trace':
+                trace = self.client.trace(**event['trace'])
+                if event.get('generation'):
+                    trace.generation(**event['generation'])
+            elif event['type'] == 'score':
+                self.client.score(**event['score'])
+        self.client.flush()
+
+
+class FileSink:
+    """Appends events to a local NDJSON file, for offline tracing."""
+
+    def __init__(self, path: str):
+        """Initialize file sink.
+
+        Args:
+            path: File to append to (created with its directory if missing)
+        """
+        self.path = Path(path)
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        """Append events, one JSON object per line."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = ''.join(json.dumps(event, default=str) + '\n' for event in events)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+
+class BatchExporter:
+    """Exports events to sinks from a background thread in batches.
+
+    submit() only enqueues: when the bounded queue is full the event is
+    dropped and counted rather than blocking the caller. The worker thread
+    starts with the first event and exports when a batch fills, every
+    flush_interval seconds, on flush() and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        sinks: List[Any],
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
+        """Initialize batch exporter.
+
+        Args:
+            sinks: Objects with a send(events) method
+            queue_size: Maximum events waiting for export
+            batch_size: Events exported per batch
+            flush_interval: Seconds between exports of a partial batch
+        """
+        self.sinks = sinks
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._processed_changed = threading.Condition(self._lock)
+
+        self.submitted = 0
+        self.processed = 0  # Exported, or failed in every sink
+        self.dropped = 0
+        self.batches = 0
+        self.failures = 0  # Batch sends that raised, across sinks
+
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """Queue an event for export without blocking.
+
+        Returns:
+            False if the queue was full and the event was dropped
+        """
+        if self._stopped.is_set():
+            return False
+        if self._thread is None:
+            self._start()
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(f"Trace queue full, {dropped} events dropped so far")
+            return False
+
+        with self._lock:
+            self.submitted += 1
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def _start(self) -> None:
+        """Start the worker thread (once)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Worker loop: export whatever is queued on each wake-up or interval."""
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._export_pending()
+        self._export_pending()
+
+    def _export_pending(self) -> None:
+        """Export queued events in batches until the queue is empty."""
+        while True:
+            batch = []
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if not batch:
+                return
+
+            for sink in self.sinks:
+                try:
+                    sink.send(batch)
+                except Exception as e:
+                    with self._lock:
+                        self.failures += 1
+                    logger.error(f"Error exporting {len(batch)} trace events to {type(sink).__name__}: {e}")
+
+            with self._lock:
+                self.batches += 1
+                self.processed += len(batch)
+                self._processed_changed.notify_all()
+
+    def flush(self, timeout: float = DEFAULT_FLUSH_TIMEOUT) -> bool:
+        """Wait until every event submitted so far has been exported.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all events were exported in time
+        """
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            target = self.submitted
+            self._wake.set()
+            while self.processed < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._processed_changed.wait(remaining)
+        return True
+
+    def close(self, timeout: float = DEFAULT_FLUSH_TIMEOUT) -> None:
+        """Export pending events and stop the worker thread."""
+        if self._thread is None or self._stopped.is_set():
+            return
+        self.flush(timeout)
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Export counters.
+
+        Returns:
+            Dictionary with submitted, processed (sent to every sink, or
+            failed), dropped and pending event counts, batches and failed sends
+        """
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'processed': self.processed,
+                'dropped': self.dropped,
+                'pending': self._queue.qsize(),
+                'batches': self.batches,
+                'failures': self.failures
+            }
+
+
 class LangfuseTracker:
-    """Tracks research system operations with Langfuse."""
+    """Tracks research system operations with Langfuse and/or a local trace file.
+
+    Tracking calls only build an event and queue it; the BatchExporter
+    sends it later from its own thread.
+    """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize Langfuse tracker.
@@ -35,21 +264,36 @@ class LangfuseTracker:
             config: Langfuse configuration from research_config.yaml
         """
         self.config = config or {}
-        self.enabled = (
+        langfuse_enabled = (
             LANGFUSE_AVAILABLE
             and self.config.get('enabled', False)
             and self._check_credentials()
         )
-
-        if self.enabled:
-            self.client = self._initialize_client()
+        self.client = self._initialize_client() if langfuse_enabled else None
+
+        sinks = []
+        if self.client:
+            sinks.append(LangfuseSink(self.client))
+        if self.config.get('enabled', False) and self.config.get('file_sink'):
+            sinks.append(FileSink(self.config['file_sink']))
+
+        self.enabled = bool(sinks)
+        self.exporter = BatchExporter(
+            sinks,
+            queue_size=self.config.get('queue_size', DEFAULT_QUEUE_SIZE),
+            batch_size=self.config.get('batch_size', DEFAULT_BATCH_SIZE),
+            flush_interval=self.config.get('flush_interval', DEFAULT_FLUSH_INTERVAL)
+        ) if sinks else None
+
+        if self.client:
             logger.info("Langfuse tracking enabled")
-        else:
-            self.client = None
-            if not LANGFUSE_AVAILABLE:
-                logger.debug("Langfuse tracking disabled (not installed)")
-            elif not self.config.get('enabled', False):
+        if self.enabled and self.config.get('file_sink'):
+            logger.info(f"Trace file sink enabled: {self.config['file_sink']}")
+        if not self.enabled:
+            if not self.config.get('enabled', False):
                 logger.debug("Langfuse tracking disabled (config)")
+            elif not LANGFUSE_AVAILABLE:
+                logger.debug("Langfuse tracking disabled (not installed)")
             else:
                 logger.warning("Langfuse tracking disabled (missing credentials)")
 
@@ -103,34 +347,36 @@ class LangfuseTracker:
         Returns:
             Trace ID or None
         """
-        if not self.enabled or not self.client:
+        if not self.enabled:
             return None
 
         try:
-            session_id = self._format_session_id(parameter, country, period)
-
-            trace = self.client.trace(
-                name="research_generation",
-                session_id=session_id,
-                metadata={
-                    'parameter': parameter,
-                    'country': country,
-                    'period': period,
-                    **(metadata or {})
+            trace_id = uuid.uuid4().hex
+            self.exporter.submit({
+                'type': 'trace',
+                'trace': {
+                    'id': trace_id,
+                    'name': "research_generation",
+                    'session_id': self._format_session_id(parameter, country, period),
+                    'timestamp': datetime.now(),
+                    'metadata': {
+                        'parameter': parameter,
+                        'country': country,
+                        'period': period,
+                        **(metadata or {})
+                    }
+                },
+                'generation': {
+                    'name': "llm_research",
+                    'model': metadata.get('model', 'unknown') if metadata else 'unknown',
+                    'input': prompt,
+                    'output': response,
+                    'metadata': metadata or {}
                 }
-            )
-
-            # Track the generation
-            generation = trace.generation(
-                name="llm_research",
-                model=metadata.get('model', 'unknown') if metadata else 'unknown',
-                input=prompt,
-                output=response,
-                metadata=metadata or {}
-            )
+            })
 
-            logger.debug(f"Tracked research generation: {trace.id}")
-            return trace.id
+            logger.debug(f"Queued research generation trace: {trace_id}")
+            return trace_id
 
         except Exception as e:
             logger.error(f"Error tracking research generation: {e}")
@@ -154,22 +400,28 @@ class LangfuseTracker:
         Returns:
             Trace ID or None
         """
-        if not self.enabled or not self.client:
+        if not self.enabled:
             return None
 
         try:
-            trace = self.client.trace(
-                name="prompt_generation",
-                metadata={
-                    'parameter': parameter,
-                    'template_length': len(prompt_template),
-                    'prompt_length': len(generated_prompt),
-                    **(metadata or {})
+            trace_id = uuid.uuid4().hex
+            self.exporter.submit({
+                'type': 'trace',
+                'trace': {
+                    'id': trace_id,
+                    'name': "prompt_generation",
+                    'timestamp': datetime.now(),
+                    'metadata': {
+                        'parameter': parameter,
+                        'template_length': len(prompt_template),
+                        'prompt_length': len(generated_prompt),
+                        **(metadata or {})
+                    }
                 }
-            )
+            })
 
-            logger.debug(f"Tracked prompt generation: {trace.id}")
-            return trace.id
+            logger.debug(f"Queued prompt generation trace: {trace_id}")
+            return trace_id
 
         except Exception as e:
             logger.error(f"Error tracking prompt generation: {e}")
@@ -190,26 +442,31 @@ class LangfuseTracker:
             version: Version retrieved
             age_days: Age of cached document in days
         """
-        if not self.enabled or not self.client:
+        if not self.enabled:
             return
 
         try:
-            self.client.score(
-                name="cache_hit",
-                value=1.0,
-                data_type="NUMERIC",
-                metadata={
-                    'parameter': parameter,
-                    'country': country,
-                    'version': version,
-                    'age_days': age_days
+            self.exporter.submit({
+                'type': 'score',
+                'score': {
+                    'name': "cache_hit",
+                    'value': 1.0,
+                    'data_type': "NUMERIC",
+                    'metadata': {
+                        'parameter': parameter,
+                        'country': country,
+                        'version': version,
+                        'age_days': age_days,
+                        'timestamp': datetime.now().isoformat()
+                    }
                 }
-            )
+            })
 
-            logger.debug(f"Tracked cache hit: {parameter}/{country}")
+            logger.debug(f"Queued cache hit: {parameter}/{country}")
 
         except Exception as e:
             logger.error(f"Error tracking cache hit: {e}")
+            return
 
     def track_cost(
         self,
@@ -226,25 +483,30 @@ class LangfuseTracker:
             tokens: Token count
             metadata: Additional metadata
         """
-        if not self.enabled or not self.client:
+        if not self.enabled:
             return
 
         try:
-            self.client.score(
-                name=f"{operation}_cost",
-                value=cost_usd,
-                data_type="NUMERIC",
-                metadata={
-                    'tokens': tokens,
-                    'cost_per_token': cost_usd / tokens if tokens > 0 else 0,
-                    **(metadata or {})
+            self.exporter.submit({
+                'type': 'score',
+                'score': {
+                    'name': f"{operation}_cost",
+                    'value': cost_usd,
+                    'data_type': "NUMERIC",
+                    'metadata': {
+                        'tokens': tokens,
+                        'cost_per_token': cost_usd / tokens if tokens > 0 else 0,
+                        'timestamp': datetime.now().isoformat(),
+                        **(metadata or {})
+                    }
                 }
-            )
+            })
 
-            logger.debug(f"Tracked cost: {operation} = ${cost_usd:.4f}")
+            logger.debug(f"Queued cost: {operation} = ${cost_usd:.4f}")
 
         except Exception as e:
             logger.error(f"Error tracking cost: {e}")
+            return
 
     def _format_session_id(self, parameter: str, country: str, period: str) -> str:
         """Format session ID.
@@ -265,14 +527,34 @@ class LangfuseTracker:
             timestamp=datetime.now().strftime('%Y%m%d')
         )
 
-    def flush(self) -> None:
-        """Flush pending events to Langfuse."""
-        if self.enabled and self.client:
-            try:
-                self.client.flush()
-                logger.debug("Flushed Langfuse events")
-            except Exception as e:
-                logger.error(f"Error flushing Langfuse: {e}")
+    def flush(self, timeout: float = DEFAULT_FLUSH_TIMEOUT) -> bool:
+        """Wait until queued events have been exported.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all events were exported in time
+        """
+        if not self.enabled:
+            return True
+        flushed = self.exporter.flush(timeout)
+        if not flushed:
+            logger.warning(f"Trace flush timed out after {timeout}s")
+        return flushed
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get export counters (submitted, processed, dropped, pending, batches, failures).
+
+        Returns:
+            Dictionary of counters (empty if tracking is disabled)
+        """
+        return self.exporter.get_stats() if self.enabled else {}
+
+    def close(self) -> None:
+        """Export pending events and stop the background exporter."""
+        if self.enabled:
+            self.exporter.close()
 
 
 # Global tracker instance (lazy initialization)
@@ -291,6 +573,8 @@ def get_tracker(config: Optional[Dict[str, Any]] = None) -> LangfuseTracker:
     global _global_tracker
 
     if _global_tracker is None or config is not None:
+        if _global_tracker is not None:
+            _global_tracker.close()
         _global_tracker = LangfuseTracker(config)
 
     return _global_tracker
@@ -2,16 +2,95 @@
 
 Reads parameter definitions and scoring criteria to generate tailored research prompts
 for each parameter-country combination.
+
+Each parameter's prompt is compiled once: the base template is filled with
+the parameter's description and scoring criteria, leaving only the country
+and period slots open. Everything before the first slot is the same bytes
+for every country, so LLM providers can cache that prefix across requests.
 """
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Template fields filled per request; all others are filled once per parameter
+REQUEST_SLOTS = ('country', 'period')
+
+# Rendered prompts kept in memory per generator
+DEFAULT_RENDERED_PROMPT_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """A parameter's prompt with only the per-request slots left open."""
+    parameter_name: str
+    segments: Tuple[str, ...]  # Static text around the slots; one more than slots
+    slots: Tuple[str, ...]  # Slot names in order, each one of REQUEST_SLOTS
+
+    @property
+    def static_prefix(self) -> str:
+        """Text before the first slot, identical for every country and period."""
+        return self.segments[0]
+
+    def render(self, country: str, period: str) -> str:
+        """Fill the slots.
+
+        Args:
+            country: Country name
+            period: Time period
+
+        Returns:
+            Prompt string
+        """
+        values = {'country': country, 'period': period}
+        parts = [self.segments[0]]
+        for slot, segment in zip(self.slots, self.segments[1:]):
+            parts.append(values[slot])
+            parts.append(segment)
+        return ''.join(parts)
+
+
+def compile_template(template: str, parameter_name: str, fields: Dict[str, Any]) -> CompiledPrompt:
+    """Fill a str.format template's parameter fields, keeping request slots open.
+
+    Produces exactly what template.format(**fields, country=..., period=...)
+    would, including escaped braces and format specs.
+
+    Args:
+        template: Base template in str.format syntax
+        parameter_name: Parameter the prompt is for
+        fields: Values for all fields except REQUEST_SLOTS
+
+    Returns:
+        CompiledPrompt
+
+    Raises:
+        KeyError: If the template uses a field with no value
+    """
+    formatter = Formatter()
+    segments, slots = [], []
+    text = []
+    for literal, field_name, format_spec, conversion in formatter.parse(template):
+        text.append(literal)
+        if field_name is None:
+            continue
+        if field_name in REQUEST_SLOTS and not format_spec and not conversion:
+            segments.append(''.join(text))
+            slots.append(field_name)
+            text = []
+            continue
+        value, _ = formatter.get_field(field_name, (), fields)
+        text.append(formatter.format_field(formatter.convert_field(value, conversion), format_spec or ''))
+    segments.append(''.join(text))
+    return CompiledPrompt(parameter_name=parameter_name, segments=tuple(segments), slots=tuple(slots))
+
 
 class PromptGenerator:
     """Generates parameter-specific research prompts from configuration."""
@@ -38,6 +117,10 @@ class PromptGenerator:
         self.parameters = self._load_parameters()
         self.base_template = self._load_base_template()
 
+        # Parameter name -> compiled prompt, built on first use
+        self._compiled: Dict[str, CompiledPrompt] = {}
+        self._render = lru_cache(maxsize=DEFAULT_RENDERED_PROMPT_CACHE_SIZE)(self._render_prompt)
+
         logger.info(f"PromptGenerator initialized with {len(self.parameters)} parameters")
 
     def _load_parameters(self) -> Dict[str, Any]:
@@ -123,28 +206,38 @@ class PromptGenerator:
         if parameter_name not in self.parameters:
             raise ValueError(f"Parameter '{parameter_name}' not found in configuration")
 
-        param = self.parameters[parameter_name]
-
         # Use current period if not specified
         if period is None:
             period = datetime.now().strftime("Q%m %Y")
 
-        # Format parameter description
-        description = self._format_description(param)
+        return self._render(parameter_name, country, period)
 
-        # Format scoring criteria
-        scoring_criteria = self._format_scoring_criteria(param)
+    def _render_prompt(self, parameter_name: str, country: str, period: str) -> str:
+        """Render a prompt from the parameter's compiled template (cached by the caller)."""
+        return self.compile_prompt(parameter_name).render(country, period)
 
-        # Fill in the template
-        prompt = self.base_template.format(
-            parameter_name=parameter_name,
-            country=country,
-            period=period,
-            parameter_description=description,
-            scoring_criteria=scoring_criteria
-        )
+    def compile_prompt(self, parameter_name: str) -> CompiledPrompt:
+        """Get a parameter's compiled prompt, compiling it on first use.
 
-        return prompt
+        Args:
+            parameter_name: Name of the parameter (e.g., "Ambition")
+
+        Returns:
+            CompiledPrompt with country and period slots open
+        """
+        compiled = self._compiled.get(parameter_name)
+        if compiled is None:
+            if parameter_name not in self.parameters:
+                raise ValueError(f"Parameter '{parameter_name}' not found in configuration")
+
+            param = self.parameters[parameter_name]
+            compiled = compile_template(self.base_template, parameter_name, {
+                'parameter_name': parameter_name,
+                'parameter_description': self._format_description(param),
+                'scoring_criteria': self._format_scoring_criteria(param)
+            })
+            self._compiled[parameter_name] = compiled
+        return compiled
 
     def _format_description(self, param: Dict[str, Any]) -> str:
         """Format parameter description.
@@ -232,18 +325,15 @@ class PromptGenerator:
         prompts = {}
 
         for param_name in self.parameters:
-            # Generate a generic prompt (country and period as placeholders)
-            prompt = self.generate_prompt(
-                parameter_name=param_name,
-                country="{country}",
-                period="{period}"
-            )
+            # Generic prompt with the country and period slots shown as placeholders
+            prompt = self.compile_prompt(param_name).render(country="{country}", period="{period}")
             prompts[param_name] = prompt
 
-            # Save to file
+            # Save to file (unchanged files are not rewritten)
             output_path = self.output_dir / f"{param_name.lower().replace(' ', '_')}_prompt.txt"
-            with open(output_path, 'w') as f:
-                f.write(prompt)
+            if not output_path.exists() or output_path.read_text() != prompt:
+                with open(output_path, 'w') as f:
+                    f.write(prompt)
 
             logger.debug(f"Generated prompt for {param_name} -> {output_path}")
 
@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from ai_extraction_system.llm_service import LLMService, LLMConfig, LLMProvider
 from .prompt_generator import PromptGenerator
+from .batch_runner import BatchRunner, RateLimiter, DEFAULT_MAX_REQUESTS_PER_MINUTE
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,11 @@ class ResearchAgent:
         # Initialize LLM service
         self.llm_service = self._initialize_llm(llm_config)
 
+        # Shared across threads so concurrent research respects the API limit
+        self.rate_limiter = RateLimiter(
+            (llm_config or {}).get('max_requests_per_minute', DEFAULT_MAX_REQUESTS_PER_MINUTE)
+        )
+
         # Initialize prompt generator
         if prompt_generator is None:
             self.prompt_generator = PromptGenerator()
@@ -116,6 +122,7 @@ class ResearchAgent:
 
             # Execute research via LLM
             logger.debug("Invoking LLM for research...")
+            self.rate_limiter.acquire()
             raw_response = self.llm_service.invoke(prompt)
 
             # Parse response
@@ -206,36 +213,43 @@ class ResearchAgent:
     def batch_research(
         self,
         parameter_country_pairs: list[tuple[str, str]],
-        period: Optional[str] = None
+        period: Optional[str] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Dict[str, Any]]:
         """Conduct research for multiple parameter-country combinations.
 
+        Pairs are researched concurrently on a bounded pool; LLM calls share
+        this agent's rate limiter.
+
         Args:
             parameter_country_pairs: List of (parameter, country) tuples
             period: Time period for all research
+            max_workers: Concurrent research tasks (default: 4)
 
         Returns:
-            Dictionary mapping "parameter|country" to research data
+            Dictionary mapping "parameter|country" to research data, in the
+            order of parameter_country_pairs
         """
-        results = {}
+        runner = BatchRunner(**({'max_workers': max_workers} if max_workers else {}))
+        outcomes = runner.run(
+            list(parameter_country_pairs),
+            lambda parameter, country: (self.conduct_research(parameter, country, period), False)
+        )
 
-        for i, (parameter, country) in enumerate(parameter_country_pairs, 1):
-            logger.info(f"Batch research {i}/{len(parameter_country_pairs)}: {parameter}/{country}")
-
-            try:
-                research = self.conduct_research(parameter, country, period)
-                key = f"{parameter}|{country}"
-                results[key] = research
-            except Exception as e:
-                logger.error(f"Failed batch research for {parameter}/{country}: {e}")
-                results[f"{parameter}|{country}"] = {
-                    'error': str(e),
-                    'parameter': parameter,
-                    'country': country
+        results = {}
+        for item in outcomes:
+            if item.status == 'failed':
+                results[item.key] = {
+                    'error': item.error,
+                    'parameter': item.parameter,
+                    'country': item.country
                 }
+            else:
+                results[item.key] = item.result
 
+        successful = sum(1 for item in outcomes if item.status != 'failed')
         logger.info(
-            f"Batch research complete: {len(results)}/{len(parameter_country_pairs)} successful"
+            f"Batch research complete: {successful}/{len(parameter_country_pairs)} successful"
         )
 
         return results
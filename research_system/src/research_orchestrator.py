@@ -5,16 +5,18 @@ Coordinates between ResearchAgent, ResearchStore, and VersionManager to:
 - Manage versioning and storage
 - Provide convenient API for agents
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 import logging
+import threading
 from datetime import datetime
-from pathlib import Path
-import yaml
 
-from .research_agent import ResearchAgent
 from .storage.research_store import ResearchStore, ResearchDocument
-from .version_manager import ChangeType, VersionStrategy
+from .storage.exporter import ResearchExporter
+from .version_manager import ChangeType
+from .content_diff import diff_research
 from .prompt_generator import PromptGenerator
+from .research_reader import load_research_config, create_research_store, prefetch_documents
+from .batch_runner import BatchRunner, BatchCheckpoint, BatchItemResult, BatchProgress, DEFAULT_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -25,34 +27,58 @@ class ResearchOrchestrator:
     def __init__(
         self,
         config_path: str = "research_system/config/research_config.yaml",
-        force_new_research: bool = False
+        force_new_research: bool = False,
+        research_store: Optional[ResearchStore] = None
     ):
         """Initialize research orchestrator.
 
+        The prompt generator and research agent (with its LLM clients) are
+        built on first use, so reading cached research never constructs them.
+
         Args:
             config_path: Path to research configuration file
             force_new_research: If True, always generate new research (ignore cache)
+            research_store: Store to use (default: the one configured in storage)
         """
         self.config = self._load_config(config_path)
         self.force_new_research = force_new_research
 
         # Initialize components
-        self.prompt_generator = PromptGenerator()
-        self.research_agent = ResearchAgent(
-            llm_config=self.config.get('llm'),
-            prompt_generator=self.prompt_generator
-        )
-        self.research_store = ResearchStore(
-            base_path=self.config.get('storage', {}).get('base_path',
-                                                          'research_system/data/research_documents'),
-            cache_ttl=self.config.get('cache', {}).get('ttl', 604800),
-            version_strategy=VersionStrategy(
-                self.config.get('storage', {}).get('versioning', {}).get('strategy', 'semantic')
-            )
-        )
+        self.research_store = research_store or create_research_store(self.config)
+        self._prompt_generator: Optional[PromptGenerator] = None
+        self._research_agent = None
+        self._components_lock = threading.Lock()
 
         logger.info("ResearchOrchestrator initialized")
 
+    @property
+    def prompt_generator(self) -> PromptGenerator:
+        """Prompt generator, created on first use."""
+        if self._prompt_generator is None:
+            with self._components_lock:
+                if self._prompt_generator is None:
+                    self._prompt_generator = PromptGenerator()
+        return self._prompt_generator
+
+    @property
+    def research_agent(self):
+        """LLM-backed research agent, created on first use.
+
+        Returns:
+            ResearchAgent instance
+        """
+        if self._research_agent is None:
+            prompt_generator = self.prompt_generator
+            with self._components_lock:
+                if self._research_agent is None:
+                    # Imported here: the LLM service pulls in provider SDKs
+                    from .research_agent import ResearchAgent
+                    self._research_agent = ResearchAgent(
+                        llm_config=self.config.get('llm'),
+                        prompt_generator=prompt_generator
+                    )
+        return self._research_agent
+
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load research system configuration.
 
@@ -62,16 +88,7 @@ class ResearchOrchestrator:
         Returns:
             Configuration dictionary
         """
-        config_file = Path(config_path)
-
-        if not config_file.exists():
-            logger.warning(f"Config not found: {config_path}, using defaults")
-            return {}
-
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-
-        return config
+        return load_research_config(config_path)
 
     def get_research(
         self,
@@ -129,14 +146,19 @@ class ResearchOrchestrator:
             f"(overall: {validation['scores']['overall']:.2f})"
         )
 
-        # Determine change type based on existing version
-        existing_version = self.research_store.version_manager.get_latest_version(parameter, country)
-        if existing_version is None:
+        # Determine change type by diffing against the existing version
+        existing_version = self.research_store.get_latest_version(parameter, country)
+        previous = self.research_store.load(parameter, country, existing_version) if existing_version else None
+        change_description = f"Research for {period}"
+        change_summary = None
+        if previous is None:
             change_type = ChangeType.MAJOR  # First version
         else:
-            # For now, default to MINOR for updates
-            # In future, could compare content to determine change type
-            change_type = ChangeType.MINOR
+            diff = diff_research(previous.content, research_content)
+            change_type = diff.change_type
+            change_summary = diff.to_dict()
+            change_description += f" ({diff.describe()})"
+            logger.info(f"Research change for {parameter}/{country}: {change_type.value} ({diff.describe()})")
 
         # Store research
         version = self.research_store.save(
@@ -145,18 +167,85 @@ class ResearchOrchestrator:
             period=period,
             content=research_content,
             change_type=change_type,
-            change_description=f"Research for {period}"
+            change_description=change_description,
+            change_summary=change_summary
         )
 
         # Load and return the stored document
         return self.research_store.load(parameter, country, version)
 
+    def run_batch(
+        self,
+        parameters: List[str],
+        countries: List[str],
+        period: Optional[str] = None,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        on_result: Optional[Callable[[BatchItemResult, BatchProgress], None]] = None
+    ) -> List[BatchItemResult]:
+        """Get research for every parameter-country pair concurrently.
+
+        Tasks run on a bounded worker pool; LLM calls share the research
+        agent's rate limiter. With a checkpoint, pairs finished by an earlier
+        interrupted run are reported as 'resumed' and not repeated.
+
+        Args:
+            parameters: List of parameter names
+            countries: List of country names
+            period: Time period (defaults to current quarter)
+            use_cache: Whether to use cached research
+            max_workers: Concurrent tasks (default: batch.max_workers or 4)
+            checkpoint_path: Optional checkpoint file for resuming
+            on_result: Optional callback invoked as each pair finishes
+
+        Returns:
+            List of BatchItemResult in parameter, then country order
+        """
+        if period is None:
+            period = datetime.now().strftime("Q%m %Y")
+
+        batch_config = self.config.get('batch', {})
+        checkpoint = None
+        if checkpoint_path:
+            checkpoint = BatchCheckpoint(checkpoint_path, context={'period': period})
+
+        def task(parameter: str, country: str):
+            cached = (
+                use_cache and not self.force_new_research
+                and self.research_store.is_cache_valid(parameter, country)
+            )
+            doc = self.get_research(
+                parameter=parameter,
+                country=country,
+                period=period,
+                use_cache=use_cache
+            )
+            return doc, cached
+
+        runner = BatchRunner(
+            max_workers=max_workers or batch_config.get('max_workers', DEFAULT_MAX_WORKERS),
+            checkpoint=checkpoint
+        )
+
+        total = len(parameters) * len(countries)
+        logger.info(f"Starting batch research: {len(parameters)} params × {len(countries)} countries = {total} total")
+
+        return runner.run(
+            [(parameter, country) for parameter in parameters for country in countries],
+            task,
+            on_result=on_result,
+            checkpoint_info=lambda item: {'version': item.result.version} if item.result else {}
+        )
+
     def batch_generate_research(
         self,
         parameters: List[str],
         countries: List[str],
         period: Optional[str] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None
     ) -> Dict[str, ResearchDocument]:
         """Generate research for multiple parameter-country combinations.
 
@@ -165,40 +254,57 @@ class ResearchOrchestrator:
             countries: List of country names
             period: Time period
             use_cache: Whether to use cached research
+            max_workers: Concurrent tasks (default: batch.max_workers or 4)
+            checkpoint_path: Optional checkpoint file for resuming
 
         Returns:
             Dictionary mapping "parameter|country" to ResearchDocument
         """
+        outcomes = self.run_batch(
+            parameters=parameters,
+            countries=countries,
+            period=period,
+            use_cache=use_cache,
+            max_workers=max_workers,
+            checkpoint_path=checkpoint_path
+        )
+
         results = {}
-        total = len(parameters) * len(countries)
-        current = 0
+        for item in outcomes:
+            if item.status == 'resumed':
+                # Finished by an earlier run; read back what it stored
+                doc = self.research_store.load(item.parameter, item.country)
+            else:
+                doc = item.result
+            if doc is not None:
+                results[item.key] = doc
 
-        logger.info(f"Starting batch research: {len(parameters)} params × {len(countries)} countries = {total} total")
+        logger.info(f"Batch research complete: {len(results)}/{len(outcomes)} successful")
 
-        for parameter in parameters:
-            for country in countries:
-                current += 1
-                key = f"{parameter}|{country}"
+        return results
 
-                logger.info(f"[{current}/{total}] Processing {key}")
+    def prefetch_research(
+        self,
+        countries: List[str],
+        parameters: Optional[List[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Load and parse stored research concurrently to warm the document cache.
 
-                try:
-                    doc = self.get_research(
-                        parameter=parameter,
-                        country=country,
-                        period=period,
-                        use_cache=use_cache
-                    )
-                    results[key] = doc
-                except Exception as e:
-                    logger.error(f"Failed to get research for {key}: {e}")
-                    # Continue with next item
-                    continue
+        Call this before a ranking run so agents read research from memory
+        instead of each paying disk and parse latency. Nothing is generated;
+        missing research is left to get_research.
 
-        success_count = len(results)
-        logger.info(f"Batch research complete: {success_count}/{total} successful")
+        Args:
+            countries: Countries that will be analyzed
+            parameters: Parameters that will be analyzed (default: all stored)
+            max_workers: Concurrent loads (default: batch.max_workers or 4)
 
-        return results
+        Returns:
+            Dictionary with requested, loaded and missing counts and seconds taken
+        """
+        workers = max_workers or self.config.get('batch', {}).get('max_workers', DEFAULT_MAX_WORKERS)
+        return prefetch_documents(self.research_store, countries, parameters, workers)
 
     def generate_all_prompts(self) -> Dict[str, str]:
         """Generate and save prompts for all parameters.
@@ -339,6 +445,40 @@ class ResearchOrchestrator:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+    def export_all_research(
+        self,
+        output_path: str,
+        format: Optional[str] = None,
+        parameters: Optional[List[str]] = None,
+        countries: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        all_versions: bool = False
+    ) -> Dict[str, Any]:
+        """Export stored research in bulk to an NDJSON or Parquet dataset.
+
+        Args:
+            output_path: Destination file (.ndjson, .jsonl or .parquet)
+            format: 'ndjson' or 'parquet' (default: from the file extension)
+            parameters: Parameters to include (default: all)
+            countries: Countries to include (default: all)
+            since: Include versions created at or after this ISO date
+            until: Include versions created before this ISO date
+            all_versions: Export every stored version, not only the latest
+
+        Returns:
+            Dictionary with path, format, documents exported and seconds taken
+        """
+        exporter = ResearchExporter(
+            self.research_store,
+            parameters=parameters,
+            countries=countries,
+            since=since,
+            until=until,
+            all_versions=all_versions
+        )
+        return exporter.export(output_path, format=format)
+
     def _format_as_markdown(self, doc: ResearchDocument) -> str:
         """Format research document as markdown.
 
@@ -0,0 +1,287 @@
+"""Research Reader - Shared, read-only access to stored research
+
+Agents only read cached research, so they do not need the LLM-backed
+generator that ResearchOrchestrator wraps. A ResearchReader holds just the
+configuration and a ResearchStore; the orchestrator (prompt generator,
+research agent and LLM clients) is built the first time a cache miss
+actually requires generating research.
+
+One reader is shared per configuration file in the process:
+
+    >>> from research_system.src.research_reader import get_research_reader
+    >>> doc = get_research_reader().get_research("Ambition", "Germany")
+"""
+
+from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import logging
+import os
+import threading
+import time
+import yaml
+
+from .storage.research_store import ResearchStore, ResearchDocument, DEFAULT_DOCUMENT_CACHE_SIZE
+from .storage.packed_store import PackedResearchStore
+from .version_manager import VersionStrategy
+from .batch_runner import DEFAULT_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Default research system configuration file
+DEFAULT_CONFIG_PATH = "research_system/config/research_config.yaml"
+
+# Shared readers, keyed by resolved config path (and by cwd + path as given)
+_readers: Dict[Any, "ResearchReader"] = {}
+_readers_lock = threading.Lock()
+
+
+def load_research_config(config_path: str) -> Dict[str, Any]:
+    """Load research system configuration.
+
+    Args:
+        config_path: Path to config file
+
+    Returns:
+        Configuration dictionary (empty if the file does not exist)
+    """
+    config_file = Path(config_path)
+
+    if not config_file.exists():
+        logger.warning(f"Config not found: {config_path}, using defaults")
+        return {}
+
+    with open(config_file, 'r') as f:
+        config = yaml.safe_load(f)
+
+    return config or {}
+
+
+def create_research_store(config: Dict[str, Any]) -> ResearchStore:
+    """Create the research store configured under storage and cache.
+
+    Args:
+        config: Research system configuration
+
+    Returns:
+        ResearchStore, or PackedResearchStore when storage.backend is 'packed'
+    """
+    storage_config = config.get('storage', {})
+    cache_config = config.get('cache', {})
+
+    if storage_config.get('backend', 'directory') == 'packed':
+        store_class = PackedResearchStore
+        base_path = storage_config.get('pack_path', 'research_system/data/research_pack')
+    else:
+        store_class = ResearchStore
+        base_path = storage_config.get('base_path', 'research_system/data/research_documents')
+
+    return store_class(
+        base_path=base_path,
+        cache_ttl=cache_config.get('ttl', 604800),
+        version_strategy=VersionStrategy(
+            storage_config.get('versioning', {}).get('strategy', 'semantic')
+        ),
+        document_cache_size=cache_config.get('document_cache_size', DEFAULT_DOCUMENT_CACHE_SIZE)
+    )
+
+
+def prefetch_documents(
+    store: ResearchStore,
+    countries: List[str],
+    parameters: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Any]:
+    """Load the latest research for parameter-country pairs into the document cache.
+
+    Args:
+        store: Research store to read
+        countries: Countries that will be analyzed
+        parameters: Parameters that will be analyzed (default: all stored)
+        max_workers: Concurrent loads
+
+    Returns:
+        Dictionary with requested, loaded and missing counts and seconds taken
+    """
+    start = time.monotonic()
+
+    if parameters is None:
+        parameters = sorted({item['parameter'] for item in store.list_all_research()})
+
+    pairs = [
+        (parameter, country)
+        for parameter in parameters
+        for country in countries
+        if store.exists(parameter, country)
+    ]
+    store.reserve_document_cache(len(pairs))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="research-prefetch") as executor:
+        documents = list(executor.map(lambda pair: store.load(*pair), pairs))
+
+    stats = {
+        'requested': len(parameters) * len(countries),
+        'loaded': sum(1 for doc in documents if doc is not None),
+        'missing': len(parameters) * len(countries) - len(pairs),
+        'seconds': time.monotonic() - start
+    }
+    logger.info(
+        f"Prefetched {stats['loaded']}/{stats['requested']} research documents "
+        f"in {stats['seconds']:.2f}s ({stats['missing']} not stored)"
+    )
+    return stats
+
+
+def get_research_reader(config_path: str = DEFAULT_CONFIG_PATH) -> "ResearchReader":
+    """Get the process-wide reader for a configuration file.
+
+    Args:
+        config_path: Path to research configuration file
+
+    Returns:
+        Shared ResearchReader (created on first call)
+    """
+    # Resolving the path is slow; remember readers by the path as given too
+    alias = (os.getcwd(), config_path)
+    reader = _readers.get(alias)
+    if reader is None:
+        with _readers_lock:
+            key = str(Path(config_path).resolve())
+            reader = _readers.get(key)
+            if reader is None:
+                reader = ResearchReader(config_path)
+                _readers[key] = reader
+            _readers[alias] = reader
+    return reader
+
+
+class ResearchReader:
+    """Read-only research access with on-demand generation.
+
+    Documents returned are shared with the store's document cache and must
+    not be modified.
+    """
+
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        """Initialize research reader.
+
+        Args:
+            config_path: Path to research configuration file
+        """
+        self.config_path = config_path
+        self.config = load_research_config(config_path)
+        self.research_store = create_research_store(self.config)
+
+        self._orchestrator = None
+        self._orchestrator_lock = threading.Lock()
+
+        logger.info("ResearchReader initialized")
+
+    @property
+    def orchestrator(self):
+        """Research orchestrator sharing this reader's store, built on first use.
+
+        Returns:
+            ResearchOrchestrator instance
+        """
+        if self._orchestrator is None:
+            with self._orchestrator_lock:
+                if self._orchestrator is None:
+                    from .research_orchestrator import ResearchOrchestrator
+                    self._orchestrator = ResearchOrchestrator(
+                        config_path=self.config_path,
+                        research_store=self.research_store
+                    )
+        return self._orchestrator
+
+    @property
+    def generator_loaded(self) -> bool:
+        """Whether the LLM-backed generator has been built."""
+        return self._orchestrator is not None
+
+    def get_research(
+        self,
+        parameter: str,
+        country: str,
+        period: Optional[str] = None,
+        use_cache: bool = True,
+        additional_context: Optional[str] = None
+    ) -> ResearchDocument:
+        """Get research, generating it only when no valid cached copy exists.
+
+        Same contract as ResearchOrchestrator.get_research.
+
+        Args:
+            parameter: Parameter name
+            country: Country name
+            period: Time period (defaults to current quarter)
+            use_cache: Whether to use cached research
+            additional_context: Additional research context
+
+        Returns:
+            ResearchDocument with content and metadata
+        """
+        if use_cache and self.research_store.is_cache_valid(parameter, country):
+            cached = self.research_store.load(parameter, country)
+            if cached:
+                logger.debug(f"Using cached research for {parameter}/{country}")
+                return cached
+
+        return self.orchestrator.get_research(
+            parameter=parameter,
+            country=country,
+            period=period,
+            use_cache=use_cache,
+            additional_context=additional_context
+        )
+
+    def load(
+        self,
+        parameter: str,
+        country: str,
+        version: Optional[str] = None
+    ) -> Optional[ResearchDocument]:
+        """Load stored research without generating.
+
+        Args:
+            parameter: Parameter name
+            country: Country name
+            version: Version to load (None for latest)
+
+        Returns:
+            ResearchDocument or None if not stored
+        """
+        return self.research_store.load(parameter, country, version)
+
+    def exists(self, parameter: str, country: str) -> bool:
+        """Check whether research is stored for a parameter-country combination."""
+        return self.research_store.exists(parameter, country)
+
+    def prefetch_research(
+        self,
+        countries: List[str],
+        parameters: Optional[List[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Load and parse stored research concurrently to warm the document cache.
+
+        Nothing is generated, so the LLM-backed generator is not built.
+
+        Args:
+            countries: Countries that will be analyzed
+            parameters: Parameters that will be analyzed (default: all stored)
+            max_workers: Concurrent loads (default: batch.max_workers or 4)
+
+        Returns:
+            Dictionary with requested, loaded and missing counts and seconds taken
+        """
+        workers = max_workers or self.config.get('batch', {}).get('max_workers', DEFAULT_MAX_WORKERS)
+        return prefetch_documents(self.research_store, countries, parameters, workers)
+
+    def refresh(self) -> int:
+        """Re-scan storage to pick up research written by other processes.
+
+        Returns:
+            Number of parameter-country combinations indexed
+        """
+        return self.research_store.rebuild_index()
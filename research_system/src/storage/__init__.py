@@ -1,5 +1,7 @@
 """Research System Storage - Handles persistence of research documents."""
 
 from .research_store import ResearchStore
+from .packed_store import PackedResearchStore
+from .exporter import ResearchExporter
 
-__all__ = ['ResearchStore']
+__all__ = ['ResearchStore', 'PackedResearchStore', 'ResearchExporter']
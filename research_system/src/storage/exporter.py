@@ -0,0 +1,325 @@
+"""Research Exporter - Streams the whole research store to analytics datasets
+
+Walks the store once, reading one document at a time, and writes a record
+per document (metadata, scores, narrative sections, key metrics and
+sources) to:
+- NDJSON: one JSON object per line
+- Parquet: columnar, written in row groups (requires pip install pyarrow)
+
+Memory use is bounded by one row group regardless of corpus size. Documents
+are read past the store's document cache, so exports do not evict the
+documents agents are working with.
+
+Filters on parameter, country and creation date allow incremental exports:
+
+    >>> exporter = ResearchExporter(store, since="2026-01-01")
+    >>> exporter.export("research.ndjson")
+"""
+
+from typing import Dict, Any, List, Optional, Iterator, Union
+from datetime import datetime, date, timezone
+from pathlib import Path
+import json
+import logging
+import os
+import threading
+import time
+
+from .research_store import ResearchStore
+
+logger = logging.getLogger(__name__)
+
+# Narrative sections of a research document, in document order
+SECTION_FIELDS = [
+    'overview',
+    'current_status',
+    'historical_trends',
+    'policy_framework',
+    'challenges',
+    'opportunities',
+    'future_outlook',
+    'data_quality_notes'
+]
+
+# Fields of each key metric and source, exported as strings
+METRIC_FIELDS = ['metric', 'value', 'unit', 'source', 'date']
+SOURCE_FIELDS = ['name', 'url', 'access_date']
+
+# Export formats by file extension
+EXPORT_FORMATS = {
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.parquet': 'parquet'
+}
+
+# Records buffered per Parquet row group
+DEFAULT_ROW_GROUP_SIZE = 500
+
+
+def _naive(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive UTC; naive ones are kept as is."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _as_datetime(value: Union[str, date, datetime, None]) -> Optional[datetime]:
+    """Convert a date filter (ISO string, date or datetime) to a naive datetime."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return _naive(value)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return _naive(datetime.fromisoformat(value))
+
+
+def _as_string(value: Any) -> Optional[str]:
+    """String form of a scalar field, keeping None."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Float form of a numeric field, or None."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _entries(items: Any, fields: List[str]) -> List[Dict[str, Optional[str]]]:
+    """Normalize a list of dictionaries to a fixed set of string fields."""
+    if not isinstance(items, list):
+        return []
+    return [
+        {field: _as_string(item.get(field)) for field in fields}
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+class ResearchExporter:
+    """Streams research documents from a store to NDJSON or Parquet."""
+
+    def __init__(
+        self,
+        store: ResearchStore,
+        parameters: Optional[List[str]] = None,
+        countries: Optional[List[str]] = None,
+        since: Union[str, date, datetime, None] = None,
+        until: Union[str, date, datetime, None] = None,
+        all_versions: bool = False
+    ):
+        """Initialize exporter.
+
+        Args:
+            store: Research store to export
+            parameters: Parameters to include (default: all)
+            countries: Countries to include (default: all)
+            since: Include versions created at or after this date
+            until: Include versions created before this date
+            all_versions: Export every stored version, not only the latest
+        """
+        self.store = store
+        self.parameters = {store._index_key(p, '')[0] for p in parameters} if parameters else None
+        self.countries = {store._index_key('', c)[1] for c in countries} if countries else None
+        self.since = _as_datetime(since)
+        self.until = _as_datetime(until)
+        self.all_versions = all_versions
+
+    def _in_date_range(self, created_at: Optional[str]) -> bool:
+        """Check a version's creation timestamp against since/until."""
+        if self.since is None and self.until is None:
+            return True
+        try:
+            created = _naive(datetime.fromisoformat(created_at))
+        except (TypeError, ValueError):
+            return False
+        if self.since is not None and created < self.since:
+            return False
+        if self.until is not None and created >= self.until:
+            return False
+        return True
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield one export record per matching document version.
+
+        Combinations are visited in sorted order, newest version first.
+        Metadata is checked against the filters before content is read.
+        """
+        for key in sorted(self.store._index):
+            param_dir, country_dir = key
+            if self.parameters is not None and param_dir not in self.parameters:
+                continue
+            if self.countries is not None and country_dir not in self.countries:
+                continue
+
+            entry = self.store._index.get(key)
+            if entry is None:
+                continue
+
+            versions = self.store._versions(entry, *key) if self.all_versions else [entry.latest_version]
+            for version in versions:
+                if version == entry.latest_version and entry.metadata:
+                    metadata = entry.metadata
+                else:
+                    metadata = self.store._load_metadata(param_dir, country_dir, version)
+                metadata_dict = metadata.to_dict() if metadata else {}
+
+                if not self._in_date_range(metadata_dict.get('created_at')):
+                    continue
+
+                content = self.store._load_content(param_dir, country_dir, version)
+                if content is None:
+                    continue
+
+                yield self._record(entry.parameter, entry.country, version, content, metadata_dict)
+
+    @staticmethod
+    def _record(
+        parameter: str,
+        country: str,
+        version: str,
+        content: Dict[str, Any],
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Flatten a document into an export record."""
+        validation = content.get('_validation') if isinstance(content.get('_validation'), dict) else {}
+        scores = validation.get('scores') if isinstance(validation.get('scores'), dict) else {}
+
+        record = {
+            'parameter': metadata.get('parameter') or content.get('parameter') or parameter,
+            'country': metadata.get('country') or content.get('country') or country,
+            'version': version,
+            'period': _as_string(metadata.get('period') or content.get('period')),
+            'created_at': _as_string(metadata.get('created_at')),
+            'change_type': _as_string(metadata.get('change_type')),
+            'change_description': _as_string(metadata.get('change_description')),
+            'checksum': _as_string(metadata.get('checksum')),
+            'file_size': metadata.get('file_size'),
+            'research_date': _as_string(content.get('research_date')),
+            'confidence': _as_float(content.get('confidence')),
+            'completeness_score': _as_float(content.get('completeness_score')),
+            'validation_score': _as_float(scores.get('overall')),
+            'validation_passed': validation.get('passed') if isinstance(validation.get('passed'), bool) else None
+        }
+        for field in SECTION_FIELDS:
+            record[field] = _as_string(content.get(field))
+        record['key_metrics'] = _entries(content.get('key_metrics'), METRIC_FIELDS)
+        record['sources'] = _entries(content.get('sources'), SOURCE_FIELDS)
+        return record
+
+    def export(
+        self,
+        output_path: str,
+        format: Optional[str] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ) -> Dict[str, Any]:
+        """Export matching documents to a file.
+
+        The file is written under a temporary name and moved into place when
+        complete, so readers never see a partial export.
+
+        Args:
+            output_path: Destination file
+            format: 'ndjson' or 'parquet' (default: from the file extension)
+            row_group_size: Records per Parquet row group
+
+        Returns:
+            Dictionary with path, format, documents exported and seconds taken
+        """
+        path = Path(output_path)
+        format = format or EXPORT_FORMATS.get(path.suffix.lower())
+        if format not in ('ndjson', 'parquet'):
+            raise ValueError(f"Unsupported export format: {format or path.suffix}")
+
+        start = time.monotonic()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if format == 'ndjson':
+                count = self._write_ndjson(tmp_path)
+            else:
+                count = self._write_parquet(tmp_path, row_group_size)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        stats = {
+            'path': str(path),
+            'format': format,
+            'documents': count,
+            'seconds': time.monotonic() - start
+        }
+        logger.info(f"Exported {count} research documents to {path} ({format}) in {stats['seconds']:.2f}s")
+        return stats
+
+    def _write_ndjson(self, path: Path) -> int:
+        """Write records as newline-delimited JSON."""
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in self.iter_records():
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+                count += 1
+        return count
+
+    def _write_parquet(self, path: Path, row_group_size: int) -> int:
+        """Write records as Parquet, one row group per row_group_size records."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+        schema = self.parquet_schema()
+        count = 0
+        with pq.ParquetWriter(str(path), schema) as writer:
+            batch = []
+            for record in self.iter_records():
+                batch.append(record)
+                if len(batch) >= row_group_size:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    count += len(batch)
+                    batch = []
+            if batch or count == 0:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+        return count
+
+    @staticmethod
+    def parquet_schema():
+        """Arrow schema of exported records (requires pyarrow)."""
+        import pyarrow as pa
+
+        def entries(fields: List[str]):
+            return pa.list_(pa.struct([(field, pa.string()) for field in fields]))
+
+        return pa.schema(
+            [
+                ('parameter', pa.string()),
+                ('country', pa.string()),
+                ('version', pa.string()),
+                ('period', pa.string()),
+                ('created_at', pa.string()),
+                ('change_type', pa.string()),
+                ('change_description', pa.string()),
+                ('checksum', pa.string()),
+                ('file_size', pa.int64()),
+                ('research_date', pa.string()),
+                ('confidence', pa.float64()),
+                ('completeness_score', pa.float64()),
+                ('validation_score', pa.float64()),
+                ('validation_passed', pa.bool_())
+            ]
+            + [(field, pa.string()) for field in SECTION_FIELDS]
+            + [
+                ('key_metrics', entries(METRIC_FIELDS)),
+                ('sources', entries(SOURCE_FIELDS))
+            ]
+        )
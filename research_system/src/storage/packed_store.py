@@ -0,0 +1,452 @@
+"""Packed Research Store - Single-file backend for research documents
+
+Stores every version's research.json and metadata.json bytes in one
+append-only pack file, with an append-only offset index next to it:
+
+- research.pack: raw document bytes, concatenated
+- research.idx: one JSON record per line locating a version's content and
+  metadata in the pack ({"op": "put", ...}), or removing it ({"op": "delete", ...})
+
+Reads go through a read-only memory map of the pack, so cold loads cost one
+open file instead of two small files per version. The bytes stored are the
+same bytes the directory layout writes, so loaded ResearchDocument objects
+are identical to those of the directory-based ResearchStore.
+
+Writers serialize on a thread lock plus an flock on research.lock, so
+several threads or processes can save into one pack.
+"""
+
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterator
+from pathlib import Path
+from contextlib import contextmanager
+import json
+import mmap
+import logging
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads in this process are serialized
+    fcntl = None
+
+from .research_store import ResearchStore, DEFAULT_DOCUMENT_CACHE_SIZE
+from ..version_manager import ChangeType, VersionMetadata, VersionStrategy
+
+logger = logging.getLogger(__name__)
+
+PACK_FILE = "research.pack"
+INDEX_FILE = "research.idx"
+LOCK_FILE = "research.lock"
+
+
+class PackedResearchStore(ResearchStore):
+    """ResearchStore backed by a single append-only pack file.
+
+    Saves hold the writer lock from choosing the version number to
+    committing the index record, and first pick up records other processes
+    appended. Readers in other processes can call rebuild_index() to pick
+    up appended versions.
+    """
+
+    def __init__(
+        self,
+        base_path: str = "research_system/data/research_pack",
+        cache_ttl: int = 604800,  # 7 days
+        version_strategy: VersionStrategy = VersionStrategy.SEMANTIC,
+        document_cache_size: int = DEFAULT_DOCUMENT_CACHE_SIZE
+    ):
+        """Initialize packed research store.
+
+        Args:
+            base_path: Directory holding research.pack and research.idx
+            cache_ttl: Cache time-to-live in seconds
+            version_strategy: Versioning strategy
+            document_cache_size: Parsed documents kept in memory (0 disables)
+        """
+        self.pack_path = Path(base_path) / PACK_FILE
+        self.index_path = Path(base_path) / INDEX_FILE
+        self.lock_path = Path(base_path) / LOCK_FILE
+
+        # (parameter_dir, country_dir) -> version -> (content span, metadata span)
+        self._records: Dict[Tuple[str, str], Dict[str, Tuple[Tuple[int, int], Tuple[int, int]]]] = {}
+        self._index_offset = 0
+        self._map: Optional[mmap.mmap] = None
+        self._map_lock = threading.Lock()
+        # Reentrant: save() holds it while _append and _commit take it again
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+
+        super().__init__(
+            base_path=base_path,
+            cache_ttl=cache_ttl,
+            version_strategy=version_strategy,
+            document_cache_size=document_cache_size
+        )
+
+    def save(
+        self,
+        parameter: str,
+        country: str,
+        period: str,
+        content: Dict[str, Any],
+        change_type: ChangeType = ChangeType.MINOR,
+        change_description: Optional[str] = None,
+        change_summary: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Save a new research document under the writer lock.
+
+        See ResearchStore.save. Holding the lock across the whole save keeps
+        concurrent writers from choosing the same version number.
+        """
+        with self._writing():
+            return super().save(
+                parameter, country, period, content,
+                change_type, change_description, change_summary
+            )
+
+    def rebuild_index(self) -> int:
+        """Re-read the offset index and rebuild the metadata index.
+
+        Returns:
+            Number of parameter-country combinations indexed
+        """
+        with self._write_lock:
+            self._records = {}
+            self._index_offset = 0
+            self._read_offset_index()
+            return super().rebuild_index()
+
+    def close(self) -> None:
+        """Release the memory map of the pack file.
+
+        Must not be called while other threads are reading from the store.
+        """
+        with self._map_lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def import_directory(self, source_path: str) -> Dict[str, int]:
+        """Copy every version from a directory-layout store into this pack.
+
+        Raw research.json and metadata.json bytes are copied unchanged.
+        Versions already in the pack are skipped, so the import can be rerun.
+
+        Args:
+            source_path: Base directory of a directory-layout ResearchStore
+
+        Returns:
+            Dictionary with counts of imported and skipped versions
+        """
+        source = ResearchStore(
+            base_path=source_path,
+            cache_ttl=self.cache_ttl,
+            version_strategy=self.version_manager.strategy
+        )
+        stats = {'imported': 0, 'skipped': 0}
+
+        with self._writing():
+            self._import_locations(source, stats)
+
+        super().rebuild_index()
+        logger.info(
+            f"Imported {stats['imported']} versions from {source_path} "
+            f"({stats['skipped']} skipped)"
+        )
+        return stats
+
+    def _import_locations(self, source: ResearchStore, stats: Dict[str, int]) -> None:
+        """Append every version of source missing from the pack (lock held)."""
+        for param_dir, country_dir in source._locations():
+            # Oldest first, so pack order follows version order
+            for version in reversed(source._list_versions(param_dir, country_dir)):
+                if version in self._records.get((param_dir, country_dir), {}):
+                    stats['skipped'] += 1
+                    continue
+
+                version_path = source.version_manager.get_version_path(param_dir, country_dir, version)
+                content_file = version_path / "research.json"
+                metadata_file = version_path / "metadata.json"
+                if not content_file.exists():
+                    logger.warning(f"Skipping {param_dir}/{country_dir}/{version}: no research.json")
+                    stats['skipped'] += 1
+                    continue
+
+                content_bytes = content_file.read_bytes()
+                metadata_bytes = metadata_file.read_bytes() if metadata_file.exists() else b''
+                self._append(param_dir, country_dir, version, content_bytes, metadata_bytes)
+                stats['imported'] += 1
+
+    def cleanup_old_versions(
+        self,
+        parameter: str,
+        country: str,
+        keep_count: int = 5
+    ) -> int:
+        """Remove old versions, keeping only the most recent N.
+
+        Removed versions are dropped from the offset index; their bytes stay
+        in the pack until it is rewritten.
+
+        Args:
+            parameter: Parameter name
+            country: Country name
+            keep_count: Number of versions to keep
+
+        Returns:
+            Number of versions deleted
+        """
+        key = self._index_key(parameter, country)
+
+        with self._writing():
+            versions = self._list_versions(*key)
+            if len(versions) <= keep_count:
+                return 0
+
+            self._materialize_deltas(parameter, country, versions[:keep_count])
+
+            lines = []
+            for version in versions[keep_count:]:
+                lines.append(json.dumps({
+                    'op': 'delete',
+                    'parameter': key[0],
+                    'country': key[1],
+                    'version': version
+                }) + '\n')
+                self._records[key].pop(version, None)
+                logger.info(f"Deleted old version: {version}")
+
+            with open(self.index_path, 'a') as f:
+                f.write(''.join(lines))
+            self._index_offset = self.index_path.stat().st_size
+
+            self.invalidate_document_cache(parameter, country)
+            self._refresh_entry(*key)
+        return len(lines)
+
+    # Storage backend
+
+    def _locations(self) -> List[Tuple[str, str]]:
+        """List (parameter_dir, country_dir) pairs present in the pack."""
+        return [key for key, versions in self._records.items() if versions]
+
+    def _list_versions(self, parameter: str, country: str) -> List[str]:
+        """List packed versions, newest first."""
+        versions = list(self._records.get(self._index_key(parameter, country), {}))
+        versions.sort(key=lambda v: self.version_manager.parse_version(v), reverse=True)
+        return versions
+
+    def _latest_version(self, parameter: str, country: str) -> Optional[str]:
+        """Latest packed version (the offset index is already in memory)."""
+        versions = self._list_versions(parameter, country)
+        return versions[0] if versions else None
+
+    def _content_size(self, parameter: str, country: str, version: str) -> int:
+        """Size in bytes of a version's packed content."""
+        record = self._records.get(self._index_key(parameter, country), {}).get(version)
+        return record[0][1] if record else 0
+
+    def _content_stamp(self, parameter: str, country: str, version: str) -> Optional[Tuple]:
+        """Fingerprint of a version's packed content (its span in the pack)."""
+        record = self._records.get(self._index_key(parameter, country), {}).get(version)
+        return record[0] if record else None
+
+    def _load_metadata(self, parameter: str, country: str, version: str) -> Optional[VersionMetadata]:
+        """Read a version's metadata from the pack."""
+        record = self._records.get(self._index_key(parameter, country), {}).get(version)
+        if record is None or record[1][1] == 0:
+            return None
+
+        try:
+            return VersionMetadata(**json.loads(self._read_span(record[1])))
+        except Exception as e:
+            logger.error(f"Error loading metadata for {parameter}/{country}/{version}: {e}")
+            return None
+
+    def _read_content(self, parameter: str, country: str, version: str) -> Optional[Dict[str, Any]]:
+        """Read and parse a version's content from the pack."""
+        record = self._records.get(self._index_key(parameter, country), {}).get(version)
+        if record is None:
+            logger.warning(f"Research content not found in pack: {parameter}/{country}/{version}")
+            return None
+
+        try:
+            return json.loads(self._read_span(record[0]))
+        except Exception as e:
+            logger.error(f"Error loading research content: {e}")
+            return None
+
+    def _write_version(
+        self,
+        parameter: str,
+        country: str,
+        version: str,
+        content: Dict[str, Any],
+        metadata: VersionMetadata
+    ) -> None:
+        """Append a version's content and metadata, setting metadata.file_size."""
+        # Same serialization as the directory layout
+        content_bytes = json.dumps(content, indent=2).encode()
+        metadata.file_size = len(content_bytes)
+        metadata_bytes = json.dumps(metadata.to_dict(), indent=2).encode()
+
+        param_clean, country_clean = self._index_key(parameter, country)
+        self._append(param_clean, country_clean, version, content_bytes, metadata_bytes)
+
+    def _write_metadata(
+        self,
+        parameter: str,
+        country: str,
+        version: str,
+        metadata: VersionMetadata
+    ) -> None:
+        """Append new metadata for a version, keeping its packed content."""
+        key = self._index_key(parameter, country)
+        metadata_bytes = json.dumps(metadata.to_dict(), indent=2).encode()
+
+        with self._writing():
+            content_span = self._records[key][version][0]
+
+            with open(self.pack_path, 'ab') as f:
+                offset = f.tell()
+                f.write(metadata_bytes)
+
+            self._commit({
+                'op': 'put',
+                'parameter': key[0],
+                'country': key[1],
+                'version': version,
+                'content': list(content_span),
+                'metadata': [offset, len(metadata_bytes)]
+            })
+
+    def _append(
+        self,
+        param_dir: str,
+        country_dir: str,
+        version: str,
+        content_bytes: bytes,
+        metadata_bytes: bytes
+    ) -> None:
+        """Append document bytes to the pack, then commit them to the offset index."""
+        # Data first, index record last: a version only exists once indexed
+        with self._writing():
+            with open(self.pack_path, 'ab') as f:
+                offset = f.tell()
+                f.write(content_bytes)
+                f.write(metadata_bytes)
+
+            self._commit({
+                'op': 'put',
+                'parameter': param_dir,
+                'country': country_dir,
+                'version': version,
+                'content': [offset, len(content_bytes)],
+                'metadata': [offset + len(content_bytes), len(metadata_bytes)]
+            })
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Hold the writer lock, catching up on other writers' records first.
+
+        The offsets a writer records are only valid while no other thread or
+        process appends between its tell() and its index record.
+        """
+        with self._write_lock:
+            if self._write_depth:
+                # Already held further up this thread's stack
+                self._write_depth += 1
+                try:
+                    yield
+                finally:
+                    self._write_depth -= 1
+                return
+
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._write_depth = 1
+                try:
+                    for key in self._read_offset_index():
+                        self.invalidate_document_cache(*key)
+                        self._refresh_entry(*key)
+                    yield
+                finally:
+                    self._write_depth = 0
+                    if fcntl is not None:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _commit(self, record: Dict[str, Any]) -> None:
+        """Append a record to the offset index and apply it (writer lock held)."""
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        self._index_offset = self.index_path.stat().st_size
+
+        self._apply_record(record)
+
+    def _read_offset_index(self) -> Set[Tuple[str, str]]:
+        """Apply offset index records appended since the last read.
+
+        Returns:
+            (parameter_dir, country_dir) pairs the records touched
+        """
+        if not self.index_path.exists():
+            return set()
+
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._index_offset)
+            data = f.read()
+
+        # Ignore a trailing partial line still being written
+        complete = data[:data.rfind(b'\n') + 1]
+        self._index_offset += len(complete)
+
+        touched = set()
+        for line in complete.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                self._apply_record(record)
+                touched.add((record['parameter'], record['country']))
+        return touched
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply one offset index record to the in-memory record table."""
+        key = (record['parameter'], record['country'])
+        if record['op'] == 'delete':
+            self._records.get(key, {}).pop(record['version'], None)
+        else:
+            self._records.setdefault(key, {})[record['version']] = (
+                tuple(record['content']), tuple(record['metadata'])
+            )
+
+    def _read_span(self, span: Tuple[int, int]) -> bytes:
+        """Read bytes from the pack through its memory map."""
+        offset, length = span
+        if length == 0:
+            return b''
+
+        pack_map = self._map
+        if pack_map is None or offset + length > len(pack_map):
+            pack_map = self._remap(offset + length)
+
+        return pack_map[offset:offset + length]
+
+    def _remap(self, size: int) -> mmap.mmap:
+        """Map the pack again once it has grown past the current map.
+
+        The new map is swapped in under a lock. The old map is not closed:
+        concurrent readers may still be slicing it, and it is unmapped when
+        the last of them drops its reference.
+
+        Args:
+            size: Bytes the map must cover
+
+        Returns:
+            Memory map covering at least size bytes
+        """
+        with self._map_lock:
+            if self._map is None or size > len(self._map):
+                with open(self.pack_path, 'rb') as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map
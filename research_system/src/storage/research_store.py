@@ -7,18 +7,174 @@ Handles saving, loading, and querying research documents with:
 - Query capabilities
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
+import difflib
 import json
 import hashlib
 import logging
-from dataclasses import dataclass, asdict
+import os
+import threading
+from dataclasses import dataclass, asdict, replace
 
 from ..version_manager import VersionManager, VersionMetadata, ChangeType, VersionStrategy
 
 logger = logging.getLogger(__name__)
 
+# Parsed documents kept in memory per store
+DEFAULT_DOCUMENT_CACHE_SIZE = 256
+
+# Parser outputs kept in memory per store (18 parsers x all stored documents)
+DEFAULT_PARSE_CACHE_SIZE = 4096
+
+# Directory under the store holding parser outputs, <parser_key>/<checksum>.json
+PARSE_CACHE_DIR = '_parsed'
+
+# Marker key of a version stored as a delta against its parent
+DELTA_KEY = '__delta__'
+
+# Store a delta when it is at most this fraction of the full document's size
+DELTA_MAX_RATIO = 0.25
+
+# Longest chain of deltas before a full document is stored again
+MAX_DELTA_CHAIN = 8
+
+# Strings at least this long are diffed line by line instead of replaced
+DELTA_TEXT_MIN_CHARS = 200
+
+# Top-level keys regenerated wholesale on every run (the raw LLM response).
+# Deltas still carry them, but they do not count toward DELTA_MAX_RATIO.
+DELTA_EXEMPT_KEYS = ('_raw_response',)
+
+# Bookkeeping keys ignored when deciding whether regenerated content changed
+VOLATILE_CONTENT_KEYS = ('_metadata',)
+
+
+def diff_content(
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    path: Tuple[str, ...] = ()
+) -> Tuple[List[list], List[list], List[list]]:
+    """Diff two nested dictionaries.
+
+    Changed long strings are diffed line by line and changed lists element
+    by element, when the resulting patch is smaller than the new value.
+
+    Args:
+        old: Previous content
+        new: New content
+        path: Key path of the dictionaries being compared
+
+    Returns:
+        Tuple of ([key path, new value] assignments, [key path, patch]
+        patches, removed key paths)
+    """
+    assignments, patches, removals = [], [], []
+    for key, value in new.items():
+        if key not in old:
+            assignments.append([list(path + (key,)), value])
+        elif old[key] != value:
+            if isinstance(value, dict) and isinstance(old[key], dict):
+                sub_assignments, sub_patches, sub_removals = diff_content(old[key], value, path + (key,))
+                assignments.extend(sub_assignments)
+                patches.extend(sub_patches)
+                removals.extend(sub_removals)
+                continue
+
+            patch = _sequence_patch(old[key], value)
+            if patch is not None:
+                patches.append([list(path + (key,)), patch])
+            else:
+                assignments.append([list(path + (key,)), value])
+    for key in old:
+        if key not in new:
+            removals.append(list(path + (key,)))
+    return assignments, patches, removals
+
+
+def _sequence_patch(old: Any, new: Any) -> Optional[Dict[str, list]]:
+    """Line patch between long strings or element patch between lists.
+
+    Returns:
+        {'lines': edits} or {'items': edits}, with [start, end, replacement]
+        edits against old; None if the values are not both long strings or
+        both lists, or the patch is no smaller than new
+    """
+    if isinstance(old, str) and isinstance(new, str):
+        if len(new) < DELTA_TEXT_MIN_CHARS:
+            return None
+        old_lines, new_lines = old.splitlines(keepends=True), new.splitlines(keepends=True)
+        patch = {'lines': _splice_edits(old_lines, new_lines, old_lines, new_lines)}
+    elif isinstance(old, list) and isinstance(new, list):
+        def keys(items):
+            return [json.dumps(item, sort_keys=True) for item in items]
+        patch = {'items': _splice_edits(old, new, keys(old), keys(new))}
+    else:
+        return None
+
+    if len(json.dumps(patch)) >= len(json.dumps(new)):
+        return None
+    return patch
+
+
+def _splice_edits(old: list, new: list, old_keys: list, new_keys: list) -> List[list]:
+    """[start, end, replacement] edits turning old into new, matched on keys."""
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    return [
+        [i1, i2, new[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != 'equal'
+    ]
+
+
+def _apply_patch(value: Any, patch: Dict[str, list]) -> Any:
+    """Apply a _sequence_patch result to the old value."""
+    if 'lines' in patch:
+        parts, edits = value.splitlines(keepends=True), patch['lines']
+    else:
+        parts, edits = list(value), patch['items']
+
+    # Edits are ordered and refer to old positions, so apply back to front
+    for start, end, replacement in reversed(edits):
+        parts[start:end] = replacement
+    return ''.join(parts) if 'lines' in patch else parts
+
+
+def apply_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a stored delta to its parent's content.
+
+    Dictionaries along changed paths are copied; unchanged subtrees are
+    shared with base, which is never modified.
+
+    Args:
+        base: Parent content
+        delta: Delta record (the value under DELTA_KEY)
+
+    Returns:
+        Reconstructed content
+    """
+    result = dict(base)
+
+    def parent_of(path: List[str]) -> Dict[str, Any]:
+        node = result
+        for key in path[:-1]:
+            child = node.get(key)
+            child = dict(child) if isinstance(child, dict) else {}
+            node[key] = child
+            node = child
+        return node
+
+    for path, value in delta.get('set', []):
+        parent_of(path)[path[-1]] = value
+    for path, patch in delta.get('patch', []):
+        parent = parent_of(path)
+        parent[path[-1]] = _apply_patch(parent[path[-1]], patch)
+    for path in delta.get('remove', []):
+        parent_of(path).pop(path[-1], None)
+    return result
+
 
 @dataclass
 class ResearchDocument:
@@ -36,6 +192,102 @@ class ResearchDocument:
         return asdict(self)
 
 
+class DocumentCache:
+    """Thread-safe LRU of parsed ResearchDocuments.
+
+    Entries are keyed by (parameter_dir, country_dir, version) and carry a
+    stamp of the stored version; a lookup with a different stamp misses.
+    The store also keeps parser outputs in one, keyed by parser and checksum.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_DOCUMENT_CACHE_SIZE):
+        """Initialize document cache.
+
+        Args:
+            max_size: Maximum cached documents (0 disables)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str, str], stamp: Tuple) -> Optional['ResearchDocument']:
+        """Get a cached document if its stamp still matches."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple[str, str, str], stamp: Tuple, document: 'ResearchDocument') -> None:
+        """Cache a document, evicting the least recently used beyond max_size."""
+        with self._lock:
+            self._entries[key] = (stamp, document)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def reserve(self, size: int) -> None:
+        """Grow max_size to hold at least size documents."""
+        with self._lock:
+            self.max_size = max(self.max_size, size)
+
+    def invalidate(self, prefix: Optional[Tuple[str, str]] = None) -> None:
+        """Drop entries for a (parameter_dir, country_dir) prefix, or all."""
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[:2] == prefix]:
+                del self._entries[key]
+
+
+# Document caches shared by every store opened on the same directory
+_document_caches: Dict[str, DocumentCache] = {}
+_document_caches_lock = threading.Lock()
+
+
+def _shared_document_cache(base_path: Path, max_size: int) -> DocumentCache:
+    """Get the process-wide document cache for a store directory."""
+    key = str(base_path.resolve())
+    with _document_caches_lock:
+        cache = _document_caches.get(key)
+        if cache is None:
+            cache = _document_caches[key] = DocumentCache(max_size)
+        elif max_size > cache.max_size:
+            cache.reserve(max_size)
+        return cache
+
+
+@dataclass
+class ResearchIndexEntry:
+    """Index entry for one parameter-country combination."""
+    parameter: str  # Display name derived from the directory
+    country: str  # Display name derived from the directory
+    latest_version: Optional[str] = None
+    metadata: Optional[VersionMetadata] = None  # Latest version's metadata
+    path: Optional[Path] = None  # Latest version's research.json
+    versions: Optional[List[str]] = None  # Newest first; None until listed
+    total_size: Optional[int] = None  # Bytes of research.json across all versions; None until listed
+
+    @property
+    def created_at(self) -> Optional[str]:
+        """Creation time of the latest version."""
+        return self.metadata.created_at if self.metadata else None
+
+    @property
+    def checksum(self) -> Optional[str]:
+        """Checksum of the latest version."""
+        return self.metadata.checksum if self.metadata else None
+
+
 class ResearchStore:
     """Persistent storage for research documents with versioning."""
 
@@ -43,7 +295,8 @@ class ResearchStore:
         self,
         base_path: str = "research_system/data/research_documents",
         cache_ttl: int = 604800,  # 7 days
-        version_strategy: VersionStrategy = VersionStrategy.SEMANTIC
+        version_strategy: VersionStrategy = VersionStrategy.SEMANTIC,
+        document_cache_size: int = DEFAULT_DOCUMENT_CACHE_SIZE
     ):
         """Initialize research store.
 
@@ -51,19 +304,298 @@ class ResearchStore:
             base_path: Base directory for research documents
             cache_ttl: Cache time-to-live in seconds
             version_strategy: Versioning strategy
+            document_cache_size: Parsed documents kept in memory (0 disables)
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.cache_ttl = cache_ttl
 
+        # Parsed documents, shared with other stores on the same directory
+        self.document_cache_size = document_cache_size
+        self._document_cache = _shared_document_cache(self.base_path, document_cache_size)
+
+        # Parser outputs as JSON text, shared the same way and persisted on disk
+        self._parse_cache = _shared_document_cache(self.base_path / PARSE_CACHE_DIR, DEFAULT_PARSE_CACHE_SIZE)
+
         # Initialize version manager
         self.version_manager = VersionManager(
             strategy=version_strategy,
             base_path=str(self.base_path)
         )
 
+        # (parameter_dir, country_dir) -> latest version, metadata, path
+        self._index: Dict[Tuple[str, str], ResearchIndexEntry] = {}
+        self.rebuild_index()
+
         logger.info(f"ResearchStore initialized at {self.base_path}")
 
+    @staticmethod
+    def _index_key(parameter: str, country: str) -> Tuple[str, str]:
+        """Get index key (sanitized directory names) for parameter-country."""
+        return (
+            parameter.lower().replace(' ', '_'),
+            country.lower().replace(' ', '_')
+        )
+
+    def rebuild_index(self) -> int:
+        """Scan the store directory and rebuild the metadata index.
+
+        Call this if documents were written by another process. The new
+        index is built aside and swapped in at once, so concurrent readers
+        see either the old or the new index, never a partial one.
+
+        Returns:
+            Number of parameter-country combinations indexed
+        """
+        self.version_manager.invalidate_latest()
+
+        index: Dict[Tuple[str, str], ResearchIndexEntry] = {}
+        for param_dir, country_dir in self._locations():
+            entry = self._read_entry(param_dir, country_dir)
+            if entry is not None:
+                index[(param_dir, country_dir)] = entry
+
+        self._index = index
+
+        logger.debug(f"Indexed {len(index)} research combinations")
+        return len(index)
+
+    def _refresh_entry(self, param_dir: str, country_dir: str) -> Optional[ResearchIndexEntry]:
+        """Re-read one parameter-country combination into the index."""
+        key = (param_dir, country_dir)
+
+        entry = self._read_entry(param_dir, country_dir)
+        if entry is None:
+            self._index.pop(key, None)
+        else:
+            self._index[key] = entry
+        return entry
+
+    def _read_entry(self, param_dir: str, country_dir: str) -> Optional[ResearchIndexEntry]:
+        """Read the index entry of one parameter-country combination.
+
+        Only the latest version is resolved; the full version list is read
+        on first use (see _versions).
+        """
+        latest = self._latest_version(param_dir, country_dir)
+        if latest is None:
+            return None
+
+        return ResearchIndexEntry(
+            parameter=param_dir.replace('_', ' ').title(),
+            country=country_dir.replace('_', ' ').title(),
+            latest_version=latest,
+            metadata=self._load_metadata(param_dir, country_dir, latest),
+            path=self.version_manager.get_version_path(param_dir, country_dir, latest) / "research.json"
+        )
+
+    def _versions(self, entry: ResearchIndexEntry, param_dir: str, country_dir: str) -> List[str]:
+        """All versions of an indexed combination, newest first (listed once)."""
+        if entry.versions is None:
+            entry.versions = self._list_versions(param_dir, country_dir)
+        return entry.versions
+
+    def _total_size(self, entry: ResearchIndexEntry, param_dir: str, country_dir: str) -> int:
+        """Bytes of research.json across all versions of a combination (summed once)."""
+        if entry.total_size is None:
+            entry.total_size = sum(
+                self._content_size(param_dir, country_dir, v)
+                for v in self._versions(entry, param_dir, country_dir)
+            )
+        return entry.total_size
+
+    # Storage backend: directory layout <param>/<country>/<version>/research.json
+    # plus metadata.json. Alternative backends override these methods.
+
+    def _locations(self) -> List[Tuple[str, str]]:
+        """List (parameter_dir, country_dir) pairs present in storage."""
+        locations = []
+        for param_dir in self.base_path.iterdir():
+            if not param_dir.is_dir() or param_dir.name == PARSE_CACHE_DIR:
+                continue
+            for country_dir in param_dir.iterdir():
+                if country_dir.is_dir():
+                    locations.append((param_dir.name, country_dir.name))
+        return locations
+
+    def _list_versions(self, parameter: str, country: str) -> List[str]:
+        """List stored versions, newest first."""
+        return self.version_manager.list_versions(parameter, country)
+
+    def _latest_version(self, parameter: str, country: str) -> Optional[str]:
+        """Latest stored version, from the LATEST pointer (listing only if it is missing or stale)."""
+        return self.version_manager.get_latest_version(parameter, country)
+
+    def _content_size(self, parameter: str, country: str, version: str) -> int:
+        """Size in bytes of a version's stored content."""
+        content_file = self.version_manager.get_version_path(parameter, country, version) / "research.json"
+        return content_file.stat().st_size if content_file.exists() else 0
+
+    def _content_stamp(self, parameter: str, country: str, version: str) -> Optional[Tuple]:
+        """Cheap fingerprint of a version's stored content (mtime and size)."""
+        content_file = self.version_manager.get_version_path(parameter, country, version) / "research.json"
+        try:
+            stat = content_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_metadata(self, parameter: str, country: str, version: str) -> Optional[VersionMetadata]:
+        """Read a version's metadata from storage."""
+        return self.version_manager.load_version_metadata(parameter, country, version)
+
+    def _read_content(self, parameter: str, country: str, version: str) -> Optional[Dict[str, Any]]:
+        """Read and parse a version's content from storage."""
+        content_file = self.version_manager.get_version_path(parameter, country, version) / "research.json"
+
+        if not content_file.exists():
+            logger.warning(f"Research content not found: {content_file}")
+            return None
+
+        try:
+            with open(content_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading research content: {e}")
+            return None
+
+    def _write_version(
+        self,
+        parameter: str,
+        country: str,
+        version: str,
+        content: Dict[str, Any],
+        metadata: VersionMetadata
+    ) -> None:
+        """Write a version's content and metadata, setting metadata.file_size."""
+        version_path = self.version_manager.create_version_directory(
+            parameter, country, version
+        )
+
+        content_file = version_path / "research.json"
+        try:
+            with open(content_file, 'w') as f:
+                json.dump(content, f, indent=2)
+        except Exception as e:
+            logger.error(f"Error saving research content: {e}")
+            raise
+
+        metadata.file_size = content_file.stat().st_size
+
+        self._write_metadata(parameter, country, version, metadata)
+
+    def _write_metadata(
+        self,
+        parameter: str,
+        country: str,
+        version: str,
+        metadata: VersionMetadata
+    ) -> None:
+        """Write a version's metadata."""
+        self.version_manager.save_version_metadata(
+            parameter, country, version, metadata
+        )
+
+    def _load_content(self, parameter: str, country: str, version: str) -> Optional[Dict[str, Any]]:
+        """Read a version's full content, resolving deltas against their parents."""
+        stored = self._read_content(parameter, country, version)
+        if stored is None or DELTA_KEY not in stored:
+            return stored
+
+        delta = stored[DELTA_KEY]
+        parent = self._load_content(parameter, country, delta['parent'])
+        if parent is None:
+            logger.error(f"Missing parent {delta['parent']} of delta {parameter}/{country}/{version}")
+            return None
+        return apply_delta(parent, delta)
+
+    def _delta_depth(self, parameter: str, country: str, version: str) -> int:
+        """Number of deltas between a stored version and a full document."""
+        stored = self._read_content(parameter, country, version)
+        if stored is None or DELTA_KEY not in stored:
+            return 0
+        return stored[DELTA_KEY].get('depth', 1)
+
+    def _encode_for_storage(
+        self,
+        parameter: str,
+        country: str,
+        parent_version: Optional[str],
+        parent_content: Optional[Dict[str, Any]],
+        content: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Choose between storing content in full or as a delta against its parent."""
+        if parent_version is None or parent_content is None:
+            return content
+
+        depth = self._delta_depth(parameter, country, parent_version) + 1
+        if depth > MAX_DELTA_CHAIN:
+            return content
+
+        assignments, patches, removals = diff_content(parent_content, content)
+        delta = {DELTA_KEY: {
+            'parent': parent_version,
+            'depth': depth,
+            'set': assignments,
+            'patch': patches,
+            'remove': removals
+        }}
+
+        # A regenerated raw response never resembles its parent's, so judge
+        # the delta on the rest of the document
+        exempt_size = sum(
+            len(json.dumps(change)) for change in assignments + patches
+            if change[0][0] in DELTA_EXEMPT_KEYS
+        )
+        full_size = len(json.dumps({
+            key: value for key, value in content.items() if key not in DELTA_EXEMPT_KEYS
+        }))
+        if len(json.dumps(delta)) - exempt_size > full_size * DELTA_MAX_RATIO:
+            return content
+        return delta
+
+    def _materialize_deltas(self, parameter: str, country: str, keep: List[str]) -> None:
+        """Store kept versions in full where their delta parent is about to be removed."""
+        for version in reversed(keep):  # Oldest first, so parents are resolved first
+            stored = self._read_content(parameter, country, version)
+            if stored is None or DELTA_KEY not in stored or stored[DELTA_KEY]['parent'] in keep:
+                continue
+
+            content = self._load_content(parameter, country, version)
+            if content is None:
+                continue
+            metadata = self._load_metadata(parameter, country, version) or VersionMetadata(
+                version=version, created_at=datetime.now().isoformat()
+            )
+            self._write_version(parameter, country, version, content, metadata)
+            logger.debug(f"Stored {parameter}/{country}/{version} in full before cleanup")
+
+    def get_latest_version(self, parameter: str, country: str) -> Optional[str]:
+        """Get the latest version for a parameter-country combination.
+
+        Args:
+            parameter: Parameter name
+            country: Country name
+
+        Returns:
+            Latest version string, or None if no research exists
+        """
+        entry = self._index.get(self._index_key(parameter, country))
+        return entry.latest_version if entry else None
+
+    def get_latest_metadata(self, parameter: str, country: str) -> Optional[VersionMetadata]:
+        """Get metadata of the latest version from the index.
+
+        Args:
+            parameter: Parameter name
+            country: Country name
+
+        Returns:
+            VersionMetadata of the latest version, or None if not found
+        """
+        entry = self._index.get(self._index_key(parameter, country))
+        return entry.metadata if entry else None
+
     def save(
         self,
         parameter: str,
@@ -71,10 +603,16 @@ class ResearchStore:
         period: str,
         content: Dict[str, Any],
         change_type: ChangeType = ChangeType.MINOR,
-        change_description: Optional[str] = None
+        change_description: Optional[str] = None,
+        change_summary: Optional[Dict[str, Any]] = None
     ) -> str:
         """Save a new research document with automatic versioning.
 
+        If the content matches the latest version (ignoring _metadata
+        bookkeeping), no version is created and only the latest version's
+        timestamp is refreshed. A PATCH or MINOR version close to its parent
+        is stored as a delta against it; MAJOR versions are stored in full.
+
         Args:
             parameter: Parameter name
             country: Country name
@@ -82,32 +620,30 @@ class ResearchStore:
             content: Research document content
             change_type: Type of change (for semantic versioning)
             change_description: Description of changes
+            change_summary: Structural diff against the latest version
 
         Returns:
-            Version string of saved document
+            Version string of saved (or refreshed) document
         """
-        # Get latest version and calculate next
-        current_version = self.version_manager.get_latest_version(parameter, country)
-        new_version = self.version_manager.get_next_version(current_version, change_type)
+        # Calculate checksum
+        checksum = self._calculate_checksum(content)
 
-        # Create version directory
-        version_path = self.version_manager.create_version_directory(
-            parameter, country, new_version
-        )
+        # Unchanged content only refreshes the latest version's timestamp
+        current_version = self.get_latest_version(parameter, country)
+        current = self.load(parameter, country, current_version) if current_version else None
+        if current is not None and current.metadata and (
+            checksum == current.metadata.get('checksum')
+            or self._stable_checksum(content) == self._stable_checksum(current.content)
+        ):
+            return self._refresh_timestamp(parameter, country, current_version)
 
-        # Save research content
-        content_file = version_path / "research.json"
-        try:
-            with open(content_file, 'w') as f:
-                json.dump(content, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving research content: {e}")
-            raise
+        new_version = self.version_manager.get_next_version(current_version, change_type)
 
-        # Calculate checksum
-        checksum = self._calculate_checksum(content)
+        content_file = self.version_manager.get_version_path(
+            parameter, country, new_version
+        ) / "research.json"
 
-        # Create and save metadata
+        # Create metadata; file_size is set once the content is written
         metadata = VersionMetadata(
             version=new_version,
             created_at=datetime.now().isoformat(),
@@ -117,21 +653,63 @@ class ResearchStore:
             country=country,
             period=period,
             file_path=str(content_file),
-            file_size=content_file.stat().st_size,
-            checksum=checksum
+            checksum=checksum,
+            change_summary=change_summary
         )
 
-        self.version_manager.save_version_metadata(
-            parameter, country, new_version, metadata
-        )
+        # Save research content (as a delta when close to the parent) and metadata
+        if change_type == ChangeType.MAJOR:
+            stored = content
+        else:
+            stored = self._encode_for_storage(
+                parameter, country, current_version,
+                current.content if current is not None else None, content
+            )
+        self._write_version(parameter, country, new_version, stored, metadata)
+
+        self.invalidate_document_cache(parameter, country)
+
+        # Keep the index current
+        key = self._index_key(parameter, country)
+        entry = self._index.get(key)
+        if entry is None or (entry.versions is not None and new_version in entry.versions):
+            # New combination, or a version overwritten in place
+            self._refresh_entry(*key)
+        else:
+            entry.latest_version = new_version
+            entry.metadata = metadata
+            entry.path = content_file
+            if entry.versions is not None:
+                entry.versions.insert(0, new_version)
+            if entry.total_size is not None:
+                entry.total_size += metadata.file_size
 
         logger.info(
             f"Saved research document: {parameter}/{country} "
-            f"version {new_version} ({change_type.value if isinstance(change_type, ChangeType) else change_type})"
+            f"version {new_version} ({change_type.value if isinstance(change_type, ChangeType) else change_type}"
+            f"{', delta' if stored is not content else ''})"
         )
 
         return new_version
 
+    def _refresh_timestamp(self, parameter: str, country: str, version: str) -> str:
+        """Mark an unchanged latest version as freshly generated.
+
+        Returns:
+            The existing version string
+        """
+        key = self._index_key(parameter, country)
+        entry = self._index[key]
+
+        metadata = replace(entry.metadata, created_at=datetime.now().isoformat())
+        self._write_metadata(parameter, country, version, metadata)
+        entry.metadata = metadata
+
+        self.invalidate_document_cache(parameter, country)
+
+        logger.info(f"Research unchanged: {parameter}/{country} version {version} (timestamp refreshed)")
+        return version
+
     def load(
         self,
         parameter: str,
@@ -140,6 +718,9 @@ class ResearchStore:
     ) -> Optional[ResearchDocument]:
         """Load a research document.
 
+        Parsed documents are cached process-wide and shared between callers,
+        so treat the returned document as read-only.
+
         Args:
             parameter: Parameter name
             country: Country name
@@ -149,29 +730,36 @@ class ResearchStore:
             ResearchDocument or None if not found
         """
         # Get version
+        index_entry = self._index.get(self._index_key(parameter, country))
         if version is None:
-            version = self.version_manager.get_latest_version(parameter, country)
+            version = index_entry.latest_version if index_entry else None
             if version is None:
                 logger.debug(f"No research found for {parameter}/{country}")
                 return None
 
-        # Load content
-        version_path = self.version_manager.get_version_path(parameter, country, version)
-        content_file = version_path / "research.json"
+        # Serve from the document cache while the stored version is unchanged
+        cache_key = self._index_key(parameter, country) + (version,)
+        stamp = None
+        if self.document_cache_size > 0:
+            checksum = index_entry.checksum if index_entry and version == index_entry.latest_version else None
+            stamp = (self._content_stamp(parameter, country, version), checksum)
+            cached = self._document_cache.get(cache_key, stamp)
+            if cached is not None:
+                if cached.parameter != parameter or cached.country != country:
+                    # Same document cached under other spellings of the names
+                    cached = replace(cached, parameter=parameter, country=country)
+                return cached
 
-        if not content_file.exists():
-            logger.warning(f"Research content not found: {content_file}")
-            return None
-
-        try:
-            with open(content_file, 'r') as f:
-                content = json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading research content: {e}")
+        # Load content
+        content = self._load_content(parameter, country, version)
+        if content is None:
             return None
 
-        # Load metadata
-        metadata = self.version_manager.load_version_metadata(parameter, country, version)
+        # Load metadata (latest version's comes from the index)
+        if index_entry and version == index_entry.latest_version and index_entry.metadata:
+            metadata = index_entry.metadata
+        else:
+            metadata = self._load_metadata(parameter, country, version)
         if metadata is None:
             logger.warning(f"Metadata not found for {parameter}/{country}/{version}")
             metadata_dict = {}
@@ -189,9 +777,96 @@ class ResearchStore:
             metadata=metadata_dict
         )
 
+        if stamp is not None and stamp[0] is not None:
+            self._document_cache.put(cache_key, stamp, document)
+
         logger.debug(f"Loaded research: {parameter}/{country} v{version}")
         return document
 
+    def invalidate_document_cache(
+        self,
+        parameter: Optional[str] = None,
+        country: Optional[str] = None
+    ) -> None:
+        """Drop cached documents for a parameter-country combination, or all.
+
+        Args:
+            parameter: Parameter name (None with country=None clears everything)
+            country: Country name
+        """
+        if parameter is None and country is None:
+            self._document_cache.invalidate()
+        else:
+            self._document_cache.invalidate(self._index_key(parameter, country))
+
+    def reserve_document_cache(self, size: int) -> None:
+        """Make the document cache large enough to hold size documents.
+
+        Args:
+            size: Number of documents that should fit
+        """
+        if self.document_cache_size > 0 and size > self.document_cache_size:
+            self.document_cache_size = size
+            self._document_cache.reserve(size)
+
+    def load_parse_result(self, parser_key: str, checksum: str) -> Optional[Dict[str, Any]]:
+        """Load a parser's stored output for a document's content.
+
+        Parse results are content-addressed, so they are valid for every
+        version and process that sees the same checksum.
+
+        Args:
+            parser_key: Parser identity, e.g. "AmbitionParser-v1"
+            checksum: Checksum of the parsed document's content
+
+        Returns:
+            A fresh copy of the parse result, or None if not stored
+        """
+        cache_key = (PARSE_CACHE_DIR, parser_key, checksum)
+        data = self._parse_cache.get(cache_key, ())
+        if data is None:
+            try:
+                data = self._parse_result_path(parser_key, checksum).read_text()
+            except OSError:
+                return None
+            self._parse_cache.put(cache_key, (), data)
+
+        try:
+            return json.loads(data)
+        except ValueError:
+            logger.warning(f"Ignoring unreadable parse result {parser_key}/{checksum}")
+            return None
+
+    def save_parse_result(self, parser_key: str, checksum: str, result: Dict[str, Any]) -> None:
+        """Store a parser's output for a document's content.
+
+        Args:
+            parser_key: Parser identity, e.g. "AmbitionParser-v1"
+            checksum: Checksum of the parsed document's content
+            result: JSON-serializable parse result
+        """
+        try:
+            data = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Parse result for {parser_key} not cached: {e}")
+            return
+
+        self._parse_cache.put((PARSE_CACHE_DIR, parser_key, checksum), (), data)
+
+        # Written atomically so concurrent readers never see partial JSON
+        path = self._parse_result_path(parser_key, checksum)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist parse result {parser_key}/{checksum}: {e}")
+
+    def _parse_result_path(self, parser_key: str, checksum: str) -> Path:
+        """Path of a stored parse result."""
+        return self.base_path / PARSE_CACHE_DIR / parser_key / f"{checksum}.json"
+
     def exists(
         self,
         parameter: str,
@@ -208,12 +883,12 @@ class ResearchStore:
         Returns:
             True if document exists
         """
-        if version is None:
-            version = self.version_manager.get_latest_version(parameter, country)
-            if version is None:
-                return False
+        key = self._index_key(parameter, country)
+        entry = self._index.get(key)
+        if entry is None:
+            return False
 
-        return self.version_manager.version_exists(parameter, country, version)
+        return version in (None, entry.latest_version) or version in self._versions(entry, *key)
 
     def is_cache_valid(
         self,
@@ -231,13 +906,17 @@ class ResearchStore:
         Returns:
             True if cache is valid
         """
-        if not self.exists(parameter, country, version):
+        key = self._index_key(parameter, country)
+        entry = self._index.get(key)
+        if entry is None:
             return False
 
-        if version is None:
-            version = self.version_manager.get_latest_version(parameter, country)
-
-        metadata = self.version_manager.load_version_metadata(parameter, country, version)
+        if version is None or version == entry.latest_version:
+            metadata = entry.metadata
+        elif version in self._versions(entry, *key):
+            metadata = self._load_metadata(parameter, country, version)
+        else:
+            return False
         if metadata is None:
             return False
 
@@ -256,32 +935,14 @@ class ResearchStore:
         Returns:
             List of dictionaries with parameter, country, and latest version
         """
-        research_list = []
-
-        # Iterate through all parameters
-        for param_dir in self.base_path.iterdir():
-            if not param_dir.is_dir():
-                continue
-
-            parameter = param_dir.name.replace('_', ' ').title()
-
-            # Iterate through countries
-            for country_dir in param_dir.iterdir():
-                if not country_dir.is_dir():
-                    continue
-
-                country = country_dir.name.replace('_', ' ').title()
-
-                # Get latest version
-                latest_version = self.version_manager.get_latest_version(parameter, country)
-                if latest_version:
-                    research_list.append({
-                        'parameter': parameter,
-                        'country': country,
-                        'version': latest_version
-                    })
-
-        return research_list
+        return [
+            {
+                'parameter': entry.parameter,
+                'country': entry.country,
+                'version': entry.latest_version
+            }
+            for entry in self._index.values()
+        ]
 
     def get_version_history(
         self,
@@ -297,7 +958,18 @@ class ResearchStore:
         Returns:
             List of version metadata, newest first
         """
-        return self.version_manager.get_version_history(parameter, country)
+        key = self._index_key(parameter, country)
+        entry = self._index.get(key)
+        if entry is None:
+            return []
+
+        history = []
+        for version in self._versions(entry, *key):
+            metadata = self._load_metadata(parameter, country, version)
+            if metadata:
+                history.append(metadata)
+
+        return history
 
     def cleanup_old_versions(
         self,
@@ -315,7 +987,15 @@ class ResearchStore:
         Returns:
             Number of versions deleted
         """
-        return self.version_manager.cleanup_old_versions(parameter, country, keep_count)
+        versions = self._list_versions(parameter, country)
+        if len(versions) > keep_count:
+            self._materialize_deltas(parameter, country, versions[:keep_count])
+
+        deleted = self.version_manager.cleanup_old_versions(parameter, country, keep_count)
+        if deleted:
+            self.invalidate_document_cache(parameter, country)
+            self._refresh_entry(*self._index_key(parameter, country))
+        return deleted
 
     def search_by_parameter(self, parameter: str) -> List[Dict[str, str]]:
         """Find all research for a specific parameter.
@@ -326,28 +1006,17 @@ class ResearchStore:
         Returns:
             List of countries with research for this parameter
         """
-        param_clean = parameter.lower().replace(' ', '_')
-        param_dir = self.base_path / param_clean
-
-        if not param_dir.exists():
-            return []
-
-        results = []
-        for country_dir in param_dir.iterdir():
-            if not country_dir.is_dir():
-                continue
-
-            country = country_dir.name.replace('_', ' ').title()
-            latest_version = self.version_manager.get_latest_version(parameter, country)
-
-            if latest_version:
-                results.append({
-                    'parameter': parameter,
-                    'country': country,
-                    'version': latest_version
-                })
-
-        return results
+        param_clean = self._index_key(parameter, '')[0]
+
+        return [
+            {
+                'parameter': parameter,
+                'country': entry.country,
+                'version': entry.latest_version
+            }
+            for (param_dir, _), entry in self._index.items()
+            if param_dir == param_clean
+        ]
 
     def search_by_country(self, country: str) -> List[Dict[str, str]]:
         """Find all research for a specific country.
@@ -358,26 +1027,23 @@ class ResearchStore:
         Returns:
             List of parameters with research for this country
         """
-        country_clean = country.lower().replace(' ', '_')
-        results = []
-
-        for param_dir in self.base_path.iterdir():
-            if not param_dir.is_dir():
-                continue
-
-            parameter = param_dir.name.replace('_', ' ').title()
-            country_dir = param_dir / country_clean
-
-            if country_dir.exists():
-                latest_version = self.version_manager.get_latest_version(parameter, country)
-                if latest_version:
-                    results.append({
-                        'parameter': parameter,
-                        'country': country,
-                        'version': latest_version
-                    })
-
-        return results
+        country_clean = self._index_key('', country)[1]
+
+        return [
+            {
+                'parameter': entry.parameter,
+                'country': country,
+                'version': entry.latest_version
+            }
+            for (_, country_dir), entry in self._index.items()
+            if country_dir == country_clean
+        ]
+
+    def _stable_checksum(self, content: Dict[str, Any]) -> str:
+        """Checksum of content without volatile bookkeeping keys."""
+        return self._calculate_checksum(
+            {k: v for k, v in content.items() if k not in VOLATILE_CONTENT_KEYS}
+        )
 
     def _calculate_checksum(self, content: Dict[str, Any]) -> str:
         """Calculate SHA-256 checksum of content.
@@ -411,10 +1077,8 @@ class ResearchStore:
             country = item['country']
             country_counts[country] = country_counts.get(country, 0) + 1
 
-        # Calculate total size
-        total_size = 0
-        for param_dir in self.base_path.rglob("research.json"):
-            total_size += param_dir.stat().st_size
+        # Calculate total size (lists versions not yet listed)
+        total_size = sum(self._total_size(entry, *key) for key, entry in self._index.items())
 
         return {
             'total_documents': len(all_research),
@@ -423,5 +1087,16 @@ class ResearchStore:
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'parameters': param_counts,
-            'countries': country_counts
+            'countries': country_counts,
+            'document_cache': {
+                'size': len(self._document_cache),
+                'max_size': self._document_cache.max_size,
+                'hits': self._document_cache.hits,
+                'misses': self._document_cache.misses
+            },
+            'parse_cache': {
+                'size': len(self._parse_cache),
+                'hits': self._parse_cache.hits,
+                'misses': self._parse_cache.misses
+            }
         }
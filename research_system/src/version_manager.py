@@ -4,6 +4,7 @@ Implements versioning strategies for research documents with support for:
 - Semantic versioning (1.0.0)
 - Timestamp-based versioning
 - Version comparison and history tracking
+- Constant-time latest version lookup via a persisted pointer per combination
 """
 
 from typing import Dict, Any, List, Optional, Tuple
@@ -11,11 +12,16 @@ from datetime import datetime
 from pathlib import Path
 import json
 import logging
+import os
+import threading
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# File in each <parameter>/<country> directory naming its latest version
+LATEST_POINTER_FILE = "LATEST"
+
 
 class VersionStrategy(str, Enum):
     """Version numbering strategies."""
@@ -43,6 +49,7 @@ class VersionMetadata:
     file_path: Optional[str] = None
     file_size: Optional[int] = None
     checksum: Optional[str] = None
+    change_summary: Optional[Dict[str, Any]] = None  # Structural diff against the previous version
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -67,6 +74,13 @@ class VersionManager:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
 
+        # Version string -> parsed tuple
+        self._parsed_versions: Dict[str, Tuple] = {}
+
+        # (parameter_dir, country_dir) -> latest version
+        self._latest: Dict[Tuple[str, str], str] = {}
+        self._latest_lock = threading.Lock()
+
         logger.info(f"VersionManager initialized with {strategy} strategy")
 
     def parse_version(self, version_str: str) -> Tuple[int, ...]:
@@ -78,15 +92,22 @@ class VersionManager:
         Returns:
             Tuple of version components
         """
+        parsed = self._parsed_versions.get(version_str)
+        if parsed is not None:
+            return parsed
+
         if self.strategy == VersionStrategy.SEMANTIC:
             try:
                 parts = version_str.split('.')
-                return tuple(int(p) for p in parts)
+                parsed = tuple(int(p) for p in parts)
             except ValueError:
                 logger.warning(f"Invalid semantic version: {version_str}, using (0,0,0)")
-                return (0, 0, 0)
+                parsed = (0, 0, 0)
         else:  # TIMESTAMP
-            return (version_str,)
+            parsed = (version_str,)
+
+        self._parsed_versions[version_str] = parsed
+        return parsed
 
     def compare_versions(self, v1: str, v2: str) -> int:
         """Compare two version strings.
@@ -158,12 +179,20 @@ class VersionManager:
         Returns:
             Path to version directory
         """
-        # Sanitize names for file system
-        param_clean = parameter.lower().replace(' ', '_')
-        country_clean = country.lower().replace(' ', '_')
+        return self._combination_dir(parameter, country) / version
 
-        version_path = self.base_path / param_clean / country_clean / version
-        return version_path
+    @staticmethod
+    def _combination_key(parameter: str, country: str) -> Tuple[str, str]:
+        """Sanitized directory names for a parameter-country combination."""
+        return (
+            parameter.lower().replace(' ', '_'),
+            country.lower().replace(' ', '_')
+        )
+
+    def _combination_dir(self, parameter: str, country: str) -> Path:
+        """Directory holding all versions of a parameter-country combination."""
+        param_clean, country_clean = self._combination_key(parameter, country)
+        return self.base_path / param_clean / country_clean
 
     def create_version_directory(
         self,
@@ -183,6 +212,7 @@ class VersionManager:
         """
         version_path = self.get_version_path(parameter, country, version)
         version_path.mkdir(parents=True, exist_ok=True)
+        self._advance_latest(parameter, country, version)
 
         logger.debug(f"Created version directory: {version_path}")
         return version_path
@@ -201,10 +231,7 @@ class VersionManager:
         Returns:
             List of version strings, sorted (newest first)
         """
-        param_clean = parameter.lower().replace(' ', '_')
-        country_clean = country.lower().replace(' ', '_')
-
-        base_dir = self.base_path / param_clean / country_clean
+        base_dir = self._combination_dir(parameter, country)
 
         if not base_dir.exists():
             return []
@@ -224,6 +251,11 @@ class VersionManager:
     ) -> Optional[str]:
         """Get the latest version for a parameter-country combination.
 
+        Resolved from memory or the combination's LATEST pointer file; the
+        version directories are only listed when the pointer is missing or
+        stale (e.g. stores written before pointers existed), and the pointer
+        is then repaired.
+
         Args:
             parameter: Parameter name
             country: Country name
@@ -231,8 +263,77 @@ class VersionManager:
         Returns:
             Latest version string, or None if no versions exist
         """
-        versions = self.list_versions(parameter, country)
-        return versions[0] if versions else None
+        key = self._combination_key(parameter, country)
+        latest = self._latest.get(key)
+        if latest is not None:
+            return latest
+
+        with self._latest_lock:
+            latest = self._read_latest_pointer(parameter, country)
+            if latest is None:
+                versions = self.list_versions(parameter, country)
+                if not versions:
+                    return None
+                latest = versions[0]
+                self._write_latest_pointer(parameter, country, latest)
+
+            self._latest[key] = latest
+            return latest
+
+    def invalidate_latest(self, parameter: Optional[str] = None, country: Optional[str] = None) -> None:
+        """Forget cached latest versions so they are re-read from storage.
+
+        Call this if versions were written or removed by another process.
+
+        Args:
+            parameter: Parameter name (None, with country None, for all)
+            country: Country name
+        """
+        with self._latest_lock:
+            if parameter is None and country is None:
+                self._latest.clear()
+            else:
+                self._latest.pop(self._combination_key(parameter, country), None)
+
+    def _advance_latest(self, parameter: str, country: str, version: str) -> None:
+        """Point LATEST at a new version if it is newer than the current one."""
+        key = self._combination_key(parameter, country)
+        with self._latest_lock:
+            current = self._latest.get(key) or self._read_latest_pointer(parameter, country)
+            if current is None:
+                # No pointer yet; the listing includes the new version
+                versions = self.list_versions(parameter, country)
+                latest = versions[0] if versions else version
+            elif self.parse_version(version) > self.parse_version(current):
+                latest = version
+            else:
+                latest = current
+
+            if latest != current:
+                self._write_latest_pointer(parameter, country, latest)
+            self._latest[key] = latest
+
+    def _read_latest_pointer(self, parameter: str, country: str) -> Optional[str]:
+        """Read the LATEST pointer, or None if missing or naming no stored version."""
+        pointer_file = self._combination_dir(parameter, country) / LATEST_POINTER_FILE
+        try:
+            version = pointer_file.read_text().strip()
+        except OSError:
+            return None
+
+        if not version or not self.get_version_path(parameter, country, version).is_dir():
+            return None
+        return version
+
+    def _write_latest_pointer(self, parameter: str, country: str, version: str) -> None:
+        """Write the LATEST pointer atomically so readers never see a partial name."""
+        pointer_file = self._combination_dir(parameter, country) / LATEST_POINTER_FILE
+        tmp_file = pointer_file.with_name(f".{LATEST_POINTER_FILE}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_file.write_text(version)
+            os.replace(tmp_file, pointer_file)
+        except OSError as e:
+            logger.warning(f"Could not write latest version pointer {pointer_file}: {e}")
 
     def load_version_metadata(
         self,
@@ -327,6 +428,10 @@ class VersionManager:
             except Exception as e:
                 logger.error(f"Error deleting {version_path}: {e}")
 
+        if deleted and keep_count <= 0:
+            # The latest version itself was removed; re-resolve on next lookup
+            self.invalidate_latest(parameter, country)
+
         return deleted
 
     def get_version_history(
@@ -110,6 +110,10 @@ class GlobalRankingsAgent:
             
             logger.info(f"Generating global rankings for {len(countries)} countries")
             
+            # Warm the research cache before parameter agents start reading it
+            if self.mode != AgentMode.MOCK:
+                self._prefetch_research(countries)
+            
             # Step 1: Analyze all countries
             country_analyses = {}
             for country in countries:
@@ -160,6 +164,19 @@ class GlobalRankingsAgent:
             logger.error(f"Error generating global rankings: {str(e)}")
             raise AgentError(f"Failed to generate global rankings: {str(e)}")
     
+    def _prefetch_research(self, countries: List[str]) -> None:
+        """Load stored research for all parameters of the given countries concurrently.
+        
+        Args:
+            countries: Countries about to be analyzed
+        """
+        try:
+            from research_system import get_research_reader
+            get_research_reader().prefetch_research(countries)
+        except Exception as e:
+            # Agents fall back to loading research on demand
+            logger.warning(f"Research prefetch skipped: {e}")
+    
     def _create_rankings(
         self,
         country_analyses: Dict[str, Any],
@@ -22,11 +22,15 @@ class ResearchIntegrationMixin:
 
     @property
     def research_orchestrator(self):
-        """Lazy-load research orchestrator."""
+        """Lazy-load the process-wide research reader.
+
+        The reader is shared by all agents and only builds the LLM-backed
+        generator when research has to be generated.
+        """
         if not hasattr(self, '_research_orchestrator') or self._research_orchestrator is None:
             try:
-                from research_system import ResearchOrchestrator
-                self._research_orchestrator = ResearchOrchestrator()
+                from research_system import get_research_reader
+                self._research_orchestrator = get_research_reader()
                 logger.info("Research system integrated with agent")
             except Exception as e:
                 logger.warning(f"Research system not available: {e}")
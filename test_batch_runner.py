@@ -0,0 +1,192 @@
+"""Test concurrent, resumable research batches.
+
+BatchRunner runs parameter-country tasks on a worker pool and returns
+their outcomes in input order. A BatchCheckpoint lets a later run skip
+finished tasks and retry failed ones, unless it was written for another
+context. RateLimiter allows a fixed number of requests in any 60 second
+window.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src import batch_runner
+from research_system.src.batch_runner import BatchCheckpoint, BatchRunner, RateLimiter
+from research_system.src.research_agent import ResearchAgent
+
+PAIRS = [
+    ('Ambition', 'Germany'), ('Ambition', 'Spain'),
+    ('Track Record', 'Germany'), ('Track Record', 'Spain')
+]
+
+
+class Task:
+    """Stub research task recording its calls, failing for chosen pairs."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, parameter, country):
+        with self._lock:
+            self.calls.append((parameter, country))
+        if (parameter, country) in self.failing:
+            raise RuntimeError(f"LLM error for {parameter}/{country}")
+        return f"{parameter} research for {country}", False
+
+
+def _run(checkpoint_path, task, period='Q1 2026', pairs=PAIRS):
+    checkpoint = BatchCheckpoint(str(checkpoint_path), context={'period': period})
+    return BatchRunner(max_workers=2, checkpoint=checkpoint).run(pairs, task)
+
+
+def test_outcomes_in_input_order():
+    """Outcomes follow the input pairs, whatever order tasks finish in."""
+    finished = []
+
+    def task(parameter, country):
+        # Later pairs finish first
+        time.sleep(0.05 * (len(PAIRS) - PAIRS.index((parameter, country))))
+        return parameter, False
+
+    outcomes = BatchRunner(max_workers=len(PAIRS)).run(
+        PAIRS, task, on_result=lambda item, progress: finished.append((item.parameter, item.country))
+    )
+
+    assert [(item.parameter, item.country) for item in outcomes] == PAIRS
+    assert finished == PAIRS[::-1]
+    assert all(item.status == 'completed' for item in outcomes)
+
+
+def test_batch_research_keeps_input_order(monkeypatch):
+    """ResearchAgent.batch_research returns results keyed in input order."""
+    monkeypatch.setattr(ResearchAgent, '_initialize_llm', lambda self, config: None)
+    agent = ResearchAgent({'max_requests_per_minute': 60}, prompt_generator=object())
+
+    def conduct_research(parameter, country, period):
+        time.sleep(0.05 * (len(PAIRS) - PAIRS.index((parameter, country))))
+        if (parameter, country) == PAIRS[2]:
+            raise RuntimeError('LLM error')
+        return {'parameter': parameter, 'country': country, 'period': period}
+
+    monkeypatch.setattr(agent, 'conduct_research', conduct_research)
+    results = agent.batch_research(PAIRS, period='Q1 2026', max_workers=len(PAIRS))
+
+    assert list(results) == [f"{parameter}|{country}" for parameter, country in PAIRS]
+    assert results['Track Record|Germany']['error'] == 'LLM error'
+    assert results['Ambition|Spain']['period'] == 'Q1 2026'
+
+
+def test_resume_skips_finished_tasks(tmp_path):
+    """A second run with the same checkpoint resumes instead of re-running."""
+    checkpoint_path = tmp_path / 'batch.json'
+    _run(checkpoint_path, Task())
+
+    task = Task()
+    outcomes = _run(checkpoint_path, task)
+
+    assert task.calls == []
+    assert [item.status for item in outcomes] == ['resumed'] * len(PAIRS)
+
+
+def test_failed_tasks_are_retried(tmp_path):
+    """Failed tasks are recorded and run again on resume; done ones are not."""
+    checkpoint_path = tmp_path / 'batch.json'
+    failing = PAIRS[1]
+
+    outcomes = _run(checkpoint_path, Task(failing=[failing]))
+
+    assert [item.status for item in outcomes] == ['completed', 'failed', 'completed', 'completed']
+    assert 'LLM error' in outcomes[1].error
+    checkpoint = BatchCheckpoint(str(checkpoint_path), context={'period': 'Q1 2026'})
+    assert set(checkpoint.failed) == {'Ambition|Spain'}
+
+    task = Task()
+    outcomes = _run(checkpoint_path, task)
+
+    assert task.calls == [failing]
+    assert [item.status for item in outcomes] == ['resumed', 'completed', 'resumed', 'resumed']
+    checkpoint = BatchCheckpoint(str(checkpoint_path), context={'period': 'Q1 2026'})
+    assert checkpoint.failed == {}
+    assert len(checkpoint.completed) == len(PAIRS)
+
+
+def test_checkpoint_for_other_context_is_ignored(tmp_path):
+    """Progress recorded for another period never skips work."""
+    checkpoint_path = tmp_path / 'batch.json'
+    _run(checkpoint_path, Task(), period='Q1 2026')
+
+    task = Task()
+    outcomes = _run(checkpoint_path, task, period='Q2 2026')
+
+    assert sorted(task.calls) == sorted(PAIRS)
+    assert [item.status for item in outcomes] == ['completed'] * len(PAIRS)
+
+
+def test_unreadable_checkpoint_starts_fresh(tmp_path):
+    """A corrupt checkpoint file is ignored rather than failing the run."""
+    checkpoint_path = tmp_path / 'batch.json'
+    checkpoint_path.write_text('{not json')
+
+    task = Task()
+    _run(checkpoint_path, task)
+
+    assert sorted(task.calls) == sorted(PAIRS)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleeping advances it instead of waiting."""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(batch_runner, 'time', SimpleNamespace(monotonic=lambda: now[0], sleep=sleep))
+    return now, sleeps
+
+
+def test_rate_limiter_blocks_until_window_frees(clock):
+    """The request past the limit waits until the oldest leaves the window."""
+    now, sleeps = clock
+    limiter = RateLimiter(max_requests_per_minute=3)
+
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    now[0] += 15
+
+    assert limiter.acquire() == pytest.approx(45.0)
+    assert sleeps == [pytest.approx(45.0)]
+
+
+def test_rate_limiter_window_slides(clock):
+    """Requests older than 60 seconds no longer count."""
+    now, sleeps = clock
+    limiter = RateLimiter(max_requests_per_minute=2)
+
+    limiter.acquire()
+    now[0] += 30
+    limiter.acquire()
+    now[0] += 31  # The first request is now outside the window
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(29.0)  # Until the second leaves
+    assert sleeps == [pytest.approx(29.0)]
+
+
+def test_rate_limiter_allows_at_least_one_request(clock):
+    """A non-positive limit still lets one request per minute through."""
+    limiter = RateLimiter(max_requests_per_minute=0)
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == pytest.approx(60.0)
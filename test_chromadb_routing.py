@@ -0,0 +1,112 @@
+"""Test the ChromaDB store's memory ID -> collection routing cache.
+
+With one collection per memory type, point lookups go straight to the
+collection a recently used ID lives in. The cache is bounded (least
+recently used IDs are evicted), is not filled by full-store scans, and is
+not kept at all with a single collection.
+
+Entries carry small explicit embeddings so ChromaDB never loads its
+default embedding model.
+"""
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip('chromadb')
+
+import src  # noqa: F401  (registers memory stores)
+from memory_system.src.memory.base.memory_entry import EpisodicMemoryEntry, MemoryQuery
+from memory_system.src.memory.base.memory_types import MemoryType
+from memory_system.src.memory.stores.chromadb_store import ChromaDBMemoryStore
+
+EMBEDDING = [0.5, 0.5, 0.5, 0.5]
+
+CACHE_SIZE = 5
+
+
+@pytest.fixture(scope='module')
+def persist_directory(tmp_path_factory):
+    """One directory for the module (ChromaDB keeps one client per process)."""
+    from chromadb.api.client import SharedSystemClient
+
+    # Drop clients other test modules opened with different settings
+    SharedSystemClient.clear_system_cache()
+    return str(tmp_path_factory.mktemp('routing'))
+
+
+@pytest.fixture
+def make_store(persist_directory):
+    """Open stores on a fresh collection name."""
+    stores = []
+
+    def make(use_separate_collections: bool) -> ChromaDBMemoryStore:
+        store = ChromaDBMemoryStore({
+            'persist_directory': persist_directory,
+            'collection_name': f"routing_{uuid.uuid4().hex}",
+            'use_separate_collections': use_separate_collections,
+            'routing_cache_size': CACHE_SIZE
+        })
+        store.initialize()
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.clear_all()
+
+
+def _analysis(index: int) -> EpisodicMemoryEntry:
+    entry = EpisodicMemoryEntry(
+        agent_name='ambition',
+        country='Germany',
+        period='Q1 2024',
+        input_data={'index': index},
+        output_data={'score': 6.0},
+        execution_time_ms=10.0
+    )
+    entry.embedding = EMBEDDING
+    return entry
+
+
+def test_single_collection_keeps_no_routes(make_store):
+    """With one collection there is nothing to route."""
+    store = make_store(use_separate_collections=False)
+    entries = [_analysis(i) for i in range(20)]
+    store.store_batch(entries)
+
+    assert store.retrieve(entries[3].id).id == entries[3].id
+    assert len(store._id_collection) == 0
+
+
+def test_routes_are_bounded_and_least_recently_used_evicted(make_store):
+    """The cache holds at most routing_cache_size IDs, most recent last."""
+    store = make_store(use_separate_collections=True)
+    entries = [_analysis(i) for i in range(20)]
+    store.store_batch(entries)
+
+    assert list(store._id_collection) == [entry.id for entry in entries[-CACHE_SIZE:]]
+
+    # An evicted ID is probed across collections and routed again
+    assert store.retrieve(entries[0].id).id == entries[0].id
+    assert list(store._id_collection)[-1] == entries[0].id
+    assert len(store._id_collection) == CACHE_SIZE
+
+    assert store.delete(entries[0].id)
+    assert entries[0].id not in store._id_collection
+
+
+def test_scan_does_not_fill_routes(make_store):
+    """Full-store scans leave the cache alone."""
+    store = make_store(use_separate_collections=True)
+    store.store_batch([_analysis(i) for i in range(20)])
+    store._id_collection.clear()
+
+    query = MemoryQuery(memory_types=[MemoryType.EPISODIC])
+    assert sum(len(page) for page in store.scan(query)) == 20
+    assert len(store._id_collection) == 0
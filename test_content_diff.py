@@ -0,0 +1,134 @@
+"""Test the structural diff that classifies research updates.
+
+Table-driven cases around the classification thresholds: metric turnover
+at METRIC_MAJOR_TURNOVER, section similarity at SECTION_PATCH_SIMILARITY
+and SECTION_MAJOR_SIMILARITY, sections appearing or disappearing, and
+empty documents.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src.content_diff import (
+    METRIC_MAJOR_TURNOVER, SECTION_MAJOR_SIMILARITY, SECTION_PATCH_SIMILARITY,
+    diff_research, text_similarity
+)
+from research_system.src.version_manager import ChangeType
+
+# Ten distinct words: replacing n of them gives similarity (10 - n) / 10
+WORDS = 'auctions award contracts for difference to onshore wind each year'.split()
+
+METRICS = 4
+
+
+def _text(replaced: int = 0) -> str:
+    """Overview text with the first `replaced` words rewritten."""
+    return ' '.join(f"revised{i}" if i < replaced else word for i, word in enumerate(WORDS))
+
+
+def _metrics(changed: int = 0, count: int = METRICS) -> list:
+    """Key metrics, the first `changed` with a different value."""
+    return [
+        {'metric': f"Metric {i}", 'value': 10 * (i + 1) + (1 if i < changed else 0), 'unit': '%'}
+        for i in range(count)
+    ]
+
+
+def _document(changed: int = 0, replaced: int = 0, metrics: list = None, **sections) -> dict:
+    document = {
+        'overview': _text(replaced),
+        'key_metrics': _metrics(changed) if metrics is None else metrics,
+        'sources': [{'name': 'Ministry', 'url': 'https://example.org/ministry'}]
+    }
+    document.update(sections)
+    return document
+
+
+def test_thresholds_match_table():
+    """The table below is written against these thresholds."""
+    assert (METRIC_MAJOR_TURNOVER, SECTION_PATCH_SIMILARITY, SECTION_MAJOR_SIMILARITY) == (0.5, 0.9, 0.5)
+    assert text_similarity(_text(), _text(1)) == 0.9
+    assert text_similarity(_text(), _text(5)) == 0.5
+
+
+@pytest.mark.parametrize('old,new,change_type,values_changed', [
+    # Metric turnover: more than half of the metrics is MAJOR
+    (_document(), _document(), ChangeType.PATCH, False),
+    (_document(), _document(changed=1), ChangeType.MINOR, True),
+    (_document(), _document(changed=2), ChangeType.MINOR, True),
+    (_document(), _document(changed=3), ChangeType.MAJOR, True),
+    (_document(), _document(metrics=_metrics(count=2)), ChangeType.MINOR, True),
+    (_document(), _document(metrics=_metrics(count=1)), ChangeType.MAJOR, True),
+    (_document(metrics=_metrics(count=2)), _document(), ChangeType.MINOR, True),
+    (_document(metrics=_metrics(count=1)), _document(), ChangeType.MAJOR, True),
+    # Reformatted values are the same number
+    (
+        _document(metrics=[{'metric': 'Capacity', 'value': '1,000 MW'}]),
+        _document(metrics=[{'metric': 'capacity ', 'value': 1000}]),
+        ChangeType.PATCH, False
+    ),
+    # Section similarity: 0.9 and above is an edit, below 0.5 a rewrite
+    (_document(), _document(replaced=1), ChangeType.PATCH, False),
+    (_document(), _document(replaced=2), ChangeType.MINOR, False),
+    (_document(), _document(replaced=5), ChangeType.MINOR, False),
+    (_document(), _document(replaced=6), ChangeType.MAJOR, False),
+    # Added and removed sections count as similarity 0.0
+    (_document(), _document(challenges=_text()), ChangeType.MINOR, False),
+    (_document(challenges=_text()), _document(), ChangeType.MINOR, False),
+    (_document(), _document(challenges=_text(), opportunities=_text()), ChangeType.MAJOR, False),
+    # Empty documents
+    ({}, {}, ChangeType.PATCH, False),
+    ({}, _document(), ChangeType.MAJOR, True),
+    (_document(), {}, ChangeType.MAJOR, True),
+], ids=[
+    'unchanged', 'one-metric', 'turnover-at-threshold', 'turnover-above-threshold',
+    'half-removed', 'most-removed', 'half-added', 'most-added', 'reformatted-value',
+    'similarity-0.9', 'similarity-0.8', 'similarity-0.5', 'similarity-0.4',
+    'section-added', 'section-removed', 'sections-added',
+    'both-empty', 'from-empty', 'to-empty',
+])
+def test_change_type(old, new, change_type, values_changed):
+    """Each update is classified against the thresholds."""
+    diff = diff_research(old, new)
+
+    assert diff.change_type == change_type
+    assert diff.values_changed == values_changed
+
+
+@pytest.mark.parametrize('old,new,turnover,average_similarity', [
+    (_document(), _document(changed=2), 0.5, 1.0),
+    (_document(), _document(metrics=_metrics(count=2)), 0.5, 1.0),
+    (_document(), _document(replaced=5), 0.0, 0.5),
+    (_document(), _document(challenges=_text()), 0.0, 0.5),
+    (_document(), _document(challenges=_text(), opportunities=_text()), 0.0, 1 / 3),
+    ({}, {}, 0.0, 1.0),
+], ids=['changed', 'removed', 'edited', 'section-added', 'sections-added', 'empty'])
+def test_turnover_and_similarity(old, new, turnover, average_similarity):
+    """Turnover and average similarity are the values the thresholds apply to."""
+    diff = diff_research(old, new)
+
+    assert diff.metric_turnover == pytest.approx(turnover)
+    assert diff.average_section_similarity == pytest.approx(average_similarity)
+
+
+def test_empty_documents_have_empty_diff():
+    """Two empty documents differ in nothing."""
+    diff = diff_research({}, {})
+
+    assert diff.is_empty
+    assert diff.describe() == 'no structural changes'
+    assert diff.sections_compared == diff.metrics_compared == 0
+
+
+def test_added_and_removed_sections_are_recorded():
+    """A section present on one side only is compared against empty text."""
+    diff = diff_research(_document(opportunities=_text()), _document(challenges=_text()))
+
+    assert diff.sections_compared == 3
+    assert diff.section_similarity == {'challenges': 0.0, 'opportunities': 0.0}
+    assert diff.describe() == '2 sections edited'
@@ -0,0 +1,68 @@
+"""Test import-time budget for the agent package.
+
+Importing ``src.agents`` pulls in the memory package (every parameter agent
+mixes in MemoryMixin). The heavy memory backends - sentence-transformers
+(torch) and chromadb - must only load on first embedding or store use, so
+a MOCK-mode run does not pay their import cost before the UI appears.
+
+Each check runs in a fresh interpreter so already-imported modules from the
+test runner do not mask the real cost.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# Budget for a cold `import src.agents` (seconds)
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+
+# Modules that must not be imported until actually used
+HEAVY_MODULES = ['sentence_transformers', 'torch', 'transformers', 'chromadb']
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import src.agents
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'elapsed': elapsed,
+    'loaded': [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def _run_import_probe() -> dict:
+    """Import src.agents in a fresh interpreter and report timing."""
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE],
+        cwd=str(project_root),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """Heavy memory backends stay unloaded after importing src.agents."""
+    probe = _run_import_probe()
+    assert probe['loaded'] == [], f"Heavy modules imported eagerly: {probe['loaded']}"
+
+
+def test_import_time_budget():
+    """Importing src.agents stays under the startup budget."""
+    probe = _run_import_probe()
+    assert probe['elapsed'] < IMPORT_TIME_BUDGET_SECONDS, (
+        f"import src.agents took {probe['elapsed']:.2f}s "
+        f"(budget {IMPORT_TIME_BUDGET_SECONDS:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    probe = _run_import_probe()
+    print(f"import src.agents: {probe['elapsed']:.3f}s (budget {IMPORT_TIME_BUDGET_SECONDS:.1f}s)")
+    print(f"heavy modules loaded: {probe['loaded'] or 'none'}")
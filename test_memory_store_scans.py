@@ -0,0 +1,278 @@
+"""Test full-store scans in the memory learning components.
+
+ChromaDB's filter-only search returns at most one page of rows, so
+components that need every memory of a type (feedback index, compaction,
+pattern snapshot) must page through the store with scan(). Each test
+stores more rows than one page and checks nothing past the first page is
+missed.
+
+Entries carry small explicit embeddings so ChromaDB never loads its
+default embedding model.
+"""
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip('chromadb')
+
+import src  # noqa: F401  (registers memory stores)
+from memory_system.src.memory.base.memory_entry import (
+    EpisodicMemoryEntry, FeedbackMemoryEntry, MemoryQuery
+)
+from memory_system.src.memory.base.memory_types import FeedbackType, MemoryType
+from memory_system.src.memory.learning.feedback_processor import FeedbackProcessor
+from memory_system.src.memory.learning.memory_compactor import (
+    MemoryCompactor, SUMMARY_SOURCE
+)
+from memory_system.src.memory.learning.pattern_recognizer import PatternRecognizer
+from memory_system.src.memory.stores.chromadb_store import ChromaDBMemoryStore
+
+# More rows than ChromaDB's filter-only search returns (1000)
+ROWS_PAST_ONE_PAGE = 1500
+
+EMBEDDING = [0.5, 0.5, 0.5, 0.5]
+
+
+@pytest.fixture(scope='module')
+def persist_directory(tmp_path_factory):
+    """One directory for the module (ChromaDB keeps one client per process)."""
+    from chromadb.api.client import SharedSystemClient
+
+    # Drop clients other test modules opened with different settings
+    SharedSystemClient.clear_system_cache()
+    return str(tmp_path_factory.mktemp('memory_scans'))
+
+
+@pytest.fixture
+def store(persist_directory):
+    """ChromaDB store in a fresh collection."""
+    store = ChromaDBMemoryStore({
+        'persist_directory': persist_directory,
+        'collection_name': f"scan_test_{uuid.uuid4().hex}"
+    })
+    store.initialize()
+    yield store
+    store.clear_all()
+
+
+def _feedback(analysis_id: str) -> FeedbackMemoryEntry:
+    """Score adjustment feedback for an analysis."""
+    entry = FeedbackMemoryEntry(
+        feedback_type=FeedbackType.SCORE_ADJUSTMENT,
+        original_analysis_id=analysis_id,
+        expert_id='expert_1',
+        original_value=5.0,
+        corrected_value=6.0,
+        reasoning='Adjusted after review'
+    )
+    entry.embedding = EMBEDDING
+    return entry
+
+
+def _analysis(age_days: int, score: float = 6.0, input_data: dict = None) -> EpisodicMemoryEntry:
+    """Episodic analysis memory from age_days ago."""
+    entry = EpisodicMemoryEntry(
+        agent_name='ambition',
+        country='Germany',
+        period='Q1 2024',
+        input_data=input_data or {},
+        output_data={'score': score, 'justification': 'Strong targets'},
+        execution_time_ms=10.0
+    )
+    entry.timestamp = datetime.now() - timedelta(days=age_days)
+    entry.embedding = EMBEDDING
+    return entry
+
+
+def _summaries(store) -> list:
+    """All compaction summaries in the store."""
+    query = MemoryQuery(
+        memory_types=[MemoryType.EPISODIC],
+        sources=[SUMMARY_SOURCE],
+        include_expired=True
+    )
+    return [entry for page in store.scan(query) for entry in page]
+
+
+def test_scan_pages_past_search_cap(store):
+    """scan() returns every matching row, not one search page."""
+    store.store_batch([_feedback(f"a{i}") for i in range(ROWS_PAST_ONE_PAGE)])
+
+    query = MemoryQuery(memory_types=[MemoryType.FEEDBACK])
+    ids = {entry.id for page in store.scan(query) for entry in page}
+
+    assert len(ids) == ROWS_PAST_ONE_PAGE
+
+
+def test_feedback_index_covers_all_feedback(store):
+    """The feedback index holds feedback beyond the first 1000 rows."""
+    store.store_batch([_feedback(f"a{i}") for i in range(ROWS_PAST_ONE_PAGE)])
+
+    processor = FeedbackProcessor(store, {})
+
+    assert processor.rebuild_index() == ROWS_PAST_ONE_PAGE
+    assert len(processor.get_feedback_for_analysis('a1400')) == 1
+    stats = processor.get_feedback_statistics()
+    assert stats['total_feedback'] == ROWS_PAST_ONE_PAGE
+
+
+def test_compaction_reaches_old_memories_behind_recent_ones(store):
+    """Old memories are compacted however many recent ones the store holds."""
+    recent = [_analysis(age_days=1) for _ in range(ROWS_PAST_ONE_PAGE)]
+    old_day = (datetime.now() - timedelta(days=400)).replace(day=15)
+    old = [_analysis(age_days=(datetime.now() - old_day).days) for _ in range(50)]
+    store.store_batch(recent + old)
+
+    compactor = MemoryCompactor(
+        store, {'compaction_horizon_days': 180}, embed_text=lambda text: EMBEDDING
+    )
+
+    assert compactor.compact() == {'compacted': 50, 'kept': 0, 'summaries': 1}
+
+    # A second run merges into the existing summary instead of adding one
+    old_age = (datetime.now() - old_day).days
+    store.store_batch([_analysis(age_days=old_age, score=8.0) for _ in range(20)])
+
+    assert compactor.compact() == {'compacted': 20, 'kept': 0, 'summaries': 0}
+    summaries = _summaries(store)
+    assert len(summaries) == 1
+    stats = summaries[0].content['output_data']['compaction']
+    assert stats['memory_count'] == 70
+    assert stats['score_stats']['mean'] == pytest.approx((50 * 6.0 + 20 * 8.0) / 70)
+    assert store.count({'memory_type': MemoryType.EPISODIC.value}) == ROWS_PAST_ONE_PAGE + 1
+
+
+def test_compaction_batches_past_one_page(store):
+    """More old memories than one page and one batch are all compacted."""
+    store.store_batch([_analysis(age_days=400) for _ in range(ROWS_PAST_ONE_PAGE)])
+
+    compactor = MemoryCompactor(
+        store, {'compaction_horizon_days': 180}, embed_text=lambda text: EMBEDDING
+    )
+    stats = compactor.compact()
+
+    assert stats['compacted'] == ROWS_PAST_ONE_PAGE
+    assert len(_summaries(store)) == stats['summaries'] == 1
+
+
+def test_pattern_snapshot_covers_full_history(store):
+    """The columnar snapshot holds every episodic memory, not one page."""
+    store.store_batch([_analysis(age_days=i % 300) for i in range(ROWS_PAST_ONE_PAGE)])
+
+    recognizer = PatternRecognizer(store, {})
+
+    assert recognizer.rebuild_snapshot() == ROWS_PAST_ONE_PAGE
+    assert len(recognizer._matching_partitions('ambition', 'Germany')[0]) == ROWS_PAST_ONE_PAGE
+
+
+def _rounded(value):
+    """Round floats in nested pattern output so summation order does not matter."""
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, dict):
+        return {key: _rounded(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_rounded(item) for item in value)
+    return value
+
+
+def test_patterns_survive_compaction(store):
+    """Scoring patterns are the same before and after old memories are compacted."""
+    scores = [4.0, 4.5, 7.0, 7.5, 8.0, 7.0]
+    memories = [
+        _analysis(
+            age_days=age,
+            score=scores[i % len(scores)],
+            input_data={
+                'policy': 'auction' if scores[i % len(scores)] >= 7 else 'tariff',
+                'target': scores[i % len(scores)] * 10 + i % 3,
+                'notes': ['not', 'scalar']
+            }
+        )
+        for i, age in enumerate([200 + 3 * i for i in range(90)] + list(range(20)))
+    ]
+    memories.append(_analysis(age_days=250, score=None))
+    store.store_batch(memories)
+
+    before = PatternRecognizer(store, {}).recognize_scoring_patterns()
+
+    # Small batches merge originals into existing summaries across folds
+    compactor = MemoryCompactor(
+        store,
+        {'compaction_horizon_days': 180, 'compaction_bucket': 'month', 'compaction_batch_size': 25},
+        embed_text=lambda text: EMBEDDING
+    )
+    assert compactor.compact()['compacted'] == 91
+    after = PatternRecognizer(store, {}).recognize_scoring_patterns()
+
+    assert [p['pattern_type'] for p in before] == ['score_clustering', 'score_correlation']
+    assert _rounded(after) == _rounded(before)
+
+
+def _record_then_scan(store, monkeypatch, record):
+    """Make store.scan() call record() before paging, as a concurrent writer would."""
+    scan = store.scan
+
+    def recording_scan(query):
+        record()
+        yield from scan(query)
+
+    monkeypatch.setattr(store, 'scan', recording_scan)
+
+
+def test_feedback_recorded_during_rebuild_counted_once(store, monkeypatch):
+    """Feedback recorded while the index rebuilds is neither lost nor doubled."""
+    store.store_batch([_feedback(f"a{i}") for i in range(10)])
+    processor = FeedbackProcessor(store, {})
+    processor.rebuild_index()
+
+    # record_feedback stores entries without an embedding
+    store_entry = store.store
+
+    def store_with_embedding(entry):
+        entry.embedding = EMBEDDING
+        return store_entry(entry)
+
+    monkeypatch.setattr(store, 'store', store_with_embedding)
+    _record_then_scan(store, monkeypatch, lambda: processor.record_feedback(
+        FeedbackType.SCORE_ADJUSTMENT, 'a99', 'expert_2', 5.0, 7.0, 'Late correction'
+    ))
+
+    assert processor.rebuild_index() == 11
+    assert processor.get_feedback_statistics()['total_feedback'] == 11
+    assert len(processor.get_feedback_for_analysis('a99')) == 1
+
+
+def test_snapshot_rebuild_counts_added_memory_once(store, monkeypatch):
+    """A memory added while the snapshot rebuilds appears exactly once."""
+    store.store_batch([_analysis(age_days=i) for i in range(10)])
+    recognizer = PatternRecognizer(store, {})
+    recognizer.rebuild_snapshot()
+
+    def add():
+        memory = _analysis(age_days=0)
+        store.store(memory)
+        recognizer.add_memory(memory)
+
+    _record_then_scan(store, monkeypatch, add)
+
+    assert recognizer.rebuild_snapshot() == 11
+    assert len(recognizer._matching_partitions('ambition', 'Germany')[0]) == 11
+
+
+def test_invalidation_discards_rebuild_in_flight(store, monkeypatch):
+    """A rebuild that started before memories were deleted is not swapped in."""
+    store.store_batch([_analysis(age_days=i) for i in range(10)])
+    recognizer = PatternRecognizer(store, {})
+
+    _record_then_scan(store, monkeypatch, recognizer.invalidate_snapshot)
+    recognizer.rebuild_snapshot()
+
+    assert not recognizer._snapshot_ready
@@ -0,0 +1,114 @@
+"""Test the keyword index over research document metrics.
+
+MetricIndex.positions() must return what a case-insensitive substring scan
+of the metric names returns, including keywords that are prefixes of each
+other and keywords first asked for after the names were scanned.
+get_metric_index() shares indexes by metric names, so a list edited in
+place never gets a stale index.
+"""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_integration.parsers.metric_index import (
+    KeywordMatcher, MetricIndex, get_metric_index
+)
+
+
+def _metrics(*names) -> list:
+    return [{'metric': name, 'value': i} for i, name in enumerate(names)]
+
+
+def _substring_scan(metrics: list, keywords: list) -> list:
+    """The lookup the index replaces."""
+    return [
+        position for position, metric in enumerate(metrics)
+        if isinstance(metric, dict)
+        and any(k.lower() in str(metric.get('metric') or '').lower() for k in keywords)
+    ]
+
+
+METRICS = _metrics(
+    'Installed Solar Capacity', 'Capacity Factor', 'Wind capacity additions',
+    'Renewable share of generation', 'Grid Capacity', 'Cap on auction volumes', None
+) + ['not a metric']
+
+
+@pytest.mark.parametrize('keywords', [
+    ['capacity'],
+    ['cap'],
+    ['cap', 'capacity', 'capacity factor'],
+    ['Capacity Factor'],
+    ['share', 'grid'],
+    ['wind capacity', 'solar capacity'],
+    ['missing'],
+    [''],
+], ids=lambda keywords: '+'.join(keywords) or 'empty')
+def test_positions_match_substring_scan(keywords):
+    """Lookups, including prefix keywords, match a substring scan."""
+    assert MetricIndex(METRICS).positions(keywords) == _substring_scan(METRICS, keywords)
+
+
+def test_prefix_keywords_all_reported():
+    """Keywords that are prefixes of a longer match are found at the same position."""
+    matcher = KeywordMatcher(frozenset({'cap', 'capa', 'capacity', 'capacity factor'}))
+
+    assert sorted(matcher.find('capacity factor')) == ['cap', 'capa', 'capacity', 'capacity factor']
+    assert sorted(matcher.find('grid capacity')) == ['cap', 'capa', 'capacity']
+
+
+def test_vocabulary_grows_after_scan():
+    """Keywords first asked for after a scan are found by rescanning."""
+    index = MetricIndex(_metrics('Offshore wind tender rounds', 'Onshore wind auctions'))
+
+    assert index.positions(['onshore']) == [1]
+    assert index.positions(['tender rounds xyz']) == []
+    assert index.positions(['tender']) == [0]
+    assert index.positions(['wind', 'onshore']) == [0, 1]
+
+
+def test_random_lookups_match_substring_scan():
+    """Random names and keywords give the same positions as a substring scan."""
+    rng = random.Random(7)
+    alphabet = 'abc '
+    names = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))) for _ in range(60)]
+    metrics = _metrics(*names)
+    index = MetricIndex(metrics)
+
+    for _ in range(200):
+        keywords = [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        assert index.positions(keywords) == _substring_scan(metrics, keywords), keywords
+
+
+def test_in_place_edits_are_not_served_stale():
+    """Renaming, adding or removing metrics in place gives a fresh index."""
+    metrics = _metrics('Solar capacity', 'Wind capacity')
+    assert get_metric_index(metrics).positions(['wind']) == [1]
+
+    metrics[1] = {'metric': 'Hydro capacity'}
+    assert get_metric_index(metrics).positions(['wind']) == []
+    assert get_metric_index(metrics).positions(['hydro']) == [1]
+
+    metrics[0]['metric'] = 'Wind capacity'
+    assert get_metric_index(metrics).positions(['wind']) == [0]
+
+    metrics.insert(0, {'metric': 'Wind share'})
+    assert get_metric_index(metrics).positions(['wind']) == [0, 1]
+
+
+def test_equal_lists_share_an_index():
+    """Documents with the same metric names share one index."""
+    first = _metrics('Solar capacity', 'Wind capacity')
+    second = _metrics('Solar capacity', 'Wind capacity')
+
+    assert get_metric_index(first) is get_metric_index(second)
+    assert get_metric_index(first) is not get_metric_index(_metrics('Solar capacity'))
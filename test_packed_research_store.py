@@ -0,0 +1,94 @@
+"""Test concurrent saves into the packed research store.
+
+Several threads (and processes) saving into one pack must each record the
+offsets their own bytes landed at and get distinct version numbers, so
+every saved version reads back intact and the latest version is the last
+one saved.
+"""
+import multiprocessing
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src.storage.packed_store import PackedResearchStore
+from research_system.src.version_manager import ChangeType
+
+THREADS = 16
+
+SAVES_PER_WRITER = 10
+
+# Large documents widen the window between tell() and the index record
+FILLER = 'Feed-in tariffs and auctions for onshore wind. ' * 4000
+
+
+def _content(writer: int, save: int) -> dict:
+    """Roughly 200 KB research document identifying its writer and save."""
+    return {
+        'overview': f"writer {writer} save {save}. {FILLER}",
+        'key_metrics': [{'metric': 'Save', 'value': writer * SAVES_PER_WRITER + save}]
+    }
+
+
+def _save_all(store: PackedResearchStore, writer: int) -> None:
+    for save in range(SAVES_PER_WRITER):
+        store.save('Ambition', 'Germany', 'Q1 2024', _content(writer, save), ChangeType.MAJOR)
+
+
+def _save_in_process(base_path: str, writer: int) -> None:
+    _save_all(PackedResearchStore(base_path=base_path, document_cache_size=0), writer)
+
+
+def _assert_all_saved(base_path: str, writers: int) -> None:
+    """A fresh store reads back every save under its own version."""
+    store = PackedResearchStore(base_path=base_path, document_cache_size=0)
+    history = store.get_version_history('Ambition', 'Germany')
+
+    assert len(history) == writers * SAVES_PER_WRITER
+    overviews = set()
+    for metadata in history:
+        document = store.load('Ambition', 'Germany', metadata.version)
+        assert document is not None, f"version {metadata.version} unreadable"
+        overviews.add(document.content['overview'])
+    assert overviews == {
+        _content(writer, save)['overview']
+        for writer in range(writers) for save in range(SAVES_PER_WRITER)
+    }
+
+    assert store.get_latest_version('Ambition', 'Germany') == history[0].version
+    assert history[0].version == f"{writers * SAVES_PER_WRITER}.0.0"
+
+
+def test_concurrent_thread_saves(tmp_path):
+    """Threads saving into one store get distinct, readable versions."""
+    store = PackedResearchStore(base_path=str(tmp_path), document_cache_size=0)
+
+    threads = [threading.Thread(target=_save_all, args=(store, w)) for w in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    _assert_all_saved(str(tmp_path), THREADS)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs fcntl')
+def test_concurrent_process_saves(tmp_path):
+    """Processes with their own store instances do not overwrite each other."""
+    context = multiprocessing.get_context('fork')
+    workers = [
+        context.Process(target=_save_in_process, args=(str(tmp_path), w))
+        for w in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    _assert_all_saved(str(tmp_path), 4)
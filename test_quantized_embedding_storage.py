@@ -0,0 +1,112 @@
+"""Test ChromaDB store with quantized embedding storage.
+
+Covers the startup check that refuses to open a collection written with a
+different embedding_storage, and text queries, which are embedded and
+searched through the quantized index.
+
+The query encoder is replaced by a fixed stand-in so no model is loaded.
+"""
+import sys
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip('chromadb')
+
+import src  # noqa: F401  (registers memory stores)
+from memory_system.src.memory.base.memory_entry import SemanticMemoryEntry, MemoryQuery
+from memory_system.src.memory.stores.chromadb_store import ChromaDBMemoryStore
+
+
+class FixedEncoder:
+    """Stand-in sentence transformer mapping known texts to fixed vectors."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def encode(self, text: str) -> np.ndarray:
+        return np.asarray(self.vectors[text], dtype=np.float32)
+
+
+@pytest.fixture(scope='module')
+def persist_directory(tmp_path_factory):
+    """One directory for the module (ChromaDB keeps one client per process)."""
+    from chromadb.api.client import SharedSystemClient
+
+    # Drop clients other test modules opened with different settings
+    SharedSystemClient.clear_system_cache()
+    return str(tmp_path_factory.mktemp('quantized_storage'))
+
+
+def _store(persist_directory, tmp_path, collection_name, embedding_storage):
+    """Open a store on a named collection."""
+    store = ChromaDBMemoryStore({
+        'persist_directory': persist_directory,
+        'collection_name': collection_name,
+        'embedding_storage': embedding_storage,
+        'embedding_index_path': str(tmp_path / 'embedding_index')
+    })
+    store.initialize()
+    return store
+
+
+def _fact(subject: str, embedding) -> SemanticMemoryEntry:
+    """Semantic memory with an explicit embedding."""
+    entry = SemanticMemoryEntry(
+        subject=subject,
+        fact_type='policy',
+        fact_content={'summary': f"Facts about {subject}"},
+        source='test'
+    )
+    entry.embedding = list(embedding)
+    return entry
+
+
+@pytest.mark.parametrize('written_with,opened_with', [('chroma', 'int8'), ('int8', 'chroma')])
+def test_switching_embedding_storage_is_refused(persist_directory, tmp_path, written_with, opened_with):
+    """A collection cannot be reopened with a different embedding_storage."""
+    name = f"storage_{uuid.uuid4().hex}"
+    store = _store(persist_directory, tmp_path, name, written_with)
+    store.store(_fact('Germany', [1.0, 0.0, 0.0, 0.0]))
+
+    with pytest.raises(ValueError, match='embedding_storage'):
+        _store(persist_directory, tmp_path, name, opened_with)
+
+    # Reopening with the original storage still works
+    assert _store(persist_directory, tmp_path, name, written_with).count() == 1
+    store.clear_all()
+
+
+def test_text_query_ranks_through_quantized_index(persist_directory, tmp_path):
+    """query_text is embedded and ranked, not returned in filter order."""
+    store = _store(persist_directory, tmp_path, f"text_{uuid.uuid4().hex}", 'int8')
+    # Spain is older, so timestamp order alone would return Germany
+    spain = _fact('Spain', [0.0, 1.0, 0.0, 0.0])
+    germany = _fact('Germany', [1.0, 0.0, 0.0, 0.0])
+    store.store_batch([spain, germany])
+
+    store._embedding_model = FixedEncoder({'solar in spain': [0.0, 1.0, 0.0, 0.0]})
+    store._embedding_model_loaded = True
+
+    results = store.search(MemoryQuery(query_text='solar in spain', top_k=1))
+
+    assert [entry.id for entry in results] == [spain.id]
+    store.clear_all()
+
+
+def test_text_query_without_model_returns_nothing(persist_directory, tmp_path):
+    """Without an embedding model a quantized text query returns no results."""
+    store = _store(persist_directory, tmp_path, f"nomodel_{uuid.uuid4().hex}", 'int8')
+    store.store(_fact('Germany', [1.0, 0.0, 0.0, 0.0]))
+
+    store._embedding_model = None
+    store._embedding_model_loaded = True
+
+    assert store.search(MemoryQuery(query_text='anything')) == []
+    store.clear_all()
@@ -0,0 +1,118 @@
+"""Test the quantized embedding index under concurrent writers and vacuum.
+
+Several processes append to the same index files; rows must stay aligned
+across the ID, exact, quantized and row-stats files. vacuum() rewrites the
+files without dead rows, and other open instances reload the rewritten
+files on their next read.
+"""
+import multiprocessing
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import src  # noqa: F401  (registers memory stores)
+from memory_system.src.memory.stores.quantized_index import QuantizedEmbeddingIndex
+
+DIMENSION = 8
+
+WRITERS = 4
+
+ROWS_PER_WRITER = 150
+
+
+def _embedding(writer: int, row: int) -> list:
+    """Distinct vector per writer and row, so misaligned rows show up."""
+    rng = np.random.default_rng(writer * ROWS_PER_WRITER + row)
+    return rng.standard_normal(DIMENSION).astype(np.float32).tolist()
+
+
+def _write_rows(path: str, writer: int) -> None:
+    """Add this writer's rows one by one, interleaving with the others."""
+    index = QuantizedEmbeddingIndex(path)
+    for row in range(ROWS_PER_WRITER):
+        index.add(f"w{writer}_{row}", _embedding(writer, row))
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='needs fcntl')
+def test_concurrent_processes_keep_rows_aligned(tmp_path):
+    """Rows written by several processes at once stay aligned across files."""
+    path = str(tmp_path / 'index')
+    QuantizedEmbeddingIndex(path).add('seed', [0.0] * DIMENSION)
+
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=_write_rows, args=(path, w)) for w in range(WRITERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    index = QuantizedEmbeddingIndex(path)
+    assert len(index) == WRITERS * ROWS_PER_WRITER + 1
+    for writer in range(WRITERS):
+        for row in range(ROWS_PER_WRITER):
+            assert index.get(f"w{writer}_{row}") == pytest.approx(_embedding(writer, row))
+            hits = index.search(_embedding(writer, row), top_k=1)
+            assert hits[0][0] == f"w{writer}_{row}"
+
+
+def test_add_batch_matches_single_adds(tmp_path):
+    """A batch add stores the same rows as adding them one by one."""
+    single = QuantizedEmbeddingIndex(str(tmp_path / 'single'))
+    batch = QuantizedEmbeddingIndex(str(tmp_path / 'batch'))
+    items = [(f"m{row}", _embedding(row % WRITERS, row)) for row in range(50)]
+
+    for memory_id, embedding in items:
+        single.add(memory_id, embedding)
+    batch.add_batch(items)
+
+    query = _embedding(2, 17)
+    assert batch.search(query, top_k=5) == single.search(query, top_k=5)
+    assert batch.get_statistics() == single.get_statistics()
+
+
+def test_vacuum_drops_dead_rows(tmp_path):
+    """vacuum() rewrites the files without removed or superseded rows."""
+    path = str(tmp_path / 'index')
+    index = QuantizedEmbeddingIndex(path)
+    reader = QuantizedEmbeddingIndex(path)
+    index.add_batch([(f"m{row}", _embedding(0, row)) for row in range(100)])
+    index.remove([f"m{row}" for row in range(0, 100, 2)])
+    index.add('m1', _embedding(1, 1))  # Supersedes the first m1 row
+
+    assert reader.search(_embedding(0, 3), top_k=1)[0][0] == 'm3'
+    size_before = index.get_statistics()['exact_bytes']
+
+    assert index.vacuum() == 51
+
+    stats = index.get_statistics()
+    assert stats['rows'] == stats['live_rows'] == 50
+    assert stats['exact_bytes'] < size_before
+    assert index.get('m1') == pytest.approx(_embedding(1, 1))
+    assert index.get('m2') is None
+
+    # An instance opened before the vacuum reloads the rewritten files
+    assert reader.search(_embedding(0, 3), top_k=1)[0][0] == 'm3'
+    assert reader.get('m1') == pytest.approx(_embedding(1, 1))
+    assert len(reader) == 50
+
+    # Rows added after the vacuum land after the rewritten ones
+    reader.add('m100', _embedding(3, 100))
+    assert index.search(_embedding(3, 100), top_k=1)[0][0] == 'm100'
+
+
+def test_vacuum_skips_mostly_live_index(tmp_path):
+    """Below the dead-row threshold the files are left alone."""
+    index = QuantizedEmbeddingIndex(str(tmp_path / 'index'))
+    index.add_batch([(f"m{row}", _embedding(0, row)) for row in range(100)])
+    index.remove(['m0'])
+
+    assert index.vacuum() == 0
+    assert index.get_statistics()['rows'] == 100
+    assert index.vacuum(min_dead_ratio=0.0) == 1
@@ -0,0 +1,117 @@
+"""Test delta storage of research versions.
+
+PATCH and MINOR versions close to their parent are stored as deltas. A
+regeneration rewrites the raw LLM response wholesale, so the delta
+decision ignores it; long strings and lists are diffed line by line and
+element by element. Runs against both storage backends.
+"""
+import random
+import string
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src.storage.packed_store import PackedResearchStore
+from research_system.src.storage.research_store import (
+    DELTA_KEY, MAX_DELTA_CHAIN, ResearchStore, apply_delta, diff_content
+)
+from research_system.src.version_manager import ChangeType
+
+
+def _document(revision: int) -> dict:
+    """Regenerated research: one changed line, one changed metric, new raw response."""
+    overview = [f"Paragraph {i}: auctions, feed-in premiums and grid access rules." for i in range(40)]
+    overview[revision % 40] = f"Paragraph revised in regeneration {revision}."
+    metrics = [{'metric': f"Target {i}", 'value': i * 5, 'unit': '%'} for i in range(30)]
+    metrics[revision % 30] = {'metric': f"Target {revision % 30}", 'value': 100 + revision, 'unit': '%'}
+    return {
+        'overview': '\n'.join(overview),
+        'key_metrics': metrics,
+        'sources': [f"https://example.org/report-{i}" for i in range(10)],
+        '_metadata': {'generated_at': f"2024-01-{revision % 28 + 1:02d}T00:00:00"},
+        '_raw_response': ''.join(random.Random(revision).choices(string.ascii_letters + ' \n', k=6000))
+    }
+
+
+@pytest.fixture(params=[ResearchStore, PackedResearchStore], ids=['directory', 'packed'])
+def make_store(request, tmp_path):
+    """Open stores of one backend on a shared directory, without document caching."""
+    return lambda: request.param(base_path=str(tmp_path), document_cache_size=0)
+
+
+def _save(store, revision: int, change_type=ChangeType.MINOR) -> str:
+    return store.save('Ambition', 'Germany', 'Q1 2024', _document(revision), change_type)
+
+
+def _is_delta(store, version: str) -> bool:
+    return DELTA_KEY in store._read_content('Ambition', 'Germany', version)
+
+
+def test_diff_round_trip():
+    """Applying a diff's delta to the old content reproduces the new content."""
+    old, new = _document(1), _document(2)
+    new['added'] = {'nested': [1, 2]}
+    del new['sources']
+
+    assignments, patches, removals = diff_content(old, new)
+
+    assert {tuple(path) for path, _ in patches} == {('overview',), ('key_metrics',)}
+    assert apply_delta(old, {'set': assignments, 'patch': patches, 'remove': removals}) == new
+    assert old == _document(1)
+
+
+def test_regeneration_is_stored_as_delta(make_store):
+    """A regeneration with a new raw response still becomes a delta."""
+    store = make_store()
+    _save(store, 1, ChangeType.MAJOR)
+    version = _save(store, 2)
+
+    assert _is_delta(store, version)
+    assert make_store().load('Ambition', 'Germany', version).content == _document(2)
+
+
+def test_delta_chain_is_capped(make_store):
+    """After MAX_DELTA_CHAIN deltas the next version is stored in full."""
+    store = make_store()
+    _save(store, 0, ChangeType.MAJOR)
+    versions = [_save(store, revision) for revision in range(1, MAX_DELTA_CHAIN + 2)]
+
+    depths = [store._delta_depth('Ambition', 'Germany', v) for v in versions]
+    assert depths == list(range(1, MAX_DELTA_CHAIN + 1)) + [0]
+
+    reopened = make_store()
+    for revision, version in enumerate(versions, start=1):
+        assert reopened.load('Ambition', 'Germany', version).content == _document(revision)
+
+
+def test_cleanup_materializes_orphaned_deltas(make_store):
+    """Kept versions whose parent is removed are rewritten in full."""
+    store = make_store()
+    _save(store, 0, ChangeType.MAJOR)
+    versions = [_save(store, revision) for revision in range(1, 5)]
+
+    assert store.cleanup_old_versions('Ambition', 'Germany', keep_count=2) == 3
+
+    oldest_kept, newest = versions[-2], versions[-1]
+    assert not _is_delta(store, oldest_kept)
+    assert _is_delta(store, newest)
+    reopened = make_store()
+    assert reopened.load('Ambition', 'Germany', oldest_kept).content == _document(3)
+    assert reopened.load('Ambition', 'Germany', newest).content == _document(4)
+
+
+def test_unchanged_save_keeps_version(make_store):
+    """Saving content that only differs in _metadata creates no version."""
+    store = make_store()
+    version = _save(store, 1, ChangeType.MAJOR)
+
+    regenerated = _document(1)
+    regenerated['_metadata'] = {'generated_at': '2025-06-01T00:00:00'}
+
+    assert store.save('Ambition', 'Germany', 'Q1 2024', regenerated) == version
+    assert len(make_store().get_version_history('Ambition', 'Germany')) == 1
@@ -0,0 +1,109 @@
+"""Test exporting the research store to NDJSON and Parquet.
+
+Both formats must carry the same records, and since/until filters accept
+naive or timezone-aware dates (aware ones are compared in UTC).
+"""
+import json
+import sys
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src.storage.exporter import ResearchExporter
+from research_system.src.storage.research_store import ResearchStore
+from research_system.src.version_manager import ChangeType
+
+# Creation time of each combination's saved version
+CREATED = {
+    ('Ambition', 'Germany'): '2026-01-10T12:00:00',
+    ('Ambition', 'Spain'): '2026-02-10T12:00:00',
+    ('Contract Terms', 'Germany'): '2026-03-10T12:00:00',
+}
+
+
+def _content(parameter: str, country: str) -> dict:
+    return {
+        'overview': f"{parameter} in {country}",
+        'confidence': 0.8,
+        'key_metrics': [{'metric': 'Target', 'value': 65, 'unit': '%'}],
+        'sources': [{'name': 'Ministry', 'url': 'https://example.org'}],
+        '_validation': {'passed': True, 'scores': {'overall': 0.9}}
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store with one version per combination, created at the CREATED times."""
+    writer = ResearchStore(base_path=str(tmp_path))
+    for (parameter, country), created_at in CREATED.items():
+        version = writer.save(parameter, country, 'Q1 2026', _content(parameter, country), ChangeType.MAJOR)
+        metadata = writer.get_latest_metadata(parameter, country)
+        writer._write_metadata(parameter, country, version, replace(metadata, created_at=created_at))
+    return ResearchStore(base_path=str(tmp_path))
+
+
+def _exported(store, **filters) -> list:
+    return [
+        (record['parameter'], record['country'])
+        for record in ResearchExporter(store, **filters).iter_records()
+    ]
+
+
+def test_ndjson_and_parquet_match(store, tmp_path):
+    """Both formats hold the same records."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    exporter = ResearchExporter(store)
+
+    ndjson_stats = exporter.export(str(tmp_path / 'out' / 'research.ndjson'))
+    parquet_stats = exporter.export(str(tmp_path / 'out' / 'research.parquet'), row_group_size=2)
+
+    with open(ndjson_stats['path'], encoding='utf-8') as f:
+        ndjson_records = [json.loads(line) for line in f]
+    parquet_records = pq.read_table(parquet_stats['path']).to_pylist()
+
+    assert ndjson_stats['documents'] == parquet_stats['documents'] == len(CREATED)
+    assert parquet_records == ndjson_records
+    assert ndjson_records[0]['validation_score'] == 0.9
+    assert ndjson_records[0]['key_metrics'] == [
+        {'metric': 'Target', 'value': '65', 'unit': '%', 'source': None, 'date': None}
+    ]
+
+
+@pytest.mark.parametrize('since,until', [
+    ('2026-02-01', '2026-03-01'),
+    (date(2026, 2, 1), date(2026, 3, 1)),
+    (datetime(2026, 2, 1), datetime(2026, 3, 1)),
+    ('2026-02-01T00:00:00+00:00', '2026-03-01T00:00:00Z'),
+    (datetime(2026, 2, 1, tzinfo=timezone.utc), datetime(2026, 3, 1, tzinfo=timezone.utc)),
+])
+def test_since_until_accept_naive_and_aware_dates(store, since, until):
+    """since is inclusive, until exclusive, whatever the date type."""
+    assert _exported(store, since=since, until=until) == [('Ambition', 'Spain')]
+
+
+def test_aware_filters_compare_in_utc(store):
+    """An aware bound is converted to UTC before comparing."""
+    berlin = timezone(timedelta(hours=1))
+
+    # 13:30 in UTC+1 is 12:30 UTC, after the 12:00 creation time
+    assert _exported(store, since=datetime(2026, 2, 10, 13, 30, tzinfo=berlin)) == [
+        ('Contract Terms', 'Germany')
+    ]
+    # 12:30 in UTC+1 is 11:30 UTC, before it
+    assert _exported(store, since=datetime(2026, 2, 10, 12, 30, tzinfo=berlin)) == [
+        ('Ambition', 'Spain'), ('Contract Terms', 'Germany')
+    ]
+
+
+def test_parameter_and_country_filters(store):
+    """Parameter and country filters match display names."""
+    assert _exported(store, parameters=['Ambition']) == [('Ambition', 'Germany'), ('Ambition', 'Spain')]
+    assert _exported(store, countries=['Germany']) == [
+        ('Ambition', 'Germany'), ('Contract Terms', 'Germany')
+    ]
@@ -0,0 +1,120 @@
+"""Test latest-version resolution through the LATEST pointer.
+
+ResearchStore indexes each parameter-country combination from its LATEST
+pointer file, so building the index does not list version directories.
+A missing or stale pointer falls back to one listing and is rewritten.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src.storage.research_store import ResearchStore
+from research_system.src.version_manager import ChangeType, VersionManager, LATEST_POINTER_FILE
+
+
+def _content(target: int) -> dict:
+    """Research content that differs between versions."""
+    return {
+        'overview': f"Renewable target of {target}% by 2030",
+        'key_metrics': [{'metric': 'Renewable target', 'value': target, 'unit': '%'}]
+    }
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    """Store directory holding three versions of one combination."""
+    store = ResearchStore(base_path=str(tmp_path), document_cache_size=0)
+    for target in (30, 40, 50):
+        store.save('Ambition', 'Germany', 'Q1 2024', _content(target), ChangeType.MAJOR)
+    return tmp_path
+
+
+@pytest.fixture
+def listings(monkeypatch):
+    """Count version directory listings."""
+    calls = []
+    original = VersionManager.list_versions
+
+    def counting(self, parameter, country):
+        calls.append((parameter, country))
+        return original(self, parameter, country)
+
+    monkeypatch.setattr(VersionManager, 'list_versions', counting)
+    return calls
+
+
+def _pointer(store_path: Path) -> Path:
+    return store_path / 'ambition' / 'germany' / LATEST_POINTER_FILE
+
+
+def test_index_resolves_latest_from_pointer(store_path, listings):
+    """A fresh store finds the latest version without listing versions."""
+    store = ResearchStore(base_path=str(store_path))
+
+    assert store.get_latest_version('Ambition', 'Germany') == '3.0.0'
+    assert store.load('Ambition', 'Germany').content == _content(50)
+    assert listings == []
+
+
+def test_version_list_is_read_on_demand(store_path, listings):
+    """Version history still sees every version, listing once."""
+    store = ResearchStore(base_path=str(store_path))
+
+    assert store.exists('Ambition', 'Germany', '1.0.0')
+    assert [m.version for m in store.get_version_history('Ambition', 'Germany')] == ['3.0.0', '2.0.0', '1.0.0']
+    assert len(listings) == 1
+
+
+def test_missing_pointer_falls_back_to_listing(store_path, listings):
+    """Without a pointer the versions are listed and the pointer rewritten."""
+    _pointer(store_path).unlink()
+
+    store = ResearchStore(base_path=str(store_path))
+
+    assert store.get_latest_version('Ambition', 'Germany') == '3.0.0'
+    assert len(listings) == 1
+    assert _pointer(store_path).read_text() == '3.0.0'
+
+
+def test_stale_pointer_falls_back_to_listing(store_path, listings):
+    """A pointer naming a removed version is ignored and repaired."""
+    _pointer(store_path).write_text('9.0.0')
+
+    store = ResearchStore(base_path=str(store_path))
+
+    assert store.get_latest_version('Ambition', 'Germany') == '3.0.0'
+    assert len(listings) == 1
+    assert _pointer(store_path).read_text() == '3.0.0'
+
+
+def test_save_advances_pointer(store_path):
+    """Saving a new version moves the pointer and the index together."""
+    store = ResearchStore(base_path=str(store_path))
+
+    version = store.save('Ambition', 'Germany', 'Q1 2024', _content(60), ChangeType.MAJOR)
+
+    assert version == '4.0.0'
+    assert _pointer(store_path).read_text() == '4.0.0'
+    assert ResearchStore(base_path=str(store_path)).get_latest_version('Ambition', 'Germany') == '4.0.0'
+
+
+def test_rebuild_swaps_index_at_once(store_path, monkeypatch):
+    """Readers during a rebuild see the old index, not a partial one."""
+    store = ResearchStore(base_path=str(store_path))
+    store.save('Ambition', 'Spain', 'Q1 2024', _content(60), ChangeType.MAJOR)
+    seen = []
+    original = ResearchStore._latest_version
+
+    def reading(self, param_dir, country_dir):
+        seen.append(len(self.list_all_research()))
+        return original(self, param_dir, country_dir)
+
+    monkeypatch.setattr(ResearchStore, '_latest_version', reading)
+
+    assert store.rebuild_index() == 2
+    assert seen == [2, 2]
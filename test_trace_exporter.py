@@ -0,0 +1,186 @@
+"""Test the background batch exporter behind the Langfuse tracker.
+
+submit() never blocks: events beyond the bounded queue are dropped and
+counted. flush() waits until everything submitted so far reached the
+sinks, close() drains the queue and stops the worker, and FileSink appends
+events as NDJSON. Sinks here are in-process stubs, so no langfuse package
+or network is needed.
+"""
+import json
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_system.src.langfuse_integration import BatchExporter, FileSink, LangfuseTracker
+
+# Long enough that only batch size, flush() and close() trigger exports
+NEVER = 60.0
+
+
+class RecordingSink:
+    """Stub sink keeping each batch it was sent."""
+
+    def __init__(self):
+        self.batches = []
+
+    def send(self, events):
+        self.batches.append(list(events))
+
+    @property
+    def events(self):
+        return [event for batch in self.batches for event in batch]
+
+
+class BlockingSink(RecordingSink):
+    """Stub sink that holds the worker inside send() until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.sending = threading.Event()
+        self.release = threading.Event()
+
+    def send(self, events):
+        self.sending.set()
+        assert self.release.wait(5), 'sink never released'
+        super().send(events)
+
+
+class FailingSink:
+    def send(self, events):
+        raise ConnectionError('Langfuse unreachable')
+
+
+def _event(number: int) -> dict:
+    return {'type': 'score', 'score': {'name': 'quality', 'value': number}}
+
+
+@pytest.fixture
+def exporters():
+    """Close every exporter a test opened, even when it fails."""
+    opened = []
+
+    def make(sinks, **options) -> BatchExporter:
+        options.setdefault('flush_interval', NEVER)
+        exporter = BatchExporter(sinks, **options)
+        opened.append(exporter)
+        return exporter
+
+    yield make
+    for exporter in opened:
+        exporter.close(timeout=1)
+
+
+def test_full_queue_drops_and_counts(exporters):
+    """Events past a full queue are dropped and counted, not blocked on."""
+    sink = BlockingSink()
+    exporter = exporters([sink], queue_size=2, batch_size=1)
+
+    assert exporter.submit(_event(0))
+    assert sink.sending.wait(5)  # The worker holds event 0 inside send()
+
+    accepted = [exporter.submit(_event(n)) for n in range(1, 6)]
+
+    assert accepted == [True, True, False, False, False]
+    assert exporter.get_stats()['dropped'] == 3
+    assert exporter.get_stats()['pending'] == 2
+
+    sink.release.set()
+    assert exporter.flush(timeout=5)
+    assert [e['score']['value'] for e in sink.events] == [0, 1, 2]
+    assert exporter.get_stats() == {
+        'submitted': 3, 'processed': 3, 'dropped': 3, 'pending': 0, 'batches': 3, 'failures': 0
+    }
+
+
+def test_flush_drains_partial_batches(exporters):
+    """flush() exports everything submitted, in order and in bounded batches."""
+    sink = RecordingSink()
+    exporter = exporters([sink], batch_size=10)
+
+    for n in range(25):
+        exporter.submit(_event(n))
+
+    assert exporter.flush(timeout=5)
+    assert [e['score']['value'] for e in sink.events] == list(range(25))
+    assert all(len(batch) <= 10 for batch in sink.batches)
+    assert exporter.get_stats()['processed'] == 25
+
+
+def test_flush_without_events_returns_at_once(exporters):
+    """An exporter that never received an event has nothing to wait for."""
+    exporter = exporters([RecordingSink()])
+
+    assert exporter.flush(timeout=0)
+    assert exporter._thread is None
+
+
+def test_failing_sink_does_not_stop_export(exporters):
+    """A sink that raises is counted; other sinks still get every event."""
+    sink = RecordingSink()
+    exporter = exporters([FailingSink(), sink], batch_size=5)
+
+    for n in range(12):
+        exporter.submit(_event(n))
+
+    assert exporter.flush(timeout=5)
+    stats = exporter.get_stats()
+    assert len(sink.events) == stats['processed'] == 12
+    assert stats['failures'] == stats['batches'] == len(sink.batches)
+
+
+def test_close_exports_pending_and_stops(exporters):
+    """close() exports what is queued, stops the worker and refuses new events."""
+    sink = RecordingSink()
+    exporter = exporters([sink], batch_size=100)
+
+    for n in range(7):
+        exporter.submit(_event(n))
+    exporter.close(timeout=5)
+
+    assert len(sink.events) == 7
+    assert not exporter._thread.is_alive()
+    assert not exporter.submit(_event(7))
+    assert exporter.get_stats()['submitted'] == 7
+
+    exporter.close(timeout=5)  # Closing twice is harmless
+
+
+def test_file_sink_appends_ndjson(tmp_path):
+    """FileSink creates the file's directory and appends one JSON line per event."""
+    path = tmp_path / 'traces' / 'events.ndjson'
+    sink = FileSink(str(path))
+    when = datetime(2026, 3, 1, 12, 0)
+
+    sink.send([_event(1), {'type': 'trace', 'trace': {'id': 't1', 'timestamp': when}}])
+    sink.send([_event(2)])
+
+    lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert lines == [
+        _event(1),
+        {'type': 'trace', 'trace': {'id': 't1', 'timestamp': str(when)}},
+        _event(2)
+    ]
+
+
+def test_tracker_writes_file_sink_offline(tmp_path):
+    """With only a file sink configured, tracked events end up in the file."""
+    path = tmp_path / 'events.ndjson'
+    tracker = LangfuseTracker({'enabled': True, 'file_sink': str(path), 'flush_interval': NEVER})
+    try:
+        trace_id = tracker.track_research_generation(
+            'Ambition', 'Germany', 'Q1 2026', 'prompt', 'response', {'model': 'test-model'}
+        )
+        assert tracker.exporter.flush(timeout=5)
+    finally:
+        tracker.exporter.close(timeout=1)
+
+    event = json.loads(path.read_text(encoding='utf-8'))
+    assert event['trace']['id'] == trace_id
+    assert event['generation']['model'] == 'test-model'
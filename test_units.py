@@ -0,0 +1,102 @@
+"""Test numeric value and unit extraction for research metrics.
+
+parse_quantity() reads the number, scale word and unit of a metric value
+(or its separate unit field) and normalises it to a canonical unit;
+convert() expresses the result in a target unit of the same kind.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from research_integration.parsers.units import Quantity, convert, parse_quantity
+
+
+@pytest.mark.parametrize('value,expected', [
+    # Plain numbers and canonical units
+    ('33,000', Quantity(33000.0)),
+    ('1.2 TW', Quantity(1200.0, 'GW')),
+    ('800 MW', Quantity(0.8, 'GW')),
+    ('500 GWh', Quantity(0.5, 'TWh')),
+    ('35%', Quantity(35.0, '%')),
+    ('12 per cent', Quantity(12.0, '%')),
+    ('50 bps', Quantity(0.5, '%')),
+    ('-2.5%', Quantity(-2.5, '%')),
+    ('.5 GW', Quantity(0.5, 'GW')),
+    ('1e3 MW', Quantity(1.0, 'GW')),
+    # Scale words
+    ('USD 4.5bn', Quantity(4.5e9, 'USD')),
+    ('€2.1 billion', Quantity(2.1e9, 'EUR')),
+    ('3 million USD', Quantity(3e6, 'USD')),
+    ('INR 20 trillion', Quantity(2e13, 'INR')),
+    # One-letter scales only next to a currency
+    ('$4.5m', Quantity(4.5e6, 'USD')),
+    ('$2.5k', Quantity(2500.0, 'USD')),
+    ('£1.5b', Quantity(1.5e9, 'GBP')),
+    ('4.5m', Quantity(4.5)),
+    ('2.5k', Quantity(2.5)),
+    # Ranges take the first number with the unit after the range
+    ('10-12 GW', Quantity(10.0, 'GW')),
+    ('10–12 GW', Quantity(10.0, 'GW')),
+    ('10 to 12 GW', Quantity(10.0, 'GW')),
+    # Rates have no canonical unit
+    ('0.05 USD/kWh', Quantity(0.05)),
+    ('120 kWh per capita', Quantity(120.0)),
+], ids=lambda v: v if isinstance(v, str) else None)
+def test_parse_value(value, expected):
+    """The number, scale and unit in the value are read together."""
+    assert parse_quantity(value) == expected
+
+
+@pytest.mark.parametrize('value,unit,expected', [
+    (4.5, 'Billion USD', Quantity(4.5e9, 'USD')),
+    (4.5, 'USD Billion', Quantity(4.5e9, 'USD')),
+    ('30', '% of power mix', Quantity(30.0, '%')),
+    ('1,200', 'MW', Quantity(1.2, 'GW')),
+    (3, 'GW', Quantity(3.0, 'GW')),
+    (70, 'EUR/MWh', Quantity(70.0)),
+    # A unit in the value wins over the unit field
+    ('500 GWh', 'MW', Quantity(0.5, 'TWh')),
+    ('8 GW', 'MW', Quantity(8.0, 'GW')),
+], ids=['scale-before', 'scale-after', 'share', 'text-value', 'number-value', 'rate',
+        'value-unit-wins', 'value-unit-same-kind'])
+def test_parse_with_unit_field(value, unit, expected):
+    """The separate unit field applies when the value has no unit."""
+    assert parse_quantity(value, unit) == expected
+
+
+@pytest.mark.parametrize('value', ['no number', '', None, True])
+def test_no_number(value):
+    """Values without a number (and booleans) are not quantities."""
+    assert parse_quantity(value) is None
+
+
+@pytest.mark.parametrize('value,target,expected', [
+    ('1.2 TW', 'MW', 1200000.0),
+    ('800 MW', 'GW', 0.8),
+    ('500 GWh', 'TWh', 0.5),
+    ('USD 4.5bn', 'USD billion', 4.5),
+    ('$4.5m', 'USD', 4.5e6),
+    ('35%', '%', 35.0),
+    # Unknown units are returned as written
+    ('33,000', 'GW', 33000.0),
+    ('0.05 USD/kWh', 'USD', 0.05),
+    # Other kinds (or currencies) do not convert
+    ('35%', 'GW', None),
+    ('800 MW', 'TWh', None),
+    ('€2.1 billion', 'USD', None),
+], ids=['power-down', 'power-up', 'energy', 'money-scale', 'money', 'share',
+        'unknown-unit', 'rate', 'share-to-power', 'power-to-energy', 'other-currency'])
+def test_convert(value, target, expected):
+    """convert() scales within a kind and refuses other kinds."""
+    assert convert(parse_quantity(value), target) == expected
+
+
+def test_convert_rejects_unknown_target():
+    """A target unit that is not known is an error, not a silent None."""
+    with pytest.raises(ValueError, match='furlong'):
+        convert(parse_quantity('1 GW'), 'furlong')